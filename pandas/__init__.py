@@ -106,6 +106,7 @@ from pandas.core.api import (
     set_eng_float_format,
     Series,
     DataFrame,
+    DataFrameBuilder,
 )
 
 from pandas.core.dtypes.dtypes import SparseDtype
@@ -123,6 +124,7 @@ from pandas.core.reshape.api import (
     merge,
     merge_asof,
     merge_ordered,
+    merge_range,
     crosstab,
     pivot,
     pivot_table,
@@ -242,6 +244,7 @@ __all__ = [
     "CategoricalDtype",
     "CategoricalIndex",
     "DataFrame",
+    "DataFrameBuilder",
     "DateOffset",
     "DatetimeIndex",
     "DatetimeTZDtype",
@@ -304,6 +307,7 @@ __all__ = [
     "merge",
     "merge_asof",
     "merge_ordered",
+    "merge_range",
     "notna",
     "notnull",
     "offsets",
@@ -169,6 +169,7 @@ class HashTable:
         self,
         values: np.ndarray,  # np.ndarray[subclass-specific]
         mask: npt.NDArray[np.bool_] | None = ...,
+        offset: int = ...,
     ) -> None: ...
     def lookup(
         self,
@@ -272,3 +273,4 @@ def ismember(
 ) -> npt.NDArray[np.bool_]: ...
 def object_hash(obj) -> int: ...
 def objects_are_equal(a, b) -> bool: ...
+def estimate_unique(values: np.ndarray, precision: int = ...) -> float: ...
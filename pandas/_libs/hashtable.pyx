@@ -126,3 +126,103 @@ cdef class ObjectFactorizer(Factorizer):
                                        self.count, na_sentinel, na_value)
         self.count = len(self.uniques)
         return labels
+
+
+# ----------------------------------------------------------------------
+# Cardinality estimation
+
+cdef inline uint64_t _mix64(uint64_t x) noexcept nogil:
+    # finalizer of MurmurHash3, spreads the bits of hashes of small ints
+    x ^= x >> 33
+    x *= 0xff51afd7ed558ccdULL
+    x ^= x >> 33
+    x *= 0xc4ceb9fe1a85ec53ULL
+    x ^= x >> 33
+    return x
+
+
+cdef inline void _hll_add(uint8_t* registers, int precision, uint64_t h) noexcept nogil:
+    cdef:
+        uint64_t index = h >> (64 - precision)
+        uint64_t w = (h << precision) | (<uint64_t>1 << (precision - 1))
+        uint8_t rank = 1
+
+    while not (w & (<uint64_t>1 << 63)):
+        w <<= 1
+        rank += 1
+    if rank > registers[index]:
+        registers[index] = rank
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def estimate_unique(ndarray values, int precision=12) -> float:
+    """
+    Estimate the number of distinct values with a HyperLogLog sketch.
+
+    Every value is hashed once into ``2**precision`` registers, the standard
+    error of the estimate is about ``1.04 / sqrt(2**precision)``.
+
+    Parameters
+    ----------
+    values : ndarray
+        1-D object, numeric, boolean or datetimelike values. Missing values
+        count as one value.
+    precision : int, default 12
+        Between 4 and 18.
+
+    Returns
+    -------
+    float
+
+    Raises
+    ------
+    TypeError
+        If ``values`` contains unhashable objects.
+    """
+    cdef:
+        Py_ssize_t i, n = len(values), zeros = 0
+        int m
+        uint8_t[::1] registers
+        ndarray[object] objs
+        object val
+        const uint64_t[:] bits
+        double total = 0.0, estimate, alpha
+
+    if not 4 <= precision <= 18:
+        raise ValueError("precision must be between 4 and 18")
+    m = 1 << precision
+    registers = np.zeros(m, dtype=np.uint8)
+
+    if values.dtype == object:
+        objs = values
+        for i in range(n):
+            val = objs[i]
+            # kh_python_hash_func does not raise for unhashable values
+            hash(val)
+            _hll_add(&registers[0], precision, _mix64(kh_python_hash_func(val)))
+    else:
+        if values.dtype.kind == "f":
+            # -0.0 and 0.0 are equal, all NaNs are the same value
+            values = values.astype(np.float64) + 0.0
+            values[np.isnan(values)] = np.nan
+        elif values.dtype.kind in "mM":
+            values = values.view("i8")
+        elif values.dtype.kind in "iub":
+            values = values.astype(np.int64, copy=False)
+        else:
+            raise TypeError(f"Cannot estimate the unique values of {values.dtype}")
+        bits = values.view(np.uint64)
+        with nogil:
+            for i in range(n):
+                _hll_add(&registers[0], precision, _mix64(bits[i]))
+
+    for i in range(m):
+        total += 2.0 ** -registers[i]
+        zeros += registers[i] == 0
+    alpha = 0.7213 / (1 + 1.079 / m)
+    estimate = alpha * m * m / total
+    if estimate <= 2.5 * m and zeros:
+        # linear counting is more accurate for small cardinalities
+        estimate = m * np.log(m / zeros)
+    return estimate
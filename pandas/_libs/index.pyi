@@ -10,13 +10,17 @@ from pandas.core.arrays import ExtensionArray
 
 multiindex_nulls_shift: int
 
+def set_memory_budget(budget: int | None) -> None: ...
+
 class IndexEngine:
     over_size_threshold: bool
+    over_memory_budget: bool
     def __init__(self, values: np.ndarray) -> None: ...
     def __contains__(self, val: object) -> bool: ...
 
     # -> int | slice | np.ndarray[bool]
     def get_loc(self, val: object) -> int | slice | np.ndarray: ...
+    def get_loc_hashed(self, val: object) -> int: ...
     def sizeof(self, deep: bool = ...) -> int: ...
     def __sizeof__(self) -> int: ...
     @property
@@ -27,7 +31,9 @@ class IndexEngine:
     def is_monotonic_decreasing(self) -> bool: ...
     @property
     def is_mapping_populated(self) -> bool: ...
+    def populate_mapping(self) -> None: ...
     def clear_mapping(self): ...
+    def extend_from(self, base: IndexEngine) -> bool: ...
     def get_indexer(self, values: np.ndarray) -> npt.NDArray[np.intp]: ...
     def get_indexer_non_unique(
         self,
@@ -114,6 +114,29 @@ cdef _maybe_resize_array(ndarray values, Py_ssize_t loc, Py_ssize_t max_length):
 # Don't populate hash tables in monotonic indexes larger than this
 _SIZE_CUTOFF = 1_000_000
 
+# Largest hash table in bytes an engine builds, None for no limit. Set with
+#  the "compute.index_memory_budget" option
+_MEMORY_BUDGET = None
+
+
+def set_memory_budget(budget) -> None:
+    global _MEMORY_BUDGET
+    _MEMORY_BUDGET = budget
+
+
+cdef Py_ssize_t _hash_table_nbytes(ndarray values):
+    """
+    Estimate the size of a hash table mapping ``values`` to their locations.
+    """
+    cdef:
+        Py_ssize_t n = len(values), n_buckets = 4
+
+    # khash keeps a power of two buckets filled up to 77%, each holding a
+    #  key, a location and a flag bit
+    while n_buckets * 0.77 < n:
+        n_buckets <<= 1
+    return n_buckets * (values.itemsize + sizeof(Py_ssize_t)) + n_buckets // 8
+
 
 cdef _unpack_bool_indexer(ndarray[uint8_t, ndim=1, cast=True] indexer, object val):
     """
@@ -143,17 +166,27 @@ cdef class IndexEngine:
         ndarray mask
         HashTable mapping
         bint over_size_threshold
+        bint over_memory_budget
 
     cdef:
         bint unique, monotonic_inc, monotonic_dec
         bint need_monotonic_check, need_unique_check
         object _np_type
+        # argsort of values, replaces the mapping when over_memory_budget
+        ndarray _sorter
 
     def __init__(self, ndarray values):
         self.values = values
         self.mask = None
 
         self.over_size_threshold = len(values) >= _SIZE_CUTOFF
+        # numeric values whose hash table would exceed the memory budget are
+        #  looked up by binary search instead, see _get_loc_sorted
+        self.over_memory_budget = (
+            _MEMORY_BUDGET is not None
+            and values.dtype.kind in "iuf"
+            and _hash_table_nbytes(values) > _MEMORY_BUDGET
+        )
         self.clear_mapping()
         self._np_type = values.dtype.type
 
@@ -175,7 +208,9 @@ cdef class IndexEngine:
 
         val = self._check_type(val)
 
-        if self.over_size_threshold and self.is_monotonic_increasing:
+        if (
+            self.over_size_threshold or self.over_memory_budget
+        ) and self.is_monotonic_increasing:
             if not self.is_unique:
                 return self._get_loc_duplicates(val)
             values = self.values
@@ -187,19 +222,50 @@ cdef class IndexEngine:
                 raise KeyError(val)
             return loc
 
+        if self.over_memory_budget:
+            return self._get_loc_sorted(val)
+
         self._ensure_mapping_populated()
         if not self.unique:
             return self._get_loc_duplicates(val)
+        return self._get_loc_mapped(val)
+
+    cdef Py_ssize_t _get_loc_mapped(self, object val) except -1:
+        cdef:
+            Py_ssize_t loc
+
         if self.mask is not None and val is C_NA:
-            return self.mapping.get_na()
+            loc = self.mapping.get_na()
+        else:
+            try:
+                loc = self.mapping.get_item(val)
+            except OverflowError as err:
+                # GH#41775 OverflowError e.g. if we are uint64 and val is -1
+                #  or if we are int64 and value is np.iinfo(np.int64).max+1
+                #  (the uint64 with -1 case should actually be excluded by
+                #  _check_type)
+                raise KeyError(val) from err
+        if loc >= len(self.values):
+            # added by an engine that extended our mapping, see extend_from
+            raise KeyError(val)
+        return loc
 
-        try:
-            return self.mapping.get_item(val)
-        except OverflowError as err:
-            # GH#41775 OverflowError e.g. if we are uint64 and val is -1
-            #  or if we are int64 and value is np.iinfo(np.int64).max+1
-            #  (the uint64 with -1 case should actually be excluded by _check_type)
-            raise KeyError(val) from err
+    def get_loc_hashed(self, object val) -> Py_ssize_t:
+        """
+        get_loc for unique values that always goes through the hash table.
+
+        get_loc searches large monotonic values instead of building the
+        table, which is slower per lookup.
+        """
+        if is_definitely_invalid_key(val):
+            raise TypeError(f"'{val}' is an invalid key")
+
+        val = self._check_type(val)
+
+        self._ensure_mapping_populated()
+        if not self.unique:
+            raise ValueError("get_loc_hashed requires unique values")
+        return self._get_loc_mapped(val)
 
     cdef Py_ssize_t _searchsorted_left(self, val) except? -1:
         """
@@ -209,6 +275,70 @@ cdef class IndexEngine:
         loc = self.values.searchsorted(self._np_type(val), side="left")
         return loc
 
+    cdef ndarray _get_sorter(self):
+        if self._sorter is None:
+            self._sorter = np.argsort(self.values, kind="stable")
+        return self._sorter
+
+    cdef _get_loc_sorted(self, object val):
+        # -> Py_ssize_t | ndarray[bool]
+        # get_loc for over_memory_budget, with binary search in the values
+        #  ordered by _get_sorter instead of a hash table lookup
+        cdef:
+            Py_ssize_t left, right
+            ndarray sorter = self._get_sorter()
+            ndarray[uint8_t, ndim=1, cast=True] indexer
+
+        try:
+            key = self._np_type(val)
+            left = self.values.searchsorted(key, side="left", sorter=sorter)
+            right = self.values.searchsorted(key, side="right", sorter=sorter)
+        except (TypeError, ValueError, OverflowError) as err:
+            raise KeyError(val) from err
+
+        if left == right:
+            raise KeyError(val)
+        elif right - left == 1:
+            return sorter[left]
+        indexer = np.zeros(len(self.values), dtype=bool)
+        indexer[sorter[left:right]] = True
+        return indexer
+
+    cdef ndarray _get_indexer_sorted(self, ndarray target):
+        # get_indexer for over_memory_budget, see _get_loc_sorted
+        cdef:
+            ndarray values = self.values, sorter = None, loc, found, matched
+            Py_ssize_t n = len(values)
+
+        if n == 0:
+            return np.full(len(target), -1, dtype=np.intp)
+        if not self.is_monotonic_increasing:
+            sorter = self._get_sorter()
+
+        loc = values.searchsorted(target, side="left", sorter=sorter)
+        # targets after the last value
+        np.minimum(loc, n - 1, out=loc)
+        if sorter is not None:
+            loc = sorter.take(loc)
+        matched = values.take(loc)
+        found = matched == target
+        if values.dtype.kind == "f":
+            found |= np.isnan(matched) & np.isnan(target)
+        loc[~found] = -1
+        return loc
+
+    cdef bint _is_unique_sorted(self):
+        # is_unique for over_memory_budget, from equal neighbours in the
+        #  values ordered by _get_sorter
+        cdef:
+            ndarray values = self.values
+
+        if not (self.is_monotonic_increasing or self.is_monotonic_decreasing):
+            if values.dtype.kind == "f" and np.isnan(values).sum() > 1:
+                return False
+            values = values.take(self._get_sorter())
+        return not (values[1:] == values[:-1]).any()
+
     cdef _get_loc_duplicates(self, object val):
         # -> Py_ssize_t | slice | ndarray[bool]
         cdef:
@@ -244,6 +374,8 @@ cdef class IndexEngine:
 
     def sizeof(self, deep: bool = False) -> int:
         """ return the sizeof our mapping """
+        if self._sorter is not None:
+            return self._sorter.nbytes
         if not self.is_mapping_populated:
             return 0
         return self.mapping.sizeof(deep=deep)
@@ -283,7 +415,11 @@ cdef class IndexEngine:
         return self.unique == 1
 
     cdef _do_unique_check(self):
-        self._ensure_mapping_populated()
+        if self.over_memory_budget:
+            self.unique = self._is_unique_sorted()
+            self.need_unique_check = 0
+        else:
+            self._ensure_mapping_populated()
 
     @property
     def is_monotonic_increasing(self) -> bool:
@@ -352,8 +488,12 @@ cdef class IndexEngine:
 
         self.need_unique_check = 0
 
+    def populate_mapping(self) -> None:
+        self._ensure_mapping_populated()
+
     def clear_mapping(self):
         self.mapping = None
+        self._sorter = None
         self.need_monotonic_check = 1
         self.need_unique_check = 1
 
@@ -362,8 +502,98 @@ cdef class IndexEngine:
         self.monotonic_dec = 0
 
     def get_indexer(self, ndarray values) -> np.ndarray:
+        if self.over_memory_budget and values.dtype == self.values.dtype:
+            return self._get_indexer_sorted(values)
         self._ensure_mapping_populated()
-        return self.mapping.lookup(values)
+        return self._mask_extended(self.mapping.lookup(values))
+
+    cdef ndarray _mask_extended(self, ndarray indexer):
+        # a mapping extended by another engine (see extend_from) also holds
+        #  locations beyond our values
+        cdef:
+            Py_ssize_t n = len(self.values)
+
+        if len(self.mapping) > n:
+            indexer[indexer >= n] = -1
+        return indexer
+
+    def extend_from(self, IndexEngine base) -> bool:
+        """
+        Set up this engine from ``base``, whose values are our first values.
+
+        Our remaining values are added to the hash table of ``base``, which
+        is then shared, instead of building a table of all values. Entries
+        added this way lie beyond the values of ``base``, which ignores them.
+        This is only done for non-object values, when ``base`` is unique, its
+        table has not been extended before and our remaining values are new
+        and distinct.
+
+        Known monotonic flags of ``base`` are carried over.
+
+        Returns whether the hash table is shared.
+        """
+        cdef:
+            Py_ssize_t n_base = len(base.values), n = len(self.values)
+            ndarray tail, tail_mask = None
+            bint inc, dec, strict
+
+        if type(self) is not type(base) or n_base == 0 or n < n_base:
+            return False
+
+        if self.need_monotonic_check and not base.need_monotonic_check:
+            if base.mask is not None or self.mask is not None:
+                # _do_monotonic_check gives up on any missing values, leave
+                #  the check to it
+                pass
+            else:
+                try:
+                    inc, dec, strict = self._call_monotonic(self.values[n_base - 1:])
+                except (TypeError, InvalidOperation, ValueError):
+                    pass
+                else:
+                    self.monotonic_inc = base.monotonic_inc and inc
+                    self.monotonic_dec = base.monotonic_dec and dec
+                    self.need_monotonic_check = 0
+                    if (
+                        strict
+                        and (self.monotonic_inc or self.monotonic_dec)
+                        and base.unique
+                        and not base.need_unique_check
+                    ):
+                        # strictly monotonic as a whole
+                        self.unique = 1
+                        self.need_unique_check = 0
+
+        if (
+            # the hash tables of objects and strings keep borrowed pointers to
+            #  the values they hold, which would outlive us in a table owned
+            #  by base
+            self.values.dtype == object
+            or self.mapping is not None
+            or self.over_memory_budget
+            or base.mapping is None
+            or not base.unique
+            or len(base.mapping) != n_base
+        ):
+            return False
+
+        tail = self.values[n_base:]
+        if self.mask is not None:
+            tail_mask = self.mask[n_base:]
+        if (base.mapping.lookup(tail, tail_mask) != -1).any():
+            # adding these would move existing keys to our locations
+            return False
+
+        base.mapping.map_locations(tail, tail_mask, n_base)
+        if len(base.mapping) != n:
+            # duplicated values, base ignores what was added and we build
+            #  our own table when needed
+            return False
+
+        self.mapping = base.mapping
+        self.unique = 1
+        self.need_unique_check = 0
+        return True
 
     def get_indexer_non_unique(self, ndarray targets):
         """
@@ -633,7 +863,9 @@ cdef class DatetimeEngine(Int64Engine):
             raise KeyError(val) from err
 
         # Welcome to the spaghetti factory
-        if self.over_size_threshold and self.is_monotonic_increasing:
+        if (
+            self.over_size_threshold or self.over_memory_budget
+        ) and self.is_monotonic_increasing:
             if not self.is_unique:
                 return self._get_loc_duplicates(conv)
             values = self.values
@@ -644,12 +876,37 @@ cdef class DatetimeEngine(Int64Engine):
                 raise KeyError(val)
             return loc
 
+        if self.over_memory_budget:
+            try:
+                return self._get_loc_sorted(conv)
+            except KeyError:
+                raise KeyError(val)
+
         self._ensure_mapping_populated()
         if not self.unique:
             return self._get_loc_duplicates(conv)
 
         try:
-            return self.mapping.get_item(conv)
+            return self._get_loc_mapped(conv)
+        except KeyError:
+            raise KeyError(val)
+
+    def get_loc_hashed(self, object val) -> Py_ssize_t:
+        # NB: the caller is responsible for ensuring tzawareness compat
+        if is_definitely_invalid_key(val):
+            raise TypeError(f"'{val}' is an invalid key")
+
+        try:
+            conv = self._unbox_scalar(val)
+        except (TypeError, ValueError) as err:
+            raise KeyError(val) from err
+
+        self._ensure_mapping_populated()
+        if not self.unique:
+            raise ValueError("get_loc_hashed requires unique values")
+
+        try:
+            return self._get_loc_mapped(conv)
         except KeyError:
             raise KeyError(val)
 
@@ -1183,6 +1440,8 @@ cdef class MaskedIndexEngine(IndexEngine):
     def __init__(self, object values):
         super().__init__(self._get_data(values))
         self.mask = self._get_mask(values)
+        # binary search does not handle the mask
+        self.over_memory_budget = False
 
     def _get_data(self, object values) -> np.ndarray:
         if hasattr(values, "_mask"):
@@ -1200,7 +1459,9 @@ cdef class MaskedIndexEngine(IndexEngine):
 
     def get_indexer(self, object values) -> np.ndarray:
         self._ensure_mapping_populated()
-        return self.mapping.lookup(self._get_data(values), self._get_mask(values))
+        return self._mask_extended(
+            self.mapping.lookup(self._get_data(values), self._get_mask(values))
+        )
 
     def get_indexer_non_unique(self, object targets):
         """
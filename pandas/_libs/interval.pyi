@@ -166,6 +166,9 @@ class IntervalTree(IntervalMixin):
     def get_indexer_non_unique(
         self, target
     ) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]: ...
+    def get_indexer_pairs(
+        self, target
+    ) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]: ...
     _na_count: int
     @property
     def is_overlapping(self) -> bool: ...
@@ -156,6 +156,7 @@ def tuples_to_object_array(
 # TODO: can we be more specific about rows?
 def to_object_array(rows: object, min_width: int = ...) -> ndarray_obj_2d: ...
 def dicts_to_array(dicts: list, columns: list) -> ndarray_obj_2d: ...
+def columns_to_dicts(columns: list[list], keys: list, n: int) -> list[dict]: ...
 def maybe_booleans_to_slice(
     mask: npt.NDArray[np.uint8],
 ) -> slice | npt.NDArray[np.uint8]: ...
@@ -389,6 +389,46 @@ def dicts_to_array(dicts: list, columns: list):
     return result
 
 
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def columns_to_dicts(list columns, list keys, Py_ssize_t n) -> list:
+    """
+    Build one dict per row from lists holding the values of each column.
+
+    Parameters
+    ----------
+    columns : list of list
+        The values of each column, each with length n.
+    keys : list
+        The key of each column. Later keys overwrite equal earlier ones.
+    n : int
+        The number of rows.
+
+    Returns
+    -------
+    list of dict
+    """
+    cdef:
+        Py_ssize_t i, j, k = len(columns)
+        list result = [None] * n
+        list col
+        dict row
+
+    if len(keys) != k:
+        raise ValueError("columns and keys must have the same length")
+    for j in range(k):
+        if len(<list>columns[j]) != n:
+            raise ValueError("all columns must have length n")
+
+    for i in range(n):
+        row = {}
+        for j in range(k):
+            col = columns[j]
+            row[keys[j]] = col[i]
+        result[i] = row
+    return result
+
+
 def fast_zip(list ndarrays) -> ndarray[object]:
     """
     For zipping multiple ndarrays into an ndarray of tuples.
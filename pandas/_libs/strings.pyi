@@ -0,0 +1,31 @@
+import re
+
+import numpy as np
+
+from pandas._typing import npt
+
+def str_len(
+    values: npt.NDArray[np.object_],
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.bool_]]: ...
+def str_startswith(
+    values: npt.NDArray[np.object_], pat: str | tuple[str, ...]
+) -> tuple[npt.NDArray[np.bool_], npt.NDArray[np.bool_]]: ...
+def str_endswith(
+    values: npt.NDArray[np.object_], pat: str | tuple[str, ...]
+) -> tuple[npt.NDArray[np.bool_], npt.NDArray[np.bool_]]: ...
+def str_contains(
+    values: npt.NDArray[np.object_], pat: str, case: bool = ...
+) -> tuple[npt.NDArray[np.bool_], npt.NDArray[np.bool_]]: ...
+def str_lower(values: npt.NDArray[np.object_]) -> npt.NDArray[np.object_]: ...
+def str_upper(values: npt.NDArray[np.object_]) -> npt.NDArray[np.object_]: ...
+def str_strip(
+    values: npt.NDArray[np.object_],
+    to_strip: str | None = ...,
+    side: str = ...,
+) -> npt.NDArray[np.object_]: ...
+def str_replace(
+    values: npt.NDArray[np.object_], pat: str, repl: str, n: int = ...
+) -> npt.NDArray[np.object_]: ...
+def str_extract(
+    values: np.ndarray, regex: re.Pattern, na_value: object
+) -> npt.NDArray[np.object_]: ...
@@ -0,0 +1,264 @@
+"""
+Kernels for the string methods of the python-backed StringArray.
+
+The values are an object ndarray holding ``str`` and a missing value
+sentinel. Missing values are detected inline, so the kernels do not need a
+separately computed mask, and the string operations are called through the
+C-API instead of a Python callable per element.
+"""
+cimport cython
+from cython cimport Py_ssize_t
+
+import numpy as np
+
+cimport numpy as cnp
+from numpy cimport (
+    int64_t,
+    ndarray,
+    uint8_t,
+)
+
+cnp.import_array()
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def str_len(ndarray[object] values) -> tuple[ndarray, ndarray]:
+    """
+    Length of each string.
+
+    Returns
+    -------
+    result : ndarray[int64]
+        0 for missing values.
+    mask : ndarray[bool]
+        True for missing values.
+    """
+    cdef:
+        Py_ssize_t i, n = len(values)
+        object val
+        ndarray[int64_t] result = np.zeros(n, dtype=np.int64)
+        ndarray[uint8_t, cast=True] mask = np.zeros(n, dtype=bool)
+
+    for i in range(n):
+        val = values[i]
+        if isinstance(val, str):
+            result[i] = len(<str>val)
+        else:
+            mask[i] = True
+    return result, mask
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def str_startswith(ndarray[object] values, object pat) -> tuple[ndarray, ndarray]:
+    """
+    Whether each string starts with ``pat`` (a str or tuple of str).
+
+    Returns
+    -------
+    result : ndarray[bool]
+        False for missing values.
+    mask : ndarray[bool]
+        True for missing values.
+    """
+    cdef:
+        Py_ssize_t i, n = len(values)
+        object val
+        ndarray[uint8_t, cast=True] result = np.zeros(n, dtype=bool)
+        ndarray[uint8_t, cast=True] mask = np.zeros(n, dtype=bool)
+
+    for i in range(n):
+        val = values[i]
+        if isinstance(val, str):
+            result[i] = (<str>val).startswith(pat)
+        else:
+            mask[i] = True
+    return result, mask
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def str_endswith(ndarray[object] values, object pat) -> tuple[ndarray, ndarray]:
+    """
+    Whether each string ends with ``pat`` (a str or tuple of str).
+
+    Returns
+    -------
+    result : ndarray[bool]
+        False for missing values.
+    mask : ndarray[bool]
+        True for missing values.
+    """
+    cdef:
+        Py_ssize_t i, n = len(values)
+        object val
+        ndarray[uint8_t, cast=True] result = np.zeros(n, dtype=bool)
+        ndarray[uint8_t, cast=True] mask = np.zeros(n, dtype=bool)
+
+    for i in range(n):
+        val = values[i]
+        if isinstance(val, str):
+            result[i] = (<str>val).endswith(pat)
+        else:
+            mask[i] = True
+    return result, mask
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def str_contains(
+    ndarray[object] values, str pat, bint case=True
+) -> tuple[ndarray, ndarray]:
+    """
+    Whether each string contains the literal ``pat``.
+
+    Returns
+    -------
+    result : ndarray[bool]
+        False for missing values.
+    mask : ndarray[bool]
+        True for missing values.
+    """
+    cdef:
+        Py_ssize_t i, n = len(values)
+        object val
+        ndarray[uint8_t, cast=True] result = np.zeros(n, dtype=bool)
+        ndarray[uint8_t, cast=True] mask = np.zeros(n, dtype=bool)
+
+    if not case:
+        pat = pat.upper()
+    for i in range(n):
+        val = values[i]
+        if isinstance(val, str):
+            if case:
+                result[i] = pat in <str>val
+            else:
+                result[i] = pat in (<str>val).upper()
+        else:
+            mask[i] = True
+    return result, mask
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def str_lower(ndarray[object] values) -> ndarray:
+    """
+    Lowercase each string, missing values are kept.
+    """
+    cdef:
+        Py_ssize_t i, n = len(values)
+        object val
+        ndarray[object] result = np.empty(n, dtype=object)
+
+    for i in range(n):
+        val = values[i]
+        if isinstance(val, str):
+            val = (<str>val).lower()
+        result[i] = val
+    return result
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def str_upper(ndarray[object] values) -> ndarray:
+    """
+    Uppercase each string, missing values are kept.
+    """
+    cdef:
+        Py_ssize_t i, n = len(values)
+        object val
+        ndarray[object] result = np.empty(n, dtype=object)
+
+    for i in range(n):
+        val = values[i]
+        if isinstance(val, str):
+            val = (<str>val).upper()
+        result[i] = val
+    return result
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def str_strip(
+    ndarray[object] values, object to_strip=None, str side="both"
+) -> ndarray:
+    """
+    Strip ``to_strip`` from the given side of each string, missing values are
+    kept.
+    """
+    cdef:
+        Py_ssize_t i, n = len(values)
+        object val
+        ndarray[object] result = np.empty(n, dtype=object)
+
+    if side not in ("both", "left", "right"):
+        raise ValueError(f"invalid side: {side}")
+    for i in range(n):
+        val = values[i]
+        if isinstance(val, str):
+            if side == "both":
+                val = (<str>val).strip(to_strip)
+            elif side == "left":
+                val = (<str>val).lstrip(to_strip)
+            else:
+                val = (<str>val).rstrip(to_strip)
+        result[i] = val
+    return result
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def str_replace(
+    ndarray[object] values, str pat, str repl, Py_ssize_t n=-1
+) -> ndarray:
+    """
+    Replace the literal ``pat`` with ``repl`` in each string, missing values
+    are kept.
+    """
+    cdef:
+        Py_ssize_t i, length = len(values)
+        object val
+        ndarray[object] result = np.empty(length, dtype=object)
+
+    for i in range(length):
+        val = values[i]
+        if isinstance(val, str):
+            val = (<str>val).replace(pat, repl, n)
+        result[i] = val
+    return result
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def str_extract(ndarray values, object regex, object na_value) -> ndarray:
+    """
+    Capture groups of the first match of ``regex`` in each string.
+
+    Returns
+    -------
+    ndarray[object, ndim=2]
+        One row per group and one column per value. Values that are not
+        strings or do not match, and groups that do not participate in the
+        match, are ``na_value``.
+    """
+    cdef:
+        Py_ssize_t i, j, n = len(values), ngroups = regex.groups
+        object val, match, group
+        tuple groups
+        ndarray[object, ndim=2] result = np.full((ngroups, n), na_value, dtype=object)
+
+    search = regex.search
+    for i in range(n):
+        val = values[i]
+        if not isinstance(val, str):
+            continue
+        match = search(val)
+        if match is None:
+            continue
+        groups = match.groups()
+        for j in range(ngroups):
+            group = groups[j]
+            if group is not None:
+                result[j, i] = group
+    return result
@@ -10,6 +10,7 @@ from cpython.datetime cimport (
     tzinfo,
 )
 from cpython.object cimport PyObject
+from cpython.unicode cimport PyUnicode_DecodeASCII
 
 # import datetime C API
 import_datetime()
@@ -17,6 +18,7 @@ import_datetime()
 
 cimport numpy as cnp
 from numpy cimport (
+    int32_t,
     int64_t,
     ndarray,
 )
@@ -28,6 +30,7 @@ cnp.import_array()
 from pandas._libs.tslibs.dtypes cimport (
     get_supported_reso,
     npy_unit_to_abbrev,
+    periods_per_day,
 )
 from pandas._libs.tslibs.np_datetime cimport (
     NPY_DATETIMEUNIT,
@@ -82,7 +85,10 @@ from pandas._libs.tslibs.timestamps import Timestamp
 # Note: this is the only non-tslibs intra-pandas dependency here
 
 from pandas._libs.missing cimport checknull_with_nat_and_na
-from pandas._libs.tslibs.tzconversion cimport tz_localize_to_utc_single
+from pandas._libs.tslibs.tzconversion cimport (
+    Localizer,
+    tz_localize_to_utc_single,
+)
 
 
 def _test_parse_iso8601(ts: str):
@@ -110,6 +116,124 @@ def _test_parse_iso8601(ts: str):
         return Timestamp(obj.value)
 
 
+# ----------------------------------------------------------------------
+# Compiled strftime
+
+# Codes written by _format_dts; non-negative codes are literal ASCII characters
+cdef enum:
+    FMT_YEAR = -1
+    FMT_MONTH = -2
+    FMT_DAY = -3
+    FMT_HOUR = -4
+    FMT_MINUTE = -5
+    FMT_SECOND = -6
+    FMT_MILLI = -7
+    FMT_MICRO = -8
+    FMT_NANO = -9
+
+cdef dict _strftime_codes = {
+    "Y": FMT_YEAR,
+    "m": FMT_MONTH,
+    "d": FMT_DAY,
+    "H": FMT_HOUR,
+    "M": FMT_MINUTE,
+    "S": FMT_SECOND,
+    "f": FMT_MICRO,
+}
+
+# Every code writes at most 9 characters
+cdef enum:
+    MAX_FORMAT_CODES = 64
+
+# Formatted strings are shared between equal values, unless fewer than one in
+#  eight of the first MEMO_CHECK values are repeats
+cdef Py_ssize_t MEMO_CHECK = 4096
+cdef Py_ssize_t MEMO_MAX_SIZE = 1 << 20
+
+
+cdef ndarray _compile_strftime(str format):
+    """
+    Translate a strftime format into the codes written by _format_dts.
+
+    Returns None if the format uses a directive other than %Y, %m, %d, %H, %M,
+    %S, %f and %% or a non-ASCII character.
+    """
+    cdef:
+        list codes = []
+        Py_ssize_t i = 0, n = len(format)
+        str c
+
+    while i < n:
+        c = format[i]
+        if c == "%":
+            if i + 1 == n:
+                return None
+            c = format[i + 1]
+            if c == "%":
+                codes.append(ord("%"))
+            elif c in _strftime_codes:
+                codes.append(_strftime_codes[c])
+            else:
+                return None
+            i += 2
+        elif 0 < ord(c) < 128:
+            codes.append(ord(c))
+            i += 1
+        else:
+            return None
+
+    if len(codes) > MAX_FORMAT_CODES:
+        return None
+    return np.array(codes, dtype=np.int32)
+
+
+@cython.cdivision(True)
+cdef inline Py_ssize_t _write_digits(
+    char* buf, Py_ssize_t pos, int64_t value, int width
+) noexcept nogil:
+    # value is non-negative and has at most width digits
+    cdef Py_ssize_t j
+    for j in range(width - 1, -1, -1):
+        buf[pos + j] = <char>(48 + value % 10)
+        value = value // 10
+    return pos + width
+
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+cdef str _format_dts(const int32_t[::1] codes, npy_datetimestruct* dts):
+    # dts.year must be within [1000, 9999] so %Y is 4 digits as in strftime
+    cdef:
+        char buf[MAX_FORMAT_CODES * 9]
+        Py_ssize_t i, pos = 0
+        int32_t code
+
+    for i in range(codes.shape[0]):
+        code = codes[i]
+        if code >= 0:
+            buf[pos] = <char>code
+            pos += 1
+        elif code == FMT_YEAR:
+            pos = _write_digits(buf, pos, dts.year, 4)
+        elif code == FMT_MONTH:
+            pos = _write_digits(buf, pos, dts.month, 2)
+        elif code == FMT_DAY:
+            pos = _write_digits(buf, pos, dts.day, 2)
+        elif code == FMT_HOUR:
+            pos = _write_digits(buf, pos, dts.hour, 2)
+        elif code == FMT_MINUTE:
+            pos = _write_digits(buf, pos, dts.min, 2)
+        elif code == FMT_SECOND:
+            pos = _write_digits(buf, pos, dts.sec, 2)
+        elif code == FMT_MILLI:
+            pos = _write_digits(buf, pos, dts.us // 1000, 3)
+        elif code == FMT_MICRO:
+            pos = _write_digits(buf, pos, dts.us, 6)
+        else:
+            pos = _write_digits(buf, pos, dts.us * 1000 + dts.ps // 1000, 9)
+    return PyUnicode_DecodeASCII(buf, pos, NULL)
+
+
 @cython.wraparound(False)
 @cython.boundscheck(False)
 def format_array_from_datetime(
@@ -118,6 +242,7 @@ def format_array_from_datetime(
     str format=None,
     na_rep: str | float = "NaT",
     NPY_DATETIMEUNIT reso=NPY_FR_ns,
+    bint memoize=True,
 ) -> np.ndarray:
     """
     return a np object array of the string formatted values
@@ -131,18 +256,29 @@ def format_array_from_datetime(
     na_rep : optional, default is None
           a nat format
     reso : NPY_DATETIMEUNIT, default NPY_FR_ns
+    memoize : bool, default True
+          format each distinct value (each distinct date for formats without
+          a time) once and reuse the string for repeated values
 
     Returns
     -------
     np.ndarray[object]
     """
     cdef:
-        int64_t val, ns, N = values.size
+        int64_t val, local_val = 0, key, ns, N = values.size
+        int64_t day_nanos = periods_per_day(reso)
+        Py_ssize_t i, n_seen = 0
+        Py_ssize_t pos = -1  # unused, avoid not-initialized warning
         bint show_ms = False, show_us = False, show_ns = False
         bint basic_format = False, basic_format_day = False
+        bint dates_only = False
         _Timestamp ts
         object res
         npy_datetimestruct dts
+        Localizer info
+        ndarray codes = None
+        const int32_t[::1] codes_view
+        dict memo = {} if memoize else None
 
         # Note that `result` (and thus `result_flat`) is C-order and
         #  `it` iterates C-order as well, so the iteration matches
@@ -178,47 +314,96 @@ def format_array_from_datetime(
 
     assert not (basic_format_day and basic_format)
 
+    if basic_format_day:
+        codes = _compile_strftime("%Y-%m-%d")
+    elif basic_format:
+        codes = _compile_strftime("%Y-%m-%d %H:%M:%S")
+        if show_ns:
+            codes = np.append(codes, [ord("."), FMT_NANO]).astype(np.int32)
+        elif show_us:
+            codes = np.append(codes, [ord("."), FMT_MICRO]).astype(np.int32)
+        elif show_ms:
+            codes = np.append(codes, [ord("."), FMT_MILLI]).astype(np.int32)
+    elif format is not None:
+        codes = _compile_strftime(format)
+
+    if codes is not None:
+        codes_view = codes
+        dates_only = not (codes < FMT_DAY).any()
+        info = Localizer(tz, creso=reso, stamps=values)
+
     for i in range(N):
         # Analogous to: utc_val = values[i]
         val = (<int64_t*>cnp.PyArray_ITER_DATA(it))[0]
 
         if val == NPY_NAT:
             res = na_rep
-        elif basic_format_day:
+        else:
+            res = None
+            if codes is not None:
+                # the compiled formatter works on wall times
+                local_val = info.utc_val_to_local_val(val, &pos)
+                key = local_val // day_nanos if dates_only else local_val
+            else:
+                key = val
+
+            if memo is not None:
+                res = memo.get(key)
+                n_seen += 1
+                if n_seen == MEMO_CHECK and 8 * len(memo) > 7 * MEMO_CHECK:
+                    # almost all values are distinct, stop looking them up
+                    memo = None
+
+            if res is not None:
+                # reuse the string of an equal value
+                res_flat[i] = res
+                cnp.PyArray_ITER_NEXT(it)
+                continue
 
-            pandas_datetime_to_datetimestruct(val, reso, &dts)
-            res = f"{dts.year}-{dts.month:02d}-{dts.day:02d}"
+            if codes is not None:
+                pandas_datetime_to_datetimestruct(local_val, reso, &dts)
+                if 1000 <= dts.year <= 9999:
+                    res = _format_dts(codes_view, &dts)
 
-        elif basic_format:
+            if res is not None:
+                pass
 
-            pandas_datetime_to_datetimestruct(val, reso, &dts)
-            res = (f"{dts.year}-{dts.month:02d}-{dts.day:02d} "
-                   f"{dts.hour:02d}:{dts.min:02d}:{dts.sec:02d}")
+            elif basic_format_day:
 
-            if show_ns:
-                ns = dts.ps // 1000
-                res += f".{ns + dts.us * 1000:09d}"
-            elif show_us:
-                res += f".{dts.us:06d}"
-            elif show_ms:
-                res += f".{dts.us // 1000:03d}"
+                res = f"{dts.year}-{dts.month:02d}-{dts.day:02d}"
 
-        else:
+            elif basic_format:
+
+                res = (f"{dts.year}-{dts.month:02d}-{dts.day:02d} "
+                       f"{dts.hour:02d}:{dts.min:02d}:{dts.sec:02d}")
+
+                if show_ns:
+                    ns = dts.ps // 1000
+                    res += f".{ns + dts.us * 1000:09d}"
+                elif show_us:
+                    res += f".{dts.us:06d}"
+                elif show_ms:
+                    res += f".{dts.us // 1000:03d}"
 
-            ts = Timestamp._from_value_and_reso(val, reso=reso, tz=tz)
-            if format is None:
-                # Use datetime.str, that returns ts.isoformat(sep=' ')
-                res = str(ts)
             else:
 
-                # invalid format string
-                # requires dates > 1900
-                try:
-                    # Note: dispatches to pydatetime
-                    res = ts.strftime(format)
-                except ValueError:
+                ts = Timestamp._from_value_and_reso(val, reso=reso, tz=tz)
+                if format is None:
                     # Use datetime.str, that returns ts.isoformat(sep=' ')
                     res = str(ts)
+                else:
+
+                    # invalid format string
+                    # requires dates > 1900
+                    try:
+                        # Note: dispatches to pydatetime
+                        res = ts.strftime(format)
+                    except ValueError:
+                        # Use datetime.str, that returns ts.isoformat(sep=' ')
+                        res = str(ts)
+
+            if memo is not None and len(memo) < MEMO_MAX_SIZE:
+                memo[key] = res
 
         # Note: we can index result directly instead of using PyArray_MultiIter_DATA
         #  like we do for the other functions because result is known C-contiguous
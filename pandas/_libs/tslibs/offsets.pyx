@@ -249,6 +249,49 @@ cdef _to_dt64D(dt):
     return dt
 
 
+cdef tuple _split_days(ndarray dtarr):
+    """
+    Split datetime64 values into their dates as datetime64[D] and their time
+    of day in the unit of the values, NaT in both for NaT.
+    """
+    days = dtarr.astype("M8[D]")
+    return days, dtarr - days.astype(dtarr.dtype)
+
+
+cdef ndarray _day_of_month(ndarray days):
+    # days : datetime64[D]
+    return (days - days.astype("M8[M]").astype("M8[D]")).view("i8") + 1
+
+
+cdef ndarray _day_of_week(ndarray days):
+    # days : datetime64[D], Monday=0, 1970-01-01 was a Thursday
+    return (days.view("i8") + 3) % 7
+
+
+cdef ndarray _add_business_offset(ndarray values, offset):
+    """
+    Add the ``offset`` of a business offset, in the unit of the values unless
+    that loses precision.
+    """
+    if not offset:
+        return values
+    td = Timedelta(offset)
+    try:
+        td = td.as_unit(np.datetime_data(values.dtype)[0], round_ok=False)
+    except ValueError:
+        pass
+    return values + td
+
+
+cdef ndarray _roll_convention_array(ndarray other, int n, ndarray compare):
+    """
+    Vectorized roll_convention, see roll_convention for the parameters.
+    """
+    if n > 0:
+        return np.where(other < compare, n - 1, n)
+    return np.where(other > compare, n + 1, n)
+
+
 # ---------------------------------------------------------------------
 # Validation
 
@@ -2483,6 +2526,22 @@ cdef class WeekOfMonthMixin(SingleConstructorOffset):
         to_day = self._get_offset_day(shifted)
         return _shift_day(shifted, to_day - shifted.day)
 
+    def _apply_array(self, dtarr: np.ndarray) -> np.ndarray:
+        days, times = _split_days(dtarr)
+        months = days.astype("M8[M]")
+        n = _roll_convention_array(
+            _day_of_month(days), self.n, self._get_offset_days(months)
+        )
+        months = months + n
+        days = months.astype("M8[D]") + (self._get_offset_days(months) - 1)
+        return days.astype(dtarr.dtype) + times
+
+    cdef ndarray _get_offset_days(self, ndarray months):
+        """
+        Vectorized _get_offset_day for datetime64[M] months.
+        """
+        raise NotImplementedError
+
     def is_on_offset(self, dt: datetime) -> bool:
         if self.normalize and not _is_normalized(dt):
             return False
@@ -3690,6 +3749,11 @@ cdef class WeekOfMonth(WeekOfMonthMixin):
         shift_days = (self.weekday - wday) % 7
         return 1 + shift_days + self.week * 7
 
+    cdef ndarray _get_offset_days(self, ndarray months):
+        wday = _day_of_week(months.astype("M8[D]"))
+        shift_days = (self.weekday - wday) % 7
+        return 1 + shift_days + self.week * 7
+
     @classmethod
     def _from_name(cls, suffix=None):
         if not suffix:
@@ -3774,6 +3838,12 @@ cdef class LastWeekOfMonth(WeekOfMonthMixin):
         shift_days = (wday - self.weekday) % 7
         return dim - shift_days
 
+    cdef ndarray _get_offset_days(self, ndarray months):
+        mend = (months + 1).astype("M8[D]") - 1
+        wday = _day_of_week(mend)
+        shift_days = (wday - self.weekday) % 7
+        return _day_of_month(mend) - shift_days
+
     @classmethod
     def _from_name(cls, suffix=None):
         if not suffix:
@@ -4346,6 +4416,25 @@ cdef class Easter(SingleConstructorOffset):
         )
         return new
 
+    def _apply_array(self, dtarr: np.ndarray) -> np.ndarray:
+        from dateutil.easter import easter
+
+        days, times = _split_days(dtarr)
+        mask = np.isnat(days)
+        years = days.astype("M8[Y]").view("i8") + 1970
+        years[mask] = 1970
+
+        n = self.n
+        current_easter = _easter_days(years, easter).astype(dtarr.dtype)
+        if n >= 0:
+            n = np.where(dtarr < current_easter, n - 1, n)
+        else:
+            n = np.where(dtarr > current_easter, n + 1, n)
+
+        new = _easter_days(years + n, easter)
+        new[mask] = np.datetime64("NaT")
+        return new.astype(dtarr.dtype) + times
+
     def is_on_offset(self, dt: datetime) -> bool:
         if self.normalize and not _is_normalized(dt):
             return False
@@ -4355,6 +4444,15 @@ cdef class Easter(SingleConstructorOffset):
         return date(dt.year, dt.month, dt.day) == easter(dt.year)
 
 
+cdef ndarray _easter_days(ndarray years, easter):
+    """
+    Easter dates of the years as datetime64[D], computed once per year.
+    """
+    uniques, inverse = np.unique(years, return_inverse=True)
+    dates = np.array([easter(year) for year in uniques.tolist()], dtype="M8[D]")
+    return dates[inverse.reshape(np.shape(years))]
+
+
 # ----------------------------------------------------------------------
 # Custom Offset classes
 
@@ -4433,8 +4531,6 @@ cdef class CustomBusinessDay(BusinessDay):
         # GH#52534
         raise ValueError(f"{self.base} is not supported as period frequency")
 
-    _apply_array = BaseOffset._apply_array
-
     def __init__(
         self,
         n=1,
@@ -4483,6 +4579,13 @@ cdef class CustomBusinessDay(BusinessDay):
                 "datetime, datetime64 or timedelta."
             )
 
+    def _apply_array(self, dtarr: np.ndarray) -> np.ndarray:
+        roll = "forward" if self.n <= 0 else "backward"
+        days, times = _split_days(dtarr)
+        days = np.busday_offset(days, self.n, roll=roll, busdaycal=self.calendar)
+        res = days.astype(dtarr.dtype) + times
+        return _add_business_offset(res, self.offset)
+
     def is_on_offset(self, dt: datetime) -> bool:
         if self.normalize and not _is_normalized(dt):
             return False
@@ -4678,6 +4781,36 @@ cdef class _CustomBusinessMonth(BusinessMixin):
             result = result + self.offset
         return result
 
+    def _apply_array(self, dtarr: np.ndarray) -> np.ndarray:
+        cdef:
+            bint month_begin = self._prefix.endswith("S")
+
+        roll = "forward" if month_begin else "backward"
+        days, times = _split_days(dtarr)
+        months = days.astype("M8[M]")
+
+        # the start or end of the month, rolled to a business day
+        if month_begin:
+            cur_month_offset_date = months.astype("M8[D]")
+        else:
+            cur_month_offset_date = (months + 1).astype("M8[D]") - 1
+        compare_date = np.busday_offset(
+            cur_month_offset_date, 0, roll=roll, busdaycal=self.calendar
+        )
+        n = _roll_convention_array(
+            _day_of_month(days), self.n, _day_of_month(compare_date)
+        )
+
+        months = months + n
+        if month_begin:
+            new = months.astype("M8[D]")
+        else:
+            new = (months + 1).astype("M8[D]") - 1
+        new = np.busday_offset(new, 0, roll=roll, busdaycal=self.calendar)
+
+        res = new.astype(dtarr.dtype) + times
+        return _add_business_offset(res, self.offset)
+
 
 cdef class CustomBusinessMonthEnd(_CustomBusinessMonth):
     """
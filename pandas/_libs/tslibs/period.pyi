@@ -49,6 +49,10 @@ def period_array_strftime(
     na_rep,
     date_format: str | None,
 ) -> npt.NDArray[np.object_]: ...
+def periodarr_to_object(
+    values: npt.NDArray[np.int64],  # const int64_t[:]
+    freq: BaseOffset,
+) -> npt.NDArray[np.object_]: ...
 
 # exposed for tests
 def period_asfreq(ordinal: int, freq1: int, freq2: int, end: bool) -> int: ...
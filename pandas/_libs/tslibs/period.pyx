@@ -1320,12 +1320,20 @@ cdef str _period_strftime(int64_t value, int freq, bytes fmt, npy_datetimestruct
     return result
 
 
+# Results are shared between equal values, unless fewer than one in eight of
+#  the first MEMO_CHECK values are repeats
+cdef Py_ssize_t MEMO_CHECK = 4096
+cdef Py_ssize_t MEMO_MAX_SIZE = 1 << 20
+
+
 def period_array_strftime(
     ndarray values, int dtype_code, object na_rep, str date_format
 ):
     """
     Vectorized Period.strftime used for PeriodArray._format_native_types.
 
+    Each distinct ordinal is formatted once.
+
     Parameters
     ----------
     values : ndarray[int64_t], ndim unrestricted
@@ -1335,9 +1343,10 @@ def period_array_strftime(
     date_format : str or None
     """
     cdef:
-        Py_ssize_t i, n = values.size
+        Py_ssize_t i, n = values.size, n_seen = 0
         int64_t ordinal
         object item_repr
+        dict memo = {}
         ndarray out = cnp.PyArray_EMPTY(
             values.ndim, values.shape, cnp.NPY_OBJECT, 0
         )
@@ -1351,14 +1360,26 @@ def period_array_strftime(
         if ordinal == NPY_NAT:
             item_repr = na_rep
         else:
-            # This is equivalent to
-            # freq = frequency_corresponding_to_dtype_code(dtype_code)
-            # per = Period(ordinal, freq=freq)
-            # if date_format:
-            #     item_repr = per.strftime(date_format)
-            # else:
-            #     item_repr = str(per)
-            item_repr = period_format(ordinal, dtype_code, date_format)
+            item_repr = None
+            if memo is not None:
+                item_repr = memo.get(ordinal)
+                n_seen += 1
+                if n_seen == MEMO_CHECK and 8 * len(memo) > 7 * MEMO_CHECK:
+                    # almost all values are distinct, stop looking them up
+                    memo = None
+
+            if item_repr is None:
+                # This is equivalent to
+                # freq = frequency_corresponding_to_dtype_code(dtype_code)
+                # per = Period(ordinal, freq=freq)
+                # if date_format:
+                #     item_repr = per.strftime(date_format)
+                # else:
+                #     item_repr = str(per)
+                item_repr = period_format(ordinal, dtype_code, date_format)
+
+                if memo is not None and len(memo) < MEMO_MAX_SIZE:
+                    memo[ordinal] = item_repr
 
         # Analogous to: ordinals[i] = ordinal
         out_flat[i] = item_repr
@@ -1368,6 +1389,44 @@ def period_array_strftime(
     return out
 
 
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def periodarr_to_object(const int64_t[:] values, BaseOffset freq):
+    """
+    Box ordinals as Period objects, NaT for missing values.
+
+    Periods are immutable, so equal ordinals share a single object.
+    """
+    cdef:
+        Py_ssize_t i, n = len(values), n_seen = 0
+        int64_t ordinal
+        object per
+        dict memo = {}
+        ndarray[object] out = cnp.PyArray_EMPTY(1, [n], cnp.NPY_OBJECT, 0)
+
+    freq = Period._maybe_convert_freq(freq)
+    for i in range(n):
+        ordinal = values[i]
+        if ordinal == NPY_NAT:
+            out[i] = NaT
+            continue
+
+        per = None
+        if memo is not None:
+            per = memo.get(ordinal)
+            n_seen += 1
+            if n_seen == MEMO_CHECK and 8 * len(memo) > 7 * MEMO_CHECK:
+                memo = None
+
+        if per is None:
+            per = _Period.__new__(Period, ordinal, freq)
+            if memo is not None and len(memo) < MEMO_MAX_SIZE:
+                memo[ordinal] = per
+        out[i] = per
+
+    return out
+
+
 # ----------------------------------------------------------------------
 # period accessors
 
@@ -1539,25 +1598,48 @@ def extract_ordinals(ndarray values, freq) -> np.ndarray:
     # values is object-dtype, may be 2D
 
     cdef:
-        Py_ssize_t i, n = values.size
+        Py_ssize_t i, n = values.size, n_seen = 0
         int64_t ordinal
         ndarray ordinals = cnp.PyArray_EMPTY(
             values.ndim, values.shape, cnp.NPY_INT64, 0
         )
         cnp.broadcast mi = cnp.PyArray_MultiIterNew2(ordinals, values)
-        object p
+        object p, res
+        dict memo = {}
+        PeriodDtypeBase dtype
 
     if values.descr.type_num != cnp.NPY_OBJECT:
         # if we don't raise here, we'll segfault later!
         raise TypeError("extract_ordinals values must be object-dtype")
 
-    freqstr = PeriodDtypeBase(freq._period_dtype_code, freq.n)._freqstr
+    dtype = PeriodDtypeBase(freq._period_dtype_code, freq.n)
+    freqstr = dtype._freqstr
 
     for i in range(n):
         # Analogous to: p = values[i]
         p = <object>(<PyObject**>cnp.PyArray_MultiIter_DATA(mi, 1))[0]
 
-        ordinal = _extract_ordinal(p, freqstr, freq)
+        if (
+            is_period_object(p)
+            and (<_Period>p)._dtype._dtype_code == dtype._dtype_code
+            and (<_Period>p)._dtype._n == dtype._n
+        ):
+            # matching freq, no need to compare freqstr
+            ordinal = (<_Period>p).ordinal
+        elif memo is not None and type(p) is str:
+            # strings are parsed once per distinct value
+            res = memo.get(p)
+            n_seen += 1
+            if n_seen == MEMO_CHECK and 8 * len(memo) > 7 * MEMO_CHECK:
+                memo = None
+            if res is None:
+                ordinal = _extract_ordinal(p, freqstr, freq)
+                if memo is not None and len(memo) < MEMO_MAX_SIZE:
+                    memo[p] = ordinal
+            else:
+                ordinal = res
+        else:
+            ordinal = _extract_ordinal(p, freqstr, freq)
 
         # Analogous to: ordinals[i] = ordinal
         (<int64_t*>cnp.PyArray_MultiIter_DATA(mi, 0))[0] = ordinal
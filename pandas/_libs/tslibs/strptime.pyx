@@ -15,9 +15,11 @@ FUNCTIONS:
     _getlang -- Figure out what language is being used for the locale
     strptime -- Calculates the time struct represented by the passed-in string
 """
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timezone
 import zoneinfo
 
+from cpython.unicode cimport PyUnicode_AsUTF8AndSize
 from cpython.datetime cimport (
     PyDate_Check,
     PyDateTime_Check,
@@ -41,8 +43,10 @@ import re
 import numpy as np
 
 cimport numpy as cnp
+from libc.stdint cimport INT64_MAX
 from numpy cimport (
     int64_t,
+    intp_t,
     ndarray,
 )
 
@@ -63,6 +67,7 @@ from pandas._libs.tslibs.nattype cimport (
 from pandas._libs.tslibs.np_datetime cimport (
     NPY_DATETIMEUNIT,
     NPY_FR_ns,
+    FormatRequirement,
     get_datetime64_unit,
     import_pandas_datetime,
     npy_datetimestruct,
@@ -89,6 +94,23 @@ from pandas._libs.tslibs.tzconversion cimport tz_localize_to_utc_single
 cnp.import_array()
 
 
+cdef extern from "pandas/datetime/pd_datetime.h":
+    npy_datetimestruct _NS_MIN_DTS, _NS_MAX_DTS
+    npy_datetimestruct _US_MIN_DTS, _US_MAX_DTS
+    npy_datetimestruct _MS_MIN_DTS, _MS_MAX_DTS
+    npy_datetimestruct _S_MIN_DTS, _S_MAX_DTS
+
+    int cmp_npy_datetimestruct(npy_datetimestruct *a,
+                               npy_datetimestruct *b) nogil
+
+    int parse_iso_8601_datetime(const char *str, int len, int want_exc,
+                                npy_datetimestruct *out,
+                                NPY_DATETIMEUNIT *out_bestunit,
+                                int *out_local, int *out_tzoffset,
+                                const char *format, int format_len,
+                                FormatRequirement exact) nogil
+
+
 cdef bint format_is_iso(f: str):
     """
     Does format match the iso8601 set that can be handled by the C parser?
@@ -348,6 +370,223 @@ cdef class DatetimeParseState:
         return tz_out
 
 
+# strings parsed by each thread at least, with fewer strings starting the
+#  threads costs more than parsing in parallel saves
+cdef Py_ssize_t MIN_STRINGS_PER_THREAD = 10_000
+
+
+cdef int _parse_iso_range(
+    const intp_t[::1] bufs,
+    const intp_t[::1] lengths,
+    int64_t[::1] iresult,
+    Py_ssize_t start,
+    Py_ssize_t stop,
+    const char* format_buf,
+    int format_length,
+    FormatRequirement format_requirement,
+    NPY_DATETIMEUNIT creso,
+) noexcept nogil:
+    """
+    Parse the UTF-8 strings in ``[start, stop)`` with the C ISO 8601 parser.
+
+    With ``creso`` NPY_FR_GENERIC the resolution is inferred: the values parsed
+    so far are rescaled when a string with a finer resolution is found.
+    Returns the resolution of the values (NPY_FR_GENERIC if all strings are
+    NaT), or -1 if a string has to be parsed by ``array_strptime``: it does not
+    parse, has a UTC offset, or is out of bounds.
+    """
+    cdef:
+        Py_ssize_t i, j
+        npy_datetimestruct dts, lower, upper
+        NPY_DATETIMEUNIT out_bestunit, item_reso
+        bint infer_reso = creso == NPY_DATETIMEUNIT.NPY_FR_GENERIC
+        int out_local = 0, out_tzoffset = 0
+        int64_t factor
+
+    if not infer_reso:
+        _get_bounds(creso, &lower, &upper)
+
+    dts.us = dts.ps = dts.as = 0
+    for i in range(start, stop):
+        if lengths[i] < 0:
+            iresult[i] = NPY_NAT
+            continue
+        if parse_iso_8601_datetime(
+            <const char*>bufs[i], <int>lengths[i], 0, &dts, &out_bestunit,
+            &out_local, &out_tzoffset, format_buf, format_length,
+            format_requirement
+        ) != 0 or out_local:
+            return -1
+
+        if infer_reso:
+            # same as get_supported_reso
+            if out_bestunit < NPY_DATETIMEUNIT.NPY_FR_s:
+                item_reso = NPY_DATETIMEUNIT.NPY_FR_s
+            elif out_bestunit > NPY_FR_ns:
+                item_reso = NPY_FR_ns
+            else:
+                item_reso = out_bestunit
+            if creso == NPY_DATETIMEUNIT.NPY_FR_GENERIC:
+                creso = item_reso
+                _get_bounds(creso, &lower, &upper)
+            elif infer_reso and item_reso > creso:
+                factor = _reso_factor(creso, item_reso)
+                for j in range(start, i):
+                    if iresult[j] != NPY_NAT:
+                        if (
+                            iresult[j] > INT64_MAX // factor
+                            or iresult[j] < -INT64_MAX // factor
+                        ):
+                            return -1
+                        iresult[j] *= factor
+                creso = item_reso
+                _get_bounds(creso, &lower, &upper)
+
+        if (
+            cmp_npy_datetimestruct(&dts, &lower) == -1
+            or cmp_npy_datetimestruct(&dts, &upper) == 1
+        ):
+            return -1
+        iresult[i] = npy_datetimestruct_to_datetime(creso, &dts)
+    return creso
+
+
+cdef inline int64_t _reso_factor(
+    NPY_DATETIMEUNIT from_reso, NPY_DATETIMEUNIT to_reso
+) noexcept nogil:
+    # the supported resolutions s, ms, us and ns are 1000 apart
+    cdef:
+        int64_t factor = 1
+        int k
+
+    for k in range(<int>to_reso - <int>from_reso):
+        factor *= 1000
+    return factor
+
+
+cdef inline void _get_bounds(
+    NPY_DATETIMEUNIT reso, npy_datetimestruct* lower, npy_datetimestruct* upper
+) noexcept nogil:
+    if reso == NPY_FR_ns:
+        lower[0] = _NS_MIN_DTS
+        upper[0] = _NS_MAX_DTS
+    elif reso == NPY_DATETIMEUNIT.NPY_FR_us:
+        lower[0] = _US_MIN_DTS
+        upper[0] = _US_MAX_DTS
+    elif reso == NPY_DATETIMEUNIT.NPY_FR_ms:
+        lower[0] = _MS_MIN_DTS
+        upper[0] = _MS_MAX_DTS
+    else:
+        lower[0] = _S_MIN_DTS
+        upper[0] = _S_MAX_DTS
+
+
+cdef class _ThreadedISOParser:
+    """
+    Parse ISO 8601 strings in slices that run in threads without the GIL.
+
+    The UTF-8 buffers of the strings are collected up front, the strings are
+    kept alive by ``values``.
+    """
+    cdef:
+        ndarray values
+        str fmt
+        bint exact
+        intp_t[::1] bufs
+        intp_t[::1] lengths
+        int64_t[::1] iresult
+
+    def __init__(self, ndarray values, str fmt, bint exact):
+        self.values = values
+        self.fmt = fmt
+        self.exact = exact
+        self.bufs = np.empty(len(values), dtype=np.intp)
+        self.lengths = np.empty(len(values), dtype=np.intp)
+        self.iresult = np.empty(len(values), dtype=np.int64)
+
+    cdef bint collect_buffers(self):
+        """
+        Collect the UTF-8 buffers, returns False if a value is not a string.
+        """
+        cdef:
+            Py_ssize_t i, length
+            const char* buf
+            object val
+
+        for i in range(len(self.values)):
+            val = self.values[i]
+            if not isinstance(val, str):
+                return False
+            if len(val) == 0 or val in nat_strings:
+                self.lengths[i] = -1
+                continue
+            buf = PyUnicode_AsUTF8AndSize(val, &length)
+            self.bufs[i] = <intp_t>buf
+            self.lengths[i] = length
+        return True
+
+    def parse(self, Py_ssize_t start, Py_ssize_t stop, NPY_DATETIMEUNIT creso):
+        cdef:
+            const char* format_buf
+            Py_ssize_t format_length
+            FormatRequirement format_requirement
+            int result
+
+        if self.fmt == "ISO8601":
+            format_buf = b""
+            format_length = 0
+            format_requirement = FormatRequirement.INFER_FORMAT
+        else:
+            format_buf = PyUnicode_AsUTF8AndSize(self.fmt, &format_length)
+            format_requirement = <FormatRequirement>self.exact
+
+        with nogil:
+            result = _parse_iso_range(
+                self.bufs, self.lengths, self.iresult, start, stop,
+                format_buf, <int>format_length, format_requirement, creso,
+            )
+        return result
+
+
+cdef _array_strptime_iso_threaded(
+    ndarray values, str fmt, bint exact, NPY_DATETIMEUNIT creso, int nthreads
+):
+    """
+    Parse ISO 8601 strings in ``nthreads`` threads.
+
+    Returns None if a value has to be parsed by ``array_strptime``.
+    """
+    cdef:
+        _ThreadedISOParser parser = _ThreadedISOParser(values, fmt, exact)
+
+    if not parser.collect_buffers():
+        return None
+
+    bounds = np.linspace(0, len(values), nthreads + 1).astype(np.intp)
+    starts, stops = bounds[:-1].tolist(), bounds[1:].tolist()
+    with ThreadPoolExecutor(nthreads) as pool:
+        resos = list(pool.map(parser.parse, starts, stops, [creso] * nthreads))
+    if -1 in resos:
+        return None
+
+    iresult = parser.iresult.base
+    found = [reso for reso in resos if reso != NPY_DATETIMEUNIT.NPY_FR_GENERIC]
+    if not found:
+        # all NaT, default to "s" as array_strptime does
+        return iresult.view("M8[s]")
+    creso = max(found)
+    for start, stop, reso in zip(starts, stops, resos):
+        if reso != NPY_DATETIMEUNIT.NPY_FR_GENERIC and reso < creso:
+            # bring slices parsed with a coarser resolution to the finest one
+            chunk = iresult[start:stop]
+            mask = chunk != NPY_NAT
+            factor = 1000 ** (creso - reso)
+            if np.abs(chunk[mask]).max() > INT64_MAX // factor:
+                return None
+            chunk[mask] *= factor
+    return iresult.view(f"M8[{npy_unit_to_abbrev(creso)}]")
+
+
 def array_strptime(
     ndarray[object] values,
     str fmt,
@@ -355,6 +594,7 @@ def array_strptime(
     errors="raise",
     bint utc=False,
     NPY_DATETIMEUNIT creso=NPY_DATETIMEUNIT.NPY_FR_GENERIC,
+    int nthreads=1,
 ):
     """
     Calculates the datetime structs represented by the passed array of strings
@@ -367,6 +607,9 @@ def array_strptime(
     errors : string specifying error handling, {'raise', 'coerce'}
     creso : NPY_DATETIMEUNIT, default NPY_FR_GENERIC
         Set to NPY_FR_GENERIC to infer a resolution.
+    nthreads : int, default 1
+        Number of threads used to parse tz-naive ISO 8601 strings. Other
+        values are parsed in a single thread.
     """
 
     cdef:
@@ -387,6 +630,13 @@ def array_strptime(
     assert is_raise or is_coerce
 
     _validate_fmt(fmt)
+
+    nthreads = min(nthreads, n // MIN_STRINGS_PER_THREAD)
+    if nthreads > 1 and (iso_format or fmt == "ISO8601"):
+        result = _array_strptime_iso_threaded(values, fmt, exact, creso, nthreads)
+        if result is not None:
+            return result, None
+
     format_regex, locale_time = _get_format_regex(fmt)
 
     if infer_reso:
@@ -21,3 +21,4 @@ cdef timedelta get_utcoffset(tzinfo tz, datetime obj)
 cpdef bint is_fixed_offset(tzinfo tz)
 
 cdef object get_dst_info(tzinfo tz)
+cdef object get_zoneinfo_dst_info(tzinfo tz, int first_year, int last_year)
@@ -353,6 +353,92 @@ cdef object get_dst_info(tzinfo tz):
     return dst_cache[cache_key]
 
 
+# Transition tables of ZoneInfo timezones, which do not expose their
+#  transitions, keyed by the timezone and the blocks of years they cover.
+zoneinfo_dst_cache = {}
+
+# years in a block of ZoneInfo transitions
+cdef int ZONEINFO_BLOCK_YEARS = 20
+
+# ZoneInfo offsets are probed at this step and the transitions are bisected to
+#  the second. A zone that changes its offset and changes it back within the
+#  step would be missed, the closest transitions in the tz database are four
+#  days apart.
+cdef object ZONEINFO_PROBE_STEP = timedelta(days=1)
+
+cdef object _one_second = timedelta(seconds=1)
+cdef object _one_microsecond = timedelta(microseconds=1)
+cdef datetime _utc_epoch = datetime(1970, 1, 1, tzinfo=utc_stdlib)
+
+
+cdef int64_t _zoneinfo_offset(tzinfo tz, datetime utc_dt):
+    return (utc_dt.astimezone(tz).utcoffset() // _one_microsecond) * 1000
+
+
+cdef object get_zoneinfo_dst_info(tzinfo tz, int first_year, int last_year):
+    """
+    Transitions of a ZoneInfo timezone between ``first_year`` and
+    ``last_year``, the years must be at least ZONEINFO_BLOCK_YEARS within
+    the range of datetime.
+
+    The offsets are probed from ``tz`` and cached in blocks of years. The
+    first offset is used for all times before the first block, so the table
+    is only valid within the years.
+
+    Returns
+    -------
+    ndarray[int64_t]
+        Nanosecond UTC times of DST transitions.
+    ndarray[int64_t]
+        Nanosecond UTC offsets corresponding to DST transitions.
+    str
+        "zoneinfo"
+    """
+    cdef:
+        int first_block = first_year // ZONEINFO_BLOCK_YEARS
+        int last_block = last_year // ZONEINFO_BLOCK_YEARS
+        int64_t left_offset, right_offset
+        datetime start, end, left, right, lo, hi, mid
+
+    cache_key = (tz, first_block, last_block)
+    if cache_key not in zoneinfo_dst_cache:
+        start = datetime(first_block * ZONEINFO_BLOCK_YEARS, 1, 1, tzinfo=utc_stdlib)
+        end = datetime(
+            (last_block + 1) * ZONEINFO_BLOCK_YEARS, 1, 1, tzinfo=utc_stdlib
+        )
+        left = start
+        left_offset = _zoneinfo_offset(tz, left)
+        trans = [NPY_NAT + 1]
+        deltas = [left_offset]
+
+        while left < end:
+            right = left + ZONEINFO_PROBE_STEP
+            right_offset = _zoneinfo_offset(tz, right)
+            while right_offset != left_offset:
+                # find the first second with a different offset, repeated in
+                #  case the offset changed more than once within the step
+                lo, hi = left, right
+                while hi - lo > _one_second:
+                    mid = lo + ((hi - lo) // _one_second // 2) * _one_second
+                    if _zoneinfo_offset(tz, mid) == left_offset:
+                        lo = mid
+                    else:
+                        hi = mid
+                left = hi
+                left_offset = _zoneinfo_offset(tz, left)
+                trans.append(((left - _utc_epoch) // _one_microsecond) * 1000)
+                deltas.append(left_offset)
+            left = right
+
+        zoneinfo_dst_cache[cache_key] = (
+            np.array(trans, dtype=np.int64),
+            np.array(deltas, dtype=np.int64),
+            "zoneinfo",
+        )
+
+    return zoneinfo_dst_cache[cache_key]
+
+
 def infer_tzinfo(datetime start, datetime end):
     if start is not None and end is not None:
         tz = start.tzinfo
@@ -43,6 +43,7 @@ import_pandas_datetime()
 
 from pandas._libs.tslibs.timezones cimport (
     get_dst_info,
+    get_zoneinfo_dst_info,
     is_fixed_offset,
     is_tzlocal,
     is_utc,
@@ -69,7 +70,7 @@ cdef class Localizer:
 
     @cython.initializedcheck(False)
     @cython.boundscheck(False)
-    def __cinit__(self, tzinfo tz, NPY_DATETIMEUNIT creso):
+    def __cinit__(self, tzinfo tz, NPY_DATETIMEUNIT creso, ndarray stamps=None):
         self.tz = tz
         self._creso = creso
         self.use_utc = self.use_tzlocal = self.use_fixed = False
@@ -78,15 +79,22 @@ cdef class Localizer:
         self.delta = -1  # placeholder
         self.deltas = _deltas_placeholder
         self.tdata = NULL
+        self.pos_hint = 0
+
+        dst_info = None
+        if is_zoneinfo(tz) and stamps is not None:
+            dst_info = _get_zoneinfo_dst_info(tz, stamps, creso)
 
         if is_utc(tz) or tz is None:
             self.use_utc = True
 
-        elif is_tzlocal(tz) or is_zoneinfo(tz):
+        elif dst_info is None and (is_tzlocal(tz) or is_zoneinfo(tz)):
             self.use_tzlocal = True
 
         else:
-            trans, deltas, typ = get_dst_info(tz)
+            if dst_info is None:
+                dst_info = get_dst_info(tz)
+            trans, deltas, typ = dst_info
             if creso != NPY_DATETIMEUNIT.NPY_FR_ns:
                 # NB: using floordiv here is implicitly assuming we will
                 #  never see trans or deltas that are not an integer number
@@ -103,12 +111,16 @@ cdef class Localizer:
                     deltas = np.array(deltas) // 1_000_000_000
                 else:
                     raise NotImplementedError(creso)
+                if len(trans) and dst_info[0][0] == NPY_NAT + 1:
+                    # keep the first transition before any value in the
+                    #  coarser unit
+                    trans[0] = NPY_NAT + 1
 
             self.trans = trans
             self.ntrans = self.trans.shape[0]
             self.deltas = deltas
 
-            if typ != "pytz" and typ != "dateutil":
+            if typ not in ("pytz", "dateutil", "zoneinfo"):
                 # static/fixed; in this case we know that len(delta) == 1
                 self.use_fixed = True
                 self.delta = deltas[0]
@@ -131,7 +143,19 @@ cdef class Localizer:
         elif self.use_fixed:
             return utc_val + self.delta
         else:
-            pos[0] = bisect_right_i8(self.tdata, utc_val, self.ntrans) - 1
+            # values are often sorted, check the transition of the previous
+            #  value before searching
+            if (
+                self.tdata[self.pos_hint] <= utc_val
+                and (
+                    self.pos_hint == self.ntrans - 1
+                    or utc_val < self.tdata[self.pos_hint + 1]
+                )
+            ):
+                pos[0] = self.pos_hint
+            else:
+                pos[0] = bisect_right_i8(self.tdata, utc_val, self.ntrans) - 1
+                self.pos_hint = pos[0]
             if fold is not NULL:
                 fold[0] = _infer_dateutil_fold(
                     utc_val, self.trans, self.deltas, pos[0]
@@ -140,6 +164,51 @@ cdef class Localizer:
             return utc_val + self.deltas[pos[0]]
 
 
+# arrays with fewer values are converted with the tzinfo API of a ZoneInfo
+#  timezone instead of building a transition table
+cdef Py_ssize_t ZONEINFO_TABLE_MIN_SIZE = 100
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef object _get_zoneinfo_dst_info(
+    tzinfo tz, ndarray stamps, NPY_DATETIMEUNIT creso
+):
+    """
+    Transitions of a ZoneInfo timezone covering the years of ``stamps``, or
+    None if there are too few stamps or their years are out of range.
+    """
+    cdef:
+        const int64_t[:] values
+        Py_ssize_t i, n = stamps.size
+        int64_t val, vmin = NPY_NAT, vmax = NPY_NAT
+        npy_datetimestruct dts
+        int first_year, last_year
+
+    if n < ZONEINFO_TABLE_MIN_SIZE:
+        return None
+
+    values = stamps.ravel("K").view(np.int64)
+    for i in range(n):
+        val = values[i]
+        if val == NPY_NAT:
+            continue
+        if vmin == NPY_NAT or val < vmin:
+            vmin = val
+        if vmax == NPY_NAT or val > vmax:
+            vmax = val
+    if vmin == NPY_NAT:
+        return None
+
+    pandas_datetime_to_datetimestruct(vmin, creso, &dts)
+    first_year = dts.year - 1
+    pandas_datetime_to_datetimestruct(vmax, creso, &dts)
+    last_year = dts.year + 1
+    if first_year < 20 or last_year >= 9980:
+        return None
+    return get_zoneinfo_dst_info(tz, first_year, last_year)
+
+
 cdef int64_t tz_localize_to_utc_single(
     int64_t val,
     tzinfo tz,
@@ -236,16 +305,16 @@ timedelta-like}
         Py_ssize_t i, n = vals.shape[0]
         Py_ssize_t delta_idx_offset, delta_idx
         int64_t v, left, right, val, new_local, remaining_mins
-        int64_t first_delta, delta
+        int64_t first_delta, delta, delta_left, delta_right
         int64_t shift_delta = 0
         ndarray[int64_t] result_a, result_b, dst_hours
         int64_t[::1] result
-        bint is_zi = False
+        bint is_zi = False, use_zoneinfo_trans = False
         bint infer_dst = False, is_dst = False, fill = False
         bint shift_forward = False, shift_backward = False
         bint fill_nonexist = False
         str stamp
-        Localizer info = Localizer(tz, creso=creso)
+        Localizer info = Localizer(tz, creso=creso, stamps=vals)
         int64_t pph = periods_per_day(creso) // 24
         int64_t pps = periods_per_second(creso)
         npy_datetimestruct dts
@@ -311,12 +380,14 @@ timedelta-like}
 
     # Determine whether each date lies left of the DST transition (store in
     # result_a) or right of the DST transition (store in result_b)
-    if is_zoneinfo(tz):
+    if info.use_tzlocal:
+        # ZoneInfo without a transition table
         is_zi = True
         result_a, result_b =_get_utc_bounds_zoneinfo(
             vals, tz, creso=creso
         )
     else:
+        use_zoneinfo_trans = is_zoneinfo(tz)
         result_a, result_b =_get_utc_bounds(
             vals, info.tdata, info.ntrans, info.deltas, creso=creso
         )
@@ -413,6 +484,28 @@ timedelta-like}
                     dt = dt.replace(tzinfo=None)
                     result[i] = pydatetime_to_dt64(dt, &dts, creso) + extra
 
+                elif use_zoneinfo_trans:
+                    # same as the ZoneInfo fold above: the later time when
+                    #  shifting forward, in a gap the offset after the
+                    #  transition, and the earlier time or offset otherwise
+                    _get_utc_bounds_single(
+                        new_local, info.tdata, info.ntrans, info.deltas,
+                        pph * 24, &left, &right, &delta_left, &delta_right,
+                    )
+                    if shift_forward or shift_delta > 0:
+                        if right != NPY_NAT:
+                            result[i] = right
+                        elif left != NPY_NAT:
+                            result[i] = left
+                        else:
+                            result[i] = new_local - delta_right
+                    elif left != NPY_NAT:
+                        result[i] = left
+                    elif right != NPY_NAT:
+                        result[i] = right
+                    else:
+                        result[i] = new_local - delta_left
+
                 else:
                     delta_idx = bisect_right_i8(info.tdata, new_local, info.ntrans)
                     # Logic similar to the precompute section. But check the current
@@ -489,45 +582,75 @@ cdef _get_utc_bounds(
         ndarray[int64_t] result_a, result_b
         Py_ssize_t i, n = vals.size
         int64_t val, v_left, v_right
-        Py_ssize_t isl, isr, pos_left, pos_right
         int64_t ppd = periods_per_day(creso)
 
     result_a = cnp.PyArray_EMPTY(vals.ndim, vals.shape, cnp.NPY_INT64, 0)
     result_b = cnp.PyArray_EMPTY(vals.ndim, vals.shape, cnp.NPY_INT64, 0)
 
     for i in range(n):
-        # This loops resembles the "Find the two best possibilities" block
-        #  in pytz's DstTZInfo.localize method.
-        result_a[i] = NPY_NAT
-        result_b[i] = NPY_NAT
-
         val = vals[i]
         if val == NPY_NAT:
+            result_a[i] = NPY_NAT
+            result_b[i] = NPY_NAT
             continue
 
-        # TODO: be careful of overflow in val-ppd
-        isl = bisect_right_i8(tdata, val - ppd, ntrans) - 1
-        if isl < 0:
-            isl = 0
+        _get_utc_bounds_single(
+            val, tdata, ntrans, deltas, ppd, &v_left, &v_right, NULL, NULL
+        )
+        result_a[i] = v_left
+        result_b[i] = v_right
 
-        v_left = val - deltas[isl]
-        pos_left = bisect_right_i8(tdata, v_left, ntrans) - 1
-        # timestamp falls to the left side of the DST transition
-        if v_left + deltas[pos_left] == val:
-            result_a[i] = v_left
+    return result_a, result_b
 
-        # TODO: be careful of overflow in val+ppd
-        isr = bisect_right_i8(tdata, val + ppd, ntrans) - 1
-        if isr < 0:
-            isr = 0
 
-        v_right = val - deltas[isr]
-        pos_right = bisect_right_i8(tdata, v_right, ntrans) - 1
-        # timestamp falls to the right side of the DST transition
-        if v_right + deltas[pos_right] == val:
-            result_b[i] = v_right
+cdef inline void _get_utc_bounds_single(
+    int64_t val,
+    const int64_t* tdata,
+    Py_ssize_t ntrans,
+    const int64_t[::1] deltas,
+    int64_t ppd,
+    int64_t* left,
+    int64_t* right,
+    int64_t* delta_left,
+    int64_t* delta_right,
+):
+    # This resembles the "Find the two best possibilities" block in pytz's
+    #  DstTZInfo.localize method. Sets the UTC times on the left and right side
+    #  of a DST transition or NPY_NAT, and optionally the offsets before and
+    #  after the transition.
+    cdef:
+        Py_ssize_t isl, isr, pos_left, pos_right
+        int64_t v_left, v_right
 
-    return result_a, result_b
+    left[0] = NPY_NAT
+    right[0] = NPY_NAT
+
+    # TODO: be careful of overflow in val-ppd
+    isl = bisect_right_i8(tdata, val - ppd, ntrans) - 1
+    if isl < 0:
+        isl = 0
+
+    v_left = val - deltas[isl]
+    pos_left = bisect_right_i8(tdata, v_left, ntrans) - 1
+    # timestamp falls to the left side of the DST transition
+    if v_left + deltas[pos_left] == val:
+        left[0] = v_left
+
+    # TODO: be careful of overflow in val+ppd
+    isr = bisect_right_i8(tdata, val + ppd, ntrans) - 1
+    if isr < 0:
+        isr = 0
+
+    v_right = val - deltas[isr]
+    pos_right = bisect_right_i8(tdata, v_right, ntrans) - 1
+    # timestamp falls to the right side of the DST transition
+    if v_right + deltas[pos_right] == val:
+        right[0] = v_right
+
+    if delta_left is not NULL:
+        delta_left[0] = deltas[isl]
+    if delta_right is not NULL:
+        delta_right[0] = deltas[isr]
 
 
 cdef _get_utc_bounds_zoneinfo(ndarray vals, tz, NPY_DATETIMEUNIT creso):
@@ -606,12 +729,10 @@ cdef ndarray[int64_t] _get_dst_hours(
 ):
     cdef:
         Py_ssize_t i, n = vals.shape[0]
-        ndarray[uint8_t, cast=True] mismatch
-        ndarray[int64_t] delta, dst_hours
-        ndarray[intp_t] switch_idxs, trans_idx, grp, a_idx, b_idx, one_diff
-        # TODO: Can uncomment when numpy >=2 is the minimum
-        # tuple trans_grp
-        intp_t switch_idx
+        ndarray[uint8_t, cast=True] mismatch, new_grp, switch
+        ndarray[int64_t] dst_hours, grp_switches
+        ndarray[intp_t] trans_idx, grp_starts, grp_sizes, bad
+        intp_t grp
         int64_t left, right
 
     dst_hours = cnp.PyArray_EMPTY(result_a.ndim, result_a.shape, cnp.NPY_INT64, 0)
@@ -638,42 +759,46 @@ cdef ndarray[int64_t] _get_dst_hours(
             "are no repeated times"
         )
 
-    # Split the array into contiguous chunks (where the difference between
+    # Split the array into contiguous groups (where the difference between
     # indices is 1).  These are effectively dst transitions in different
     # years which is useful for checking that there is not an ambiguous
     # transition in an individual year.
     if trans_idx.size > 0:
-        one_diff = np.where(np.diff(trans_idx) != 1)[0] + 1
-        trans_grp = np.array_split(trans_idx, one_diff)
-
-        # Iterate through each day, if there are no hours where the
-        # delta is negative (indicates a repeat of hour) the switch
-        # cannot be inferred
-        for grp in trans_grp:
-
-            delta = np.diff(result_a[grp])
-            if grp.size == 1 or np.all(delta > 0):
+        new_grp = np.empty(trans_idx.size, dtype=bool)
+        new_grp[0] = True
+        new_grp[1:] = np.diff(trans_idx) != 1
+        grp_starts = new_grp.nonzero()[0]
+        grp_sizes = np.diff(np.append(grp_starts, trans_idx.size))
+
+        # In each group the hour is repeated where the UTC time does not
+        # increase, if there is no such point the switch cannot be inferred
+        switch = np.zeros(trans_idx.size, dtype=bool)
+        switch[1:] = np.diff(result_a[trans_idx]) <= 0
+        switch[new_grp] = False
+        grp_switches = np.add.reduceat(switch.view(np.uint8), grp_starts,
+                                       dtype=np.int64)
+
+        bad = ((grp_sizes == 1) | (grp_switches != 1)).nonzero()[0]
+        if bad.size > 0:
+            grp = bad[0]
+            if grp_sizes[grp] == 1 or grp_switches[grp] == 0:
                 # see test_tz_localize_to_utc_ambiguous_infer
-                stamp = _render_tstamp(vals[grp[0]], creso=creso)
+                stamp = _render_tstamp(vals[trans_idx[grp_starts[grp]]], creso=creso)
                 raise ValueError(
                     f"{stamp} is an ambiguous time and cannot be inferred."
                 )
+            # see test_tz_localize_to_utc_ambiguous_infer
+            raise ValueError(
+                f"There are {grp_switches[grp]} dst switches when "
+                "there should only be 1."
+            )
 
-            # Find the index for the switch and pull from a for dst and b
-            # for standard
-            switch_idxs = (delta <= 0).nonzero()[0]
-            if switch_idxs.size > 1:
-                # see test_tz_localize_to_utc_ambiguous_infer
-                raise ValueError(
-                    f"There are {switch_idxs.size} dst switches when "
-                    "there should only be 1."
-                )
-
-            switch_idx = switch_idxs[0] + 1
-            # Pull the only index and adjust
-            a_idx = grp[:switch_idx]
-            b_idx = grp[switch_idx:]
-            dst_hours[grp] = np.hstack((result_a[a_idx], result_b[b_idx]))
+        # Pull from a for dst before the switch and from b for standard
+        # time from the switch on
+        switch = np.cumsum(switch) > np.repeat(np.arange(grp_starts.size), grp_sizes)
+        dst_hours[trans_idx] = np.where(
+            switch, result_b[trans_idx], result_a[trans_idx]
+        )
 
     return dst_hours
 
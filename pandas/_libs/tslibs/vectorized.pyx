@@ -61,7 +61,7 @@ def tz_convert_from_utc(ndarray stamps, tzinfo tz, NPY_DATETIMEUNIT reso=NPY_FR_
         return stamps.copy()
 
     cdef:
-        Localizer info = Localizer(tz, creso=reso)
+        Localizer info = Localizer(tz, creso=reso, stamps=stamps)
         int64_t utc_val, local_val
         Py_ssize_t pos, i, n = stamps.size
 
@@ -121,7 +121,7 @@ def ints_to_pydatetime(
     ndarray[object] of type specified by box
     """
     cdef:
-        Localizer info = Localizer(tz, creso=reso)
+        Localizer info = Localizer(tz, creso=reso, stamps=stamps)
         int64_t utc_val, local_val
         Py_ssize_t i, n = stamps.size
         Py_ssize_t pos = -1  # unused, avoid not-initialized warning
@@ -223,7 +223,7 @@ def get_resolution(
 ) -> Resolution:
     # stamps is int64_t, any ndim
     cdef:
-        Localizer info = Localizer(tz, creso=reso)
+        Localizer info = Localizer(tz, creso=reso, stamps=stamps)
         int64_t utc_val, local_val
         Py_ssize_t i, n = stamps.size
         Py_ssize_t pos = -1  # unused, avoid not-initialized warning
@@ -275,7 +275,7 @@ cpdef ndarray normalize_i8_timestamps(ndarray stamps, tzinfo tz, NPY_DATETIMEUNI
     result : int64 ndarray of converted of normalized nanosecond timestamps
     """
     cdef:
-        Localizer info = Localizer(tz, creso=reso)
+        Localizer info = Localizer(tz, creso=reso, stamps=stamps)
         int64_t utc_val, local_val, res_val
         Py_ssize_t i, n = stamps.size
         Py_ssize_t pos = -1  # unused, avoid not-initialized warning
@@ -322,7 +322,7 @@ def is_date_array_normalized(ndarray stamps, tzinfo tz, NPY_DATETIMEUNIT reso) -
     is_normalized : bool True if all stamps are normalized
     """
     cdef:
-        Localizer info = Localizer(tz, creso=reso)
+        Localizer info = Localizer(tz, creso=reso, stamps=stamps)
         int64_t utc_val, local_val
         Py_ssize_t i, n = stamps.size
         Py_ssize_t pos = -1  # unused, avoid not-initialized warning
@@ -353,7 +353,7 @@ def dt64arr_to_periodarr(
 ):
     # stamps is int64_t, arbitrary ndim
     cdef:
-        Localizer info = Localizer(tz, creso=reso)
+        Localizer info = Localizer(tz, creso=reso, stamps=stamps)
         Py_ssize_t i, n = stamps.size
         Py_ssize_t pos = -1  # unused, avoid not-initialized warning
         int64_t utc_val, local_val, res_val
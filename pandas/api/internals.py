@@ -5,9 +5,13 @@ from pandas._typing import ArrayLike
 from pandas import (
     DataFrame,
     Index,
+    Series,
 )
 from pandas.core.internals.api import _make_block
-from pandas.core.internals.managers import BlockManager as _BlockManager
+from pandas.core.internals.managers import (
+    BlockManager as _BlockManager,
+    _consolidation_stats,
+)
 
 
 def create_dataframe_from_blocks(
@@ -60,3 +64,44 @@ def create_dataframe_from_blocks(
     axes = [columns, index]
     mgr = _BlockManager(block_objs, axes)
     return DataFrame._from_mgr(mgr, mgr.axes)
+
+
+def nblocks(obj: DataFrame | Series) -> int:
+    """
+    Return the number of blocks holding the data of a DataFrame or Series.
+
+    A DataFrame stores the columns of a dtype in a single block after
+    consolidation, see :meth:`DataFrame.compact`.
+
+    Parameters
+    ----------
+    obj : DataFrame or Series
+
+    Returns
+    -------
+    int
+    """
+    return obj._mgr.nblocks
+
+
+def consolidation_stats(reset: bool = False) -> dict[str, int]:
+    """
+    Return counters of the block consolidations done in this process.
+
+    Parameters
+    ----------
+    reset : bool, default False
+        Set the counters to zero after reading them.
+
+    Returns
+    -------
+    dict
+        With the number of ``"consolidations"`` done, the number of
+        ``"blocks_merged"`` into consolidated blocks, and the
+        ``"bytes_copied"`` into them.
+    """
+    stats = dict(_consolidation_stats)
+    if reset:
+        for key in _consolidation_stats:
+            _consolidation_stats[key] = 0
+    return stats
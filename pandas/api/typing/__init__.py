@@ -11,6 +11,12 @@ from pandas.core.groupby import (
     SeriesGroupBy,
 )
 from pandas.core.indexes.frozen import FrozenList
+from pandas.core.lazy import (
+    LazyFrame,
+    LazyGroupBy,
+)
+from pandas.core.lookup import LookupAccessor
+from pandas.core.reshape.merge import JoinIndex
 from pandas.core.resample import (
     DatetimeIndexResamplerGroupby,
     PeriodIndexResamplerGroupby,
@@ -42,7 +48,11 @@ __all__ = [
     "ExponentialMovingWindow",
     "ExponentialMovingWindowGroupby",
     "FrozenList",
+    "JoinIndex",
     "JsonReader",
+    "LazyFrame",
+    "LazyGroupBy",
+    "LookupAccessor",
     "NAType",
     "NaTType",
     "NoDefault",
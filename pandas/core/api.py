@@ -41,6 +41,7 @@ from pandas.core.arrays.integer import (
     UInt64Dtype,
 )
 from pandas.core.arrays.string_ import StringDtype
+from pandas.core.builder import DataFrameBuilder
 from pandas.core.construction import array  # noqa: ICN001
 from pandas.core.flags import Flags
 from pandas.core.groupby import (
@@ -87,6 +88,7 @@ __all__ = [
     "CategoricalDtype",
     "CategoricalIndex",
     "DataFrame",
+    "DataFrameBuilder",
     "DateOffset",
     "DatetimeIndex",
     "DatetimeTZDtype",
@@ -36,14 +36,17 @@ from pandas.core.dtypes.common import (
     is_extension_array_dtype,
     is_list_like,
     is_numeric_dtype,
+    is_scalar,
     is_sequence,
 )
 from pandas.core.dtypes.dtypes import ExtensionDtype
 from pandas.core.dtypes.generic import (
     ABCDataFrame,
+    ABCExtensionArray,
     ABCNDFrame,
     ABCSeries,
 )
+from pandas.core.dtypes.missing import isna
 
 from pandas.core._numba.executor import generate_apply_looper
 import pandas.core.common as com
@@ -83,6 +86,7 @@ def frame_apply(
     by_row: Literal[False, "compat"] = "compat",
     engine: str = "python",
     engine_kwargs: dict[str, bool] | None = None,
+    vectorize: bool = False,
     args=None,
     kwargs=None,
 ) -> FrameApply:
@@ -92,6 +96,8 @@ def frame_apply(
     axis = obj._get_axis_number(axis)
     klass: type[FrameApply]
     if axis == 0:
+        if vectorize:
+            raise ValueError("vectorize=True is only supported with axis=1")
         klass = FrameRowApply
     elif axis == 1:
         if columns:
@@ -100,6 +106,11 @@ def frame_apply(
             )
         klass = FrameColumnApply
 
+    if vectorize and (raw or engine != "python"):
+        raise ValueError(
+            "vectorize=True is only supported with raw=False and engine='python'"
+        )
+
     return klass(
         obj,
         func,
@@ -108,6 +119,7 @@ def frame_apply(
         by_row=by_row,
         engine=engine,
         engine_kwargs=engine_kwargs,
+        vectorize=vectorize,
         args=args,
         kwargs=kwargs,
     )
@@ -767,6 +779,7 @@ class FrameApply(NDFrameApply):
         by_row: Literal[False, "compat"] = False,
         engine: str = "python",
         engine_kwargs: dict[str, bool] | None = None,
+        vectorize: bool = False,
         args,
         kwargs,
     ) -> None:
@@ -783,6 +796,7 @@ class FrameApply(NDFrameApply):
             args=args,
             kwargs=kwargs,
         )
+        self.vectorize = vectorize
 
     # ---------------------------------------------------------------
     # Abstract Methods
@@ -900,6 +914,11 @@ class FrameApply(NDFrameApply):
         elif self.raw:
             return self.apply_raw(engine=self.engine, engine_kwargs=self.engine_kwargs)
 
+        if self.vectorize:
+            result = self.apply_vectorized()
+            if result is not None:
+                return result
+
         return self.apply_standard()
 
     def agg(self):
@@ -1050,6 +1069,80 @@ class FrameApply(NDFrameApply):
         )
         return result
 
+    def apply_vectorized(self) -> Series | None:
+        """
+        Try to compute the result of ``func`` for all rows with a single call.
+
+        ``func`` is called once with the whole DataFrame, so that ``row[col]``
+        selects a column and element-wise operations act on all rows at once.
+        The result is used if it is a 1-D Series aligned with the index (or
+        an array of the same length) whose dtype and values agree with calling
+        ``func`` on a sample of rows, including the first and the last.
+        Otherwise None is returned and the caller falls back to applying
+        ``func`` row by row.
+
+        The sample only guards against functions that are obviously not
+        element-wise; it is up to the caller to only pass functions that give
+        the same results on whole columns as on single rows.
+        """
+        from pandas import RangeIndex
+
+        assert callable(self.func)
+        if self.result_type == "expand":
+            return None
+
+        obj = self.obj
+        n = len(obj)
+        index = obj.index
+        if obj.columns.isin(index).any():
+            # A function reducing over the columns (e.g. ``row.sum()``) would
+            #  return a Series that looks aligned with the index, so relabel
+            #  the rows with labels that are not columns
+            index = RangeIndex(-n, 0)
+            if obj.columns.isin(index).any():
+                return None
+        try:
+            result = self.func(obj.set_axis(index, axis=0), *self.args, **self.kwargs)
+        except Exception:
+            return None
+
+        if isinstance(result, ABCSeries):
+            if not result.index.equals(index):
+                return None
+            values = result._values
+        elif isinstance(result, (np.ndarray, ABCExtensionArray)):
+            if result.ndim != 1 or len(result) != n:
+                return None
+            values = result
+        else:
+            return None
+
+        # check evenly spaced rows, including the first and last, against the
+        #  row-wise results
+        positions = np.unique(np.linspace(0, n - 1, num=min(n, 5), dtype=np.intp))
+        expected = []
+        for i in positions:
+            res = self.func(obj.iloc[i], *self.args, **self.kwargs)
+            if not is_scalar(res):
+                return None
+            expected.append(res)
+
+        # a different dtype means the columns were not treated like the rows,
+        #  e.g. int columns upcast to float in the rows of a mixed frame, or
+        #  integer division by zero giving inf instead of 0
+        if values.dtype != self.obj._constructor_sliced(expected).dtype:
+            return None
+
+        for i, exp in zip(positions, expected):
+            res = values[i]
+            if isna(exp) or isna(res):
+                if not (isna(exp) and isna(res)):
+                    return None
+            elif exp != res:
+                return None
+
+        return obj._constructor_sliced(values, index=obj.index, copy=False)
+
     def apply_standard(self):
         if self.engine == "python":
             results, res_index = self.apply_series_generator()
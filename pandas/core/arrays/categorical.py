@@ -2715,12 +2715,33 @@ class Categorical(NDArrayBackedExtensionArray, PandasObject, ObjectStringArrayMi
         return take_nd(result, codes, fill_value=na_value)
 
     def _str_get_dummies(self, sep: str = "|", dtype: NpDtype | None = None):
-        # sep may not be in categories. Just bail on this.
+        # Compute the dummies for one row per distinct code, so that unused
+        # categories do not create columns, and take the rows with the codes.
         from pandas.core.arrays import NumpyExtensionArray
 
-        return NumpyExtensionArray(self.to_numpy(str, na_value="NaN"))._str_get_dummies(
-            sep, dtype
-        )
+        shifted_codes = self._codes.astype(np.intp) + 1
+        present = np.flatnonzero(np.bincount(shifted_codes))
+        uniques = type(self).from_codes(present - 1, dtype=self.dtype)
+        dummies, tags = NumpyExtensionArray(
+            uniques.to_numpy(str, na_value="NaN")
+        )._str_get_dummies(sep, dtype)
+        positions = np.empty(len(self.categories) + 1, dtype=np.intp)
+        positions[present] = np.arange(len(present))
+        return dummies.take(positions[shifted_codes], axis=0), tags
+
+    def _str_extract(self, pat: str, flags: int = 0, expand: bool = True):
+        if not expand:
+            return super()._str_extract(pat, flags=flags, expand=expand)
+        from pandas.core.arrays import NumpyExtensionArray
+
+        result = NumpyExtensionArray(
+            self.categories.to_numpy(dtype=object)
+        )._str_extract(pat, flags=flags, expand=expand)
+        na_value = self.dtype.na_value
+        return {
+            name: take_nd(values, self._codes, fill_value=na_value)
+            for name, values in result.items()
+        }
 
     # ------------------------------------------------------------------------
     # GroupBy Methods
@@ -1290,7 +1290,11 @@ class DatetimeLikeArrayMixin(  # type: ignore[misc]
 
         other_i8, o_mask = self._get_i8_values_and_mask(other)
         new_i8_data = add_overflowsafe(self.asi8, np.asarray(-other_i8, dtype="i8"))
-        new_data = np.array([self.freq.base * x for x in new_i8_data])
+        # differences repeat heavily in practice, box each distinct one once
+        codes, uniques = algorithms.factorize(new_i8_data.ravel())
+        base = self.freq.base
+        offsets = construct_1d_object_array_from_listlike([base * x for x in uniques])
+        new_data = offsets.take(codes).reshape(new_i8_data.shape)
 
         if o_mask is None:
             # i.e. Period scalar
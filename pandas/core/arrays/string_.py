@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from functools import partial
 import operator
+import re
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -20,6 +21,7 @@ from pandas._config import (
 from pandas._libs import (
     lib,
     missing as libmissing,
+    strings as libstrings,
 )
 from pandas._libs.arrays import NDArrayBacked
 from pandas._libs.lib import ensure_string_array
@@ -72,6 +74,8 @@ from pandas.core.missing import isna
 from pandas.io.formats import printing
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     import pyarrow
 
     from pandas._typing import (
@@ -1057,6 +1061,118 @@ class StringArray(BaseStringArray, NumpyExtensionArray):  # type: ignore[misc]
 
     _arith_method = _cmp_method
 
+    # ------------------------------------------------------------------------
+    # String methods interface
+    # The common methods use the kernels of pandas._libs.strings, which work
+    # on the object ndarray directly instead of mapping a callable over it.
+
+    def _convert_bool_result(
+        self,
+        result: npt.NDArray[np.bool_],
+        mask: npt.NDArray[np.bool_],
+        na=lib.no_default,
+        method_name: str | None = None,
+    ):
+        from pandas.arrays import BooleanArray
+
+        if na is not lib.no_default and not isna(na) and not isinstance(na, bool):
+            # GH#59561
+            warnings.warn(
+                f"Allowing a non-bool 'na' in obj.str.{method_name} is deprecated "
+                "and will raise in a future version.",
+                FutureWarning,
+                stacklevel=find_stack_level(),
+            )
+
+        if na is not lib.no_default and not isna(na):
+            result[mask] = bool(na)
+            mask[:] = False
+        if self.dtype.na_value is np.nan:
+            # NaN propagates as False
+            return result
+        return BooleanArray(result, mask)
+
+    def _convert_int_result(
+        self, result: npt.NDArray[np.int64], mask: npt.NDArray[np.bool_]
+    ):
+        if self.dtype.na_value is np.nan:
+            if mask.any():
+                result = result.astype("float64")
+                result[mask] = np.nan
+            return result
+        return IntegerArray(result, mask)
+
+    def _str_len(self):
+        return self._convert_int_result(*libstrings.str_len(self._ndarray))
+
+    def _str_startswith(self, pat: str | tuple[str, ...], na=lib.no_default):
+        result, mask = libstrings.str_startswith(self._ndarray, pat)
+        return self._convert_bool_result(result, mask, na, "startswith")
+
+    def _str_endswith(self, pat: str | tuple[str, ...], na=lib.no_default):
+        result, mask = libstrings.str_endswith(self._ndarray, pat)
+        return self._convert_bool_result(result, mask, na, "endswith")
+
+    def _str_contains(
+        self,
+        pat,
+        case: bool = True,
+        flags: int = 0,
+        na=lib.no_default,
+        regex: bool = True,
+    ):
+        if flags or not isinstance(pat, str) or (regex and not _is_literal(pat, case)):
+            return super()._str_contains(pat, case, flags, na, regex)
+        result, mask = libstrings.str_contains(self._ndarray, pat, case)
+        return self._convert_bool_result(result, mask, na, "contains")
+
+    def _str_replace(
+        self,
+        pat: str | re.Pattern,
+        repl: str | Callable,
+        n: int = -1,
+        case: bool = True,
+        flags: int = 0,
+        regex: bool = True,
+    ):
+        if (
+            not isinstance(pat, str)
+            or not isinstance(repl, str)
+            or not case
+            or flags
+            or (regex and (n == 0 or "\\" in repl or not _is_literal(pat, case)))
+        ):
+            return super()._str_replace(pat, repl, n, case, flags, regex)
+        return self._from_backing_data(
+            libstrings.str_replace(self._ndarray, pat, repl, n)
+        )
+
+    def _str_lower(self):
+        return self._from_backing_data(libstrings.str_lower(self._ndarray))
+
+    def _str_upper(self):
+        return self._from_backing_data(libstrings.str_upper(self._ndarray))
+
+    def _str_strip(self, to_strip=None):
+        return self._from_backing_data(libstrings.str_strip(self._ndarray, to_strip))
+
+    def _str_lstrip(self, to_strip=None):
+        return self._from_backing_data(
+            libstrings.str_strip(self._ndarray, to_strip, "left")
+        )
+
+    def _str_rstrip(self, to_strip=None):
+        return self._from_backing_data(
+            libstrings.str_strip(self._ndarray, to_strip, "right")
+        )
+
+
+def _is_literal(pat: str, case: bool) -> bool:
+    """
+    Whether the regular expression ``pat`` only matches itself.
+    """
+    return case and re.escape(pat) == pat
+
 
 class StringArrayNumpySemantics(StringArray):
     _storage = "python"
@@ -67,6 +67,7 @@ from pandas.core.construction import (
 
 if TYPE_CHECKING:
     from collections.abc import (
+        Callable,
         Hashable,
         Iterator,
     )
@@ -76,6 +77,7 @@ if TYPE_CHECKING:
         NumpySorter,
         NumpyValueArrayLike,
         ScalarLike_co,
+        T,
     )
 
     from pandas import (
@@ -912,7 +914,7 @@ class IndexOpsMixin(OpsMixin):
         else:
             return map(self._values.item, range(self._values.size))
 
-    @cache_readonly
+    @property
     def hasnans(self) -> bool:
         """
         Return True if there are any NaNs.
@@ -942,7 +944,18 @@ class IndexOpsMixin(OpsMixin):
         """
         # error: Item "bool" of "Union[bool, ndarray[Any, dtype[bool_]], NDFrame]"
         # has no attribute "any"
-        return bool(isna(self).any())  # type: ignore[union-attr]
+        return self._cached_stat(
+            "hasnans",
+            lambda: bool(isna(self).any()),  # type: ignore[union-attr]
+        )
+
+    def _cached_stat(self, key: Hashable, func: Callable[[], T]) -> T:
+        """
+        Compute a statistic of the values.
+
+        Series overrides this to cache the result alongside its data.
+        """
+        return func()
 
     @final
     def _map_values(self, mapper, na_action=None):
@@ -1141,10 +1154,14 @@ class IndexOpsMixin(OpsMixin):
         >>> s.nunique()
         4
         """
-        uniqs = self.unique()
-        if dropna:
-            uniqs = remove_na_arraylike(uniqs)
-        return len(uniqs)
+
+        def func() -> int:
+            uniqs = self.unique()
+            if dropna:
+                uniqs = remove_na_arraylike(uniqs)
+            return len(uniqs)
+
+        return self._cached_stat(("nunique", dropna), func)
 
     @property
     def is_unique(self) -> bool:
@@ -1199,7 +1216,9 @@ class IndexOpsMixin(OpsMixin):
         """
         from pandas import Index
 
-        return Index(self).is_monotonic_increasing
+        return self._cached_stat(
+            "is_monotonic_increasing", lambda: Index(self).is_monotonic_increasing
+        )
 
     @property
     def is_monotonic_decreasing(self) -> bool:
@@ -1227,7 +1246,9 @@ class IndexOpsMixin(OpsMixin):
         """
         from pandas import Index
 
-        return Index(self).is_monotonic_decreasing
+        return self._cached_stat(
+            "is_monotonic_decreasing", lambda: Index(self).is_monotonic_decreasing
+        )
 
     @final
     def _memory_usage(self, deep: bool = False) -> int:
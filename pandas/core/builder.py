@@ -0,0 +1,281 @@
+"""
+Incremental construction of wide DataFrames.
+
+Setting columns one at a time with ``df[name] = values`` inserts a block per
+column into the BlockManager and updates its block locations on every call,
+so building a frame with thousands of columns this way is quadratic. A
+:class:`DataFrameBuilder` instead copies each column into a growing 2-D array
+per dtype, and wraps those arrays into a consolidated BlockManager when the
+frame is built.
+"""
+
+from __future__ import annotations
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+)
+
+import numpy as np
+
+from pandas._libs.internals import BlockPlacement
+from pandas.util._decorators import set_module
+
+from pandas.core.dtypes.generic import ABCSeries
+from pandas.core.dtypes.inference import (
+    is_dict_like,
+    is_list_like,
+)
+
+from pandas.core.arrays import ExtensionArray
+from pandas.core.arrays.datetimelike import DatetimeLikeArrayMixin
+import pandas.core.common as com
+from pandas.core.construction import (
+    ensure_wrapped_if_datetimelike,
+    extract_array,
+    sanitize_array,
+)
+from pandas.core.indexes.api import (
+    Index,
+    default_index,
+    ensure_index,
+)
+from pandas.core.internals.blocks import (
+    ensure_block_shape,
+    new_block_2d,
+)
+from pandas.core.internals.managers import BlockManager
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from pandas._typing import (
+        ArrayLike,
+        Axes,
+    )
+
+    from pandas import DataFrame
+    from pandas.core.internals.blocks import Block
+
+
+class _ColumnBuffer:
+    """
+    Columns of a single numpy dtype, stored as the rows of a 2-D array whose
+    capacity doubles when it is full.
+    """
+
+    __slots__ = ("positions", "values")
+
+    def __init__(self, dtype: np.dtype, nrows: int) -> None:
+        self.values = np.empty((8, nrows), dtype=dtype)
+        self.positions: list[int] = []
+
+    def append(self, position: int, values: np.ndarray) -> None:
+        n = len(self.positions)
+        if n == len(self.values):
+            grown = np.empty((2 * n, self.values.shape[1]), dtype=self.values.dtype)
+            grown[:n] = self.values
+            self.values = grown
+        self.values[n] = values
+        self.positions.append(position)
+
+    def to_block(self) -> Block:
+        values = self.values
+        n = len(self.positions)
+        if n < len(values):
+            # the buffer has never been exposed, so it can be shrunk in place
+            values.resize((n, values.shape[1]), refcheck=False)
+        return new_block_2d(
+            ensure_wrapped_if_datetimelike(values),
+            placement=BlockPlacement(np.array(self.positions, dtype=np.intp)),
+        )
+
+
+@set_module("pandas")
+class DataFrameBuilder:
+    """
+    Build a DataFrame by adding columns one at a time.
+
+    Numpy-backed columns are copied into a preallocated 2-D array per dtype,
+    which grows geometrically as columns are added. :meth:`build` wraps these
+    arrays into the blocks of the DataFrame without copying them again, so
+    the result is consolidated and adding ``n`` columns takes ``O(n)`` time,
+    instead of the ``O(n**2)`` of repeated ``df[name] = values``. Columns
+    backed by an extension array are kept as separate blocks.
+
+    Parameters
+    ----------
+    index : Index or array-like, optional
+        Index of the DataFrame. Defaults to the index of the first column
+        added if it is a Series, else to a RangeIndex with the length of the
+        first column.
+
+    See Also
+    --------
+    DataFrame : Two-dimensional, size-mutable, potentially heterogeneous
+        tabular data.
+    DataFrame.insert : Insert column into DataFrame at specified location.
+    concat : Concatenate pandas objects along a particular axis.
+
+    Notes
+    -----
+    Column names must be unique, and the builder cannot be used anymore once
+    :meth:`build` has been called.
+
+    Examples
+    --------
+    >>> builder = pd.DataFrameBuilder()
+    >>> for i in range(3):
+    ...     builder[f"x{i}"] = np.arange(2) * i
+    >>> builder.add("label", ["a", "b"])
+    >>> builder.build()
+       x0  x1  x2 label
+    0   0   0   0     a
+    1   0   1   2     b
+    """
+
+    def __init__(self, index: Axes | None = None) -> None:
+        self._index: Index | None = None if index is None else ensure_index(index)
+        self._names: list[Hashable] = []
+        self._positions: dict[Hashable, int] = {}
+        self._buffers: dict[np.dtype, _ColumnBuffer] = {}
+        self._blocks: list[Block] = []
+        self._built = False
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: Any) -> bool:
+        return name in self._positions
+
+    def __setitem__(self, name: Hashable, value: Any) -> None:
+        self.add(name, value)
+
+    def add(self, name: Hashable, value: Any) -> None:
+        """
+        Add a column at the end of the DataFrame.
+
+        ``builder.add(name, value)`` is equivalent to ``builder[name] = value``.
+
+        Parameters
+        ----------
+        name : hashable
+            Label of the column, which must not have been added before.
+        value : scalar, array-like or Series
+            Values of the column. A Series is aligned on the index of the
+            builder, a scalar is broadcast to its length.
+
+        Raises
+        ------
+        ValueError
+            If the column already exists, if the length of ``value`` does not
+            match the index, or if :meth:`build` has already been called.
+
+        See Also
+        --------
+        DataFrameBuilder.build : Create the DataFrame.
+
+        Examples
+        --------
+        >>> builder = pd.DataFrameBuilder(index=["a", "b"])
+        >>> builder.add("x", 1.5)
+        >>> builder.add("y", pd.Series({"b": 2, "a": 1}))
+        >>> builder.build()
+             x  y
+        a  1.5  1
+        b  1.5  2
+        """
+        if self._built:
+            raise ValueError("DataFrameBuilder.build has already been called")
+        if name in self._positions:
+            raise ValueError(f"cannot insert {name}, already exists")
+
+        index = self._index
+        if is_dict_like(value) and not isinstance(value, ABCSeries):
+            from pandas import Series
+
+            value = Series(value)
+        if isinstance(value, ABCSeries):
+            if index is None:
+                index = value.index
+            else:
+                value = value.reindex(index)
+        if index is None:
+            if not is_list_like(value):
+                raise ValueError(
+                    "Cannot add a scalar column before the index is known, "
+                    "pass index to DataFrameBuilder"
+                )
+            index = default_index(len(value))
+        elif is_list_like(value):
+            com.require_length_match(value, index)
+
+        # numpy values are copied into a buffer below, existing extension
+        #  arrays have to be copied here so they are not shared with the input
+        copy = isinstance(extract_array(value), ExtensionArray)
+        arr: ArrayLike = sanitize_array(value, index, copy=copy)
+        if isinstance(arr, DatetimeLikeArrayMixin) and isinstance(arr.dtype, np.dtype):
+            # tz-naive datetime64 and timedelta64 are stored as numpy arrays
+            arr = arr._ndarray
+
+        self._index = index
+        position = len(self._names)
+        if isinstance(arr, np.ndarray):
+            buffer = self._buffers.get(arr.dtype)
+            if buffer is None:
+                buffer = self._buffers[arr.dtype] = _ColumnBuffer(arr.dtype, len(arr))
+            buffer.append(position, arr)
+        else:
+            self._blocks.append(
+                new_block_2d(
+                    ensure_block_shape(arr, ndim=2),
+                    placement=BlockPlacement(slice(position, position + 1)),
+                )
+            )
+        self._positions[name] = position
+        self._names.append(name)
+
+    def build(self) -> DataFrame:
+        """
+        Create the DataFrame from the columns added so far.
+
+        Returns
+        -------
+        DataFrame
+            With one block for each numpy dtype, which holds the columns of
+            that dtype in the order they were added.
+
+        Raises
+        ------
+        ValueError
+            If ``build`` has already been called.
+
+        See Also
+        --------
+        DataFrameBuilder.add : Add a column.
+
+        Examples
+        --------
+        >>> builder = pd.DataFrameBuilder()
+        >>> builder["a"] = [1, 2]
+        >>> builder["b"] = [3.0, 4.0]
+        >>> builder.build()
+           a    b
+        0  1  3.0
+        1  2  4.0
+        """
+        from pandas import DataFrame
+
+        if self._built:
+            raise ValueError("DataFrameBuilder.build has already been called")
+        self._built = True
+
+        blocks = [buffer.to_block() for buffer in self._buffers.values()]
+        blocks.extend(self._blocks)
+        self._buffers = {}
+        self._blocks = []
+
+        index = self._index if self._index is not None else default_index(0)
+        columns = Index(self._names) if self._names else default_index(0)
+        mgr = BlockManager(tuple(blocks), [columns, index], verify_integrity=False)
+        return DataFrame._from_mgr(mgr, axes=mgr.axes)
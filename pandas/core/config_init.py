@@ -72,6 +72,35 @@ def use_numba_cb(key: str) -> None:
     numba_.set_use_numba(cf.get_option(key))
 
 
+parse_threads_doc = """
+: int
+    Number of threads used to parse ISO 8601 datetime strings in
+    :func:`to_datetime`. Arrays with fewer than 10,000 strings per thread are
+    parsed with fewer threads, the default is 1
+"""
+
+
+def is_positive_int(value: Any) -> None:
+    if not (isinstance(value, int) and not isinstance(value, bool) and value > 0):
+        raise ValueError("Value must be a positive integer")
+
+
+index_memory_budget_doc = """
+: int or None
+    Largest hash table in bytes an index builds to look up labels. Numeric
+    and datetime-like indexes whose table would be larger look labels up by
+    binary search instead, keeping at most a sorting permutation of their
+    values. Applies to indexes whose lookups are first used after the option
+    is set, the default is None for no limit
+"""
+
+
+def index_memory_budget_cb(key: str) -> None:
+    from pandas._libs import index as libindex
+
+    libindex.set_memory_budget(cf.get_option(key))
+
+
 with cf.config_prefix("compute"):
     cf.register_option(
         "use_bottleneck",
@@ -86,6 +115,14 @@ with cf.config_prefix("compute"):
     cf.register_option(
         "use_numba", False, use_numba_doc, validator=is_bool, cb=use_numba_cb
     )
+    cf.register_option("parse_threads", 1, parse_threads_doc, validator=is_positive_int)
+    cf.register_option(
+        "index_memory_budget",
+        None,
+        index_memory_budget_doc,
+        validator=is_nonnegative_int,
+        cb=index_memory_budget_cb,
+    )
 #
 # options from the "display" namespace
 
@@ -456,6 +493,36 @@ with cf.config_prefix("mode"):
         validator=is_bool,
     )
 
+consolidation_doc = """
+: {'eager', 'threshold', 'never'}
+    When to join the blocks of a DataFrame holding the same dtype without an
+    explicit call to :meth:`DataFrame.compact`. 'eager' consolidates in
+    methods such as :meth:`DataFrame.copy`, 'threshold' only consolidates
+    once a DataFrame holds more than ``mode.consolidation_threshold`` blocks,
+    also when inserting columns, and 'never' only consolidates in
+    :meth:`DataFrame.compact`.
+"""
+
+consolidation_threshold_doc = """
+: int or None
+    Number of blocks above which a DataFrame is consolidated when
+    ``mode.consolidation`` is 'threshold'. None means no limit.
+"""
+
+with cf.config_prefix("mode"):
+    cf.register_option(
+        "consolidation",
+        "eager",
+        consolidation_doc,
+        validator=is_one_of_factory(["eager", "threshold", "never"]),
+    )
+    cf.register_option(
+        "consolidation_threshold",
+        100,
+        consolidation_threshold_doc,
+        validator=is_nonnegative_int,
+    )
+
 
 string_storage_doc = """
 : string
@@ -612,6 +679,33 @@ with cf.config_prefix("io.sql"):
         validator=is_one_of_factory(["auto", "sqlalchemy"]),
     )
 
+# Set up the io.parser specific configuration.
+auto_dictionary_encode_doc = """
+: float or None
+    When set, object and string columns returned by :func:`read_csv` and
+    :func:`read_table` whose ratio of unique values to rows is at most this
+    value are converted to ``category`` dtype. Columns with an explicit
+    ``dtype`` are left unchanged. The default, None, disables the conversion.
+"""
+
+
+def is_valid_unique_ratio(value: Any) -> None:
+    if value is not None and not (
+        isinstance(value, (int, float))
+        and not isinstance(value, bool)
+        and 0 <= value <= 1
+    ):
+        raise ValueError("Value must be None or a number between 0 and 1")
+
+
+with cf.config_prefix("io.parser"):
+    cf.register_option(
+        "auto_dictionary_encode",
+        None,
+        auto_dictionary_encode_doc,
+        validator=is_valid_unique_ratio,
+    )
+
 # --------
 # Plotting
 # ---------
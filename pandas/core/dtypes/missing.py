@@ -651,6 +651,9 @@ def remove_na_arraylike(arr: Series | Index | np.ndarray):
     """
     Return array-like containing only true/non-NaN values, possibly empty.
     """
+    if isinstance(arr, ABCMultiIndex):
+        # tuples are never missing, don't convert the index to them
+        return arr
     if isinstance(arr.dtype, ExtensionDtype):
         return arr[notna(arr)]
     else:
@@ -256,6 +256,9 @@ if TYPE_CHECKING:
     from pandas.core.groupby.generic import DataFrameGroupBy
     from pandas.core.interchange.dataframe_protocol import DataFrame as DataFrameXchg
     from pandas.core.internals.managers import SingleBlockManager
+    from pandas.core.lazy import LazyFrame
+    from pandas.core.lookup import LookupAccessor
+    from pandas.core.reshape.merge import JoinIndex
 
     from pandas.io.formats.style import Styler
 
@@ -1603,6 +1606,91 @@ class DataFrame(NDFrame, OpsMixin):
         # fallback to regular tuples
         return zip(*arrays)
 
+    def iter_records(
+        self,
+        batch_size: int = 1024,
+        as_: Literal["tuple", "dict"] = "tuple",
+        index: bool = False,
+    ) -> Iterator[list[tuple[Any, ...]]] | Iterator[list[dict[Hashable, Any]]]:
+        """
+        Iterate over DataFrame rows as records, in batches.
+
+        The values of each column are converted to Python objects a batch at
+        a time with ``tolist``, so producing a row costs much less than with
+        :meth:`itertuples` or ``to_dict(orient="records")``.
+
+        Parameters
+        ----------
+        batch_size : int, default 1024
+            Maximum number of records in each batch.
+        as_ : {'tuple', 'dict'}, default 'tuple'
+            Whether each record is a tuple of the values or a dict mapping the
+            column labels to the values.
+        index : bool, default False
+            If True, include the index label of each row, as the first element
+            of the tuple or under the key ``"Index"``.
+
+        Returns
+        -------
+        iterator of list
+            An iterator over lists of at most ``batch_size`` records.
+
+        See Also
+        --------
+        DataFrame.itertuples : Iterate over DataFrame rows as namedtuples.
+        DataFrame.to_dict : Convert the DataFrame to a dictionary.
+
+        Notes
+        -----
+        The values are the same as those returned by :meth:`Series.tolist`:
+        Python scalars for numeric columns and pandas scalars such as
+        :class:`Timestamp` for datetime-like columns. The iterator uses the
+        data the DataFrame had when ``iter_records`` was called.
+
+        Examples
+        --------
+        >>> df = pd.DataFrame({"a": [1, 2, 3], "b": [0.5, 1.5, 2.5]})
+        >>> for batch in df.iter_records(batch_size=2):
+        ...     print(batch)
+        [(1, 0.5), (2, 1.5)]
+        [(3, 2.5)]
+        >>> next(df.iter_records(as_="dict", index=True))
+        [{'Index': 0, 'a': 1, 'b': 0.5}, {'Index': 1, 'a': 2, 'b': 1.5}, \
+{'Index': 2, 'a': 3, 'b': 2.5}]
+        """
+        if not lib.is_integer(batch_size) or batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+        if as_ not in ("tuple", "dict"):
+            raise ValueError(f"as_ must be 'tuple' or 'dict', got {as_!r}")
+        if as_ == "dict" and not self.columns.is_unique:
+            warnings.warn(
+                "DataFrame columns are not unique, some columns will be omitted.",
+                UserWarning,
+                stacklevel=find_stack_level(),
+            )
+        # the shallow copy keeps the values of the rows from changing with
+        #  later writes to self
+        return self.copy(deep=False)._iter_records(batch_size, as_ == "dict", index)
+
+    def _iter_records(
+        self, batch_size: int, as_dict: bool, index: bool
+    ) -> Iterator[list]:
+        arrays: list = list(self._iter_column_arrays())
+        keys = self.columns.tolist()
+        if index:
+            arrays.insert(0, self.index)
+            keys.insert(0, "Index")
+        n = len(self)
+        for start in range(0, n, batch_size):
+            stop = min(start + batch_size, n)
+            columns = [arr[start:stop].tolist() for arr in arrays]
+            if as_dict:
+                yield lib.columns_to_dicts(columns, keys, stop - start)
+            elif columns:
+                yield list(zip(*columns))
+            else:
+                yield [()] * (stop - start)
+
     def __len__(self) -> int:
         """
         Returns length of info axis, but here we use the index.
@@ -3664,6 +3752,51 @@ class DataFrame(NDFrame, OpsMixin):
             result = index_memory_usage._append(result)
         return result
 
+    def compact(self) -> DataFrame:
+        """
+        Return a DataFrame storing the columns of each dtype in a single block.
+
+        A DataFrame built column by column, e.g. with ``df[col] = ...`` or
+        :meth:`DataFrame.insert`, keeps each column in a separate block,
+        which makes row-wise and reduction operations slower. Joining the
+        blocks copies the data of the merged columns, which pandas otherwise
+        does when the ``mode.consolidation`` option allows it. Calling
+        ``compact`` controls when this copy happens.
+
+        Returns
+        -------
+        DataFrame
+            A DataFrame with the same data and consolidated blocks.
+
+        See Also
+        --------
+        DataFrame.copy : Make a copy of this object's indices and data.
+        DataFrame.memory_usage : Return the memory usage of each column in bytes.
+
+        Notes
+        -----
+        With ``pd.set_option("mode.consolidation", "never")``, blocks are only
+        joined by this method. ``pandas.api.internals.nblocks`` returns the
+        number of blocks of a DataFrame, and the counters returned by
+        ``pandas.api.internals.consolidation_stats`` show how often blocks were
+        joined and how many bytes were copied.
+
+        Examples
+        --------
+        >>> from pandas.api.internals import nblocks
+        >>> df = pd.DataFrame({"a": [1, 2]})
+        >>> for i in range(3):
+        ...     df[f"b{i}"] = [3.0, 4.0]
+        >>> nblocks(df)
+        4
+        >>> nblocks(df.compact())
+        2
+        """
+        mgr = self._mgr.copy(deep=False).consolidate()
+        return self._constructor_from_mgr(mgr, axes=mgr.axes).__finalize__(
+            self, method="compact"
+        )
+
     def transpose(
         self,
         *args,
@@ -4475,6 +4608,87 @@ class DataFrame(NDFrame, OpsMixin):
     # ----------------------------------------------------------------------
     # Unsorted
 
+    def lazy(self) -> LazyFrame:
+        """
+        Start a lazily evaluated computation on this DataFrame.
+
+        Operations on the returned :class:`pandas.api.typing.LazyFrame` are
+        recorded instead of executed. :meth:`LazyFrame.collect` optimizes the
+        recorded plan, for example by filtering rows before a merge and by
+        dropping unused columns early, and then runs it.
+
+        Returns
+        -------
+        LazyFrame
+            A lazy computation whose source is this DataFrame.
+
+        See Also
+        --------
+        DataFrame.query : Filter rows with a boolean expression.
+        DataFrame.merge : Merge DataFrame objects with a database-style join.
+
+        Examples
+        --------
+        >>> df = pd.DataFrame({"key": [1, 2, 3], "a": [10, 20, 30], "b": [0, 1, 0]})
+        >>> other = pd.DataFrame({"key": [1, 2, 3], "c": ["x", "y", "z"]})
+        >>> lf = df.lazy().merge(other, on="key").filter("a > 10")[["key", "c"]]
+        >>> lf.collect()
+           key  c
+        1    2  y
+        2    3  z
+        """
+        from pandas.core.lazy import LazyFrame
+
+        return LazyFrame._from_frame(self)
+
+    def lookup_accessor(
+        self, columns: Hashable | Sequence[Hashable] | None = None
+    ) -> LookupAccessor:
+        """
+        Return an object for fast repeated label lookups.
+
+        The returned :class:`pandas.api.typing.LookupAccessor` keeps the
+        index hash table and the arrays of the requested columns, so looking
+        up a row label skips the key validation and block lookups done by
+        ``.loc`` and ``.at``. It reflects the DataFrame at the time it was
+        created.
+
+        Parameters
+        ----------
+        columns : label or list of labels, optional
+            Columns to keep. All columns by default.
+
+        Returns
+        -------
+        LookupAccessor
+            An accessor with :meth:`~LookupAccessor.get` for a single row
+            label and :meth:`~LookupAccessor.get_many` for several labels.
+
+        Raises
+        ------
+        InvalidIndexError
+            If the index or one of the requested column labels is not unique.
+
+        See Also
+        --------
+        DataFrame.at : Access a single value for a row/column label pair.
+        Series.lookup_accessor : Fast repeated lookups on a Series.
+
+        Examples
+        --------
+        >>> df = pd.DataFrame(
+        ...     {"price": [1.5, 2.5, 3.5], "qty": [10, 20, 30]}, index=["a", "b", "c"]
+        ... )
+        >>> acc = df.lookup_accessor()
+        >>> acc.get("b", "qty")
+        np.int64(20)
+        >>> acc.get_many(["c", "a"], "price")
+        array([3.5, 1.5])
+        """
+        from pandas.core.lookup import LookupAccessor
+
+        return LookupAccessor(self, columns)
+
     @overload
     def query(
         self, expr: str, *, inplace: Literal[False] = ..., **kwargs
@@ -10256,6 +10470,7 @@ class DataFrame(NDFrame, OpsMixin):
         by_row: Literal[False, "compat"] = "compat",
         engine: Literal["python", "numba"] = "python",
         engine_kwargs: dict[str, bool] | None = None,
+        vectorize: bool = False,
         **kwargs,
     ):
         """
@@ -10345,6 +10560,25 @@ class DataFrame(NDFrame, OpsMixin):
             Pass keyword arguments to the engine.
             This is currently only used by the numba engine,
             see the documentation for the engine argument for more information.
+        vectorize : bool, default False
+            Only supported with ``axis=1``, ``raw=False`` and the python
+            engine. If True, ``func`` is first called once with the whole
+            DataFrame instead of once per row, so that a function written
+            with element-wise operations on row fields, such as
+            ``lambda row: row["A"] + 2 * row["B"]``, is evaluated on entire
+            columns. The result is used if it is a Series aligned with the
+            index (or an array with one value per row) whose dtype and values
+            agree with ``func`` applied to a sample of rows. Otherwise, for
+            instance when ``func`` raises or uses Python control flow on the
+            row values, ``func`` is applied to each row as usual.
+
+            Only pass ``vectorize=True`` for functions that give the same
+            results on whole columns as on single rows: the sample cannot
+            detect every difference, such as integer division by zero, which
+            gives ``inf`` on a column but ``0`` on a row of integers.
+
+            .. versionadded:: 3.0.0
+
         **kwargs
             Additional keyword arguments to pass as keywords arguments to
             `func`.
@@ -10435,6 +10669,15 @@ class DataFrame(NDFrame, OpsMixin):
         0  1  2
         1  1  2
         2  1  2
+
+        With ``vectorize=True``, a function of the row fields is evaluated
+        on whole columns when possible
+
+        >>> df.apply(lambda row: row["A"] + 2 * row["B"], axis=1, vectorize=True)
+        0    22
+        1    22
+        2    22
+        dtype: int64
         """
         from pandas.core.apply import frame_apply
 
@@ -10447,6 +10690,7 @@ class DataFrame(NDFrame, OpsMixin):
             by_row=by_row,
             engine=engine,
             engine_kwargs=engine_kwargs,
+            vectorize=vectorize,
             args=args,
             kwargs=kwargs,
         )
@@ -10847,7 +11091,7 @@ class DataFrame(NDFrame, OpsMixin):
     @Appender(_merge_doc, indents=2)
     def merge(
         self,
-        right: DataFrame | Series,
+        right: DataFrame | Series | JoinIndex,
         how: MergeHow = "inner",
         on: IndexLabel | AnyArrayLike | None = None,
         left_on: IndexLabel | AnyArrayLike | None = None,
@@ -10879,6 +11123,54 @@ class DataFrame(NDFrame, OpsMixin):
             validate=validate,
         )
 
+    def build_join_index(self, on: IndexLabel) -> JoinIndex:
+        """
+        Build a reusable hashtable over join keys of the DataFrame.
+
+        The returned ``JoinIndex`` can be passed as the right object to
+        :func:`merge` and :meth:`DataFrame.merge`. Inner and left joins
+        against it only look up the keys of the left object in the prebuilt
+        hashtable, which avoids rebuilding it when the same DataFrame is
+        joined many times, e.g. when merging chunks of a larger table.
+
+        The index reflects the DataFrame at the time it is built; build a
+        new one after modifying the key columns.
+
+        Parameters
+        ----------
+        on : label or list of labels
+            Column or index level names to build the index for.
+
+        Returns
+        -------
+        JoinIndex
+            Prebuilt join index to pass to :func:`merge`.
+
+        See Also
+        --------
+        DataFrame.merge : Merge DataFrame or named Series objects with a
+            database-style join.
+
+        Examples
+        --------
+        >>> dim = pd.DataFrame({"key": ["a", "b", "c"], "label": [1, 2, 3]})
+        >>> dim_index = dim.build_join_index(on="key")
+        >>> for chunk in [
+        ...     pd.DataFrame({"key": ["b", "a"]}),
+        ...     pd.DataFrame({"key": ["c", "d"]}),
+        ... ]:
+        ...     print(chunk.merge(dim_index, how="left"))
+          key  label
+        0   b      2
+        1   a      1
+          key  label
+        0   c    3.0
+        1   d    NaN
+        """
+        from pandas.core.reshape.merge import JoinIndex
+
+        return JoinIndex(self, on)
+
     def round(
         self, decimals: int | dict[IndexLabel, int] | Series = 0, *args, **kwargs
     ) -> DataFrame:
@@ -6193,6 +6193,21 @@ class NDFrame(PandasObject, indexing.IndexingMixin):
             self
         )
 
+    @final
+    def _maybe_consolidate(self) -> Self:
+        """
+        Consolidate the internals if the ``mode.consolidation`` option allows
+        consolidating without an explicit request.
+
+        Returns
+        -------
+        same type as caller
+        """
+        cons_data = self._mgr.maybe_consolidate()
+        return self._constructor_from_mgr(cons_data, axes=cons_data.axes).__finalize__(
+            self
+        )
+
     @final
     @property
     def _is_mixed_type(self) -> bool:
@@ -215,7 +215,14 @@ class SeriesGroupBy(GroupBy[Series]):
     """
     )
 
-    def apply(self, func, *args, **kwargs) -> Series:
+    def apply(
+        self,
+        func,
+        *args,
+        engine: Literal["python", "processes"] | None = None,
+        engine_kwargs: dict[str, Any] | None = None,
+        **kwargs,
+    ) -> Series:
         """
         Apply function ``func`` group-wise and combine the results together.
 
@@ -241,6 +248,23 @@ class SeriesGroupBy(GroupBy[Series]):
         *args : tuple
             Optional positional arguments to pass to ``func``.
 
+        engine : {'python', 'processes', None}, default None
+            * ``'python'`` or ``None`` : call ``func`` on each group in the
+              current process.
+            * ``'processes'`` : call ``func`` in a pool of worker processes.
+              Each worker receives the data once, and the groups are
+              dispatched in batches holding similar numbers of rows. ``func``
+              and its results must be picklable.
+
+            .. versionadded:: 3.0.0
+
+        engine_kwargs : dict, optional
+            For the ``'processes'`` engine, ``max_workers`` (default: number
+            of CPUs) and ``mp_context`` are passed to
+            :class:`concurrent.futures.ProcessPoolExecutor`.
+
+            .. versionadded:: 3.0.0
+
         **kwargs : dict
             Optional keyword arguments to pass to ``func``.
 
@@ -323,7 +347,9 @@ class SeriesGroupBy(GroupBy[Series]):
         b    0
         dtype: int64
         """
-        return super().apply(func, *args, **kwargs)
+        return super().apply(
+            func, *args, engine=engine, engine_kwargs=engine_kwargs, **kwargs
+        )
 
     def aggregate(self, func=None, *args, engine=None, engine_kwargs=None, **kwargs):
         """
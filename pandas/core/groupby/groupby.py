@@ -25,6 +25,7 @@ from functools import (
 from textwrap import dedent
 from typing import (
     TYPE_CHECKING,
+    Any,
     Literal,
     TypeVar,
     Union,
@@ -1277,7 +1278,7 @@ class GroupBy(BaseGroupBy[NDFrameT]):
             # `not self.as_index` is only relevant for DataFrameGroupBy,
             #   enforced in __init__
             result = self._insert_inaxis_grouper(result, qs=qs)
-            result = result._consolidate()
+            result = result._maybe_consolidate()
             result.index = default_index(len(result))
 
         else:
@@ -1455,7 +1456,15 @@ class GroupBy(BaseGroupBy[NDFrameT]):
     # -----------------------------------------------------------------
     # apply/agg/transform
 
-    def apply(self, func, *args, include_groups: bool = False, **kwargs) -> NDFrameT:
+    def apply(
+        self,
+        func,
+        *args,
+        include_groups: bool = False,
+        engine: Literal["python", "processes"] | None = None,
+        engine_kwargs: dict[str, Any] | None = None,
+        **kwargs,
+    ) -> NDFrameT:
         """
         Apply function ``func`` group-wise and combine the results together.
 
@@ -1493,6 +1502,25 @@ class GroupBy(BaseGroupBy[NDFrameT]):
 
             The default changed from True to False, and True is no longer allowed.
 
+        engine : {'python', 'processes', None}, default None
+            * ``'python'`` or ``None`` : call ``func`` on each group in the
+              current process.
+            * ``'processes'`` : call ``func`` in a pool of worker processes.
+              Each worker receives the data once, and the groups are
+              dispatched in batches holding similar numbers of rows. This
+              can speed up slow functions on many-core machines, but ``func``
+              and its results must be picklable, and ``func`` must not rely
+              on state modified in the calling process.
+
+            .. versionadded:: 3.0.0
+
+        engine_kwargs : dict, optional
+            For the ``'processes'`` engine, ``max_workers`` (default: number
+            of CPUs) and ``mp_context`` are passed to
+            :class:`concurrent.futures.ProcessPoolExecutor`.
+
+            .. versionadded:: 3.0.0
+
         **kwargs : dict
             Optional keyword arguments to pass to ``func``.
 
@@ -1597,7 +1625,17 @@ class GroupBy(BaseGroupBy[NDFrameT]):
         """
         if include_groups:
             raise ValueError("include_groups=True is no longer allowed.")
+        if engine not in (None, "python", "processes"):
+            raise ValueError(
+                f"engine must be one of 'python' or 'processes', got {engine!r}"
+            )
+        if engine_kwargs and engine != "processes":
+            raise ValueError("engine_kwargs is only supported with engine='processes'")
         if isinstance(func, str):
+            if engine == "processes":
+                raise NotImplementedError(
+                    "engine='processes' is not supported with a string func"
+                )
             if hasattr(self, func):
                 res = getattr(self, func)
                 if callable(res):
@@ -1623,6 +1661,13 @@ class GroupBy(BaseGroupBy[NDFrameT]):
         else:
             f = func
 
+        if engine == "processes":
+            data = self._obj_with_exclusions
+            values, mutated = self._grouper.apply_groupwise_processes(
+                f, data, **(engine_kwargs or {})
+            )
+            return self._wrap_applied_output(data, values, mutated)
+
         return self._python_apply_general(f, self._obj_with_exclusions)
 
     @final
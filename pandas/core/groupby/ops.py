@@ -9,9 +9,12 @@ are contained *in* the SeriesGroupBy and DataFrameGroupBy objects.
 from __future__ import annotations
 
 import collections
+from concurrent.futures import ProcessPoolExecutor
 import functools
+import os
 from typing import (
     TYPE_CHECKING,
+    Any,
     Generic,
     final,
 )
@@ -75,6 +78,8 @@ if TYPE_CHECKING:
         Iterator,
     )
 
+    from multiprocessing.context import BaseContext
+
     from pandas.core.generic import NDFrame
 
 
@@ -1033,6 +1038,60 @@ class BaseGrouper:
 
         return result_values, mutated
 
+    @final
+    def apply_groupwise_processes(
+        self,
+        f: Callable,
+        data: DataFrame | Series,
+        max_workers: int | None = None,
+        mp_context: BaseContext | None = None,
+    ) -> tuple[list, bool]:
+        """
+        Equivalent of apply_groupwise that calls ``f`` in a pool of processes.
+
+        The sorted data is handed to each worker once, through the pool
+        initializer, so it is inherited rather than pickled when processes
+        are forked. Tasks only carry a range of group positions, and the
+        ranges are chosen to hold similar numbers of rows.
+        """
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
+        if self.ngroups == 0:
+            return self.apply_groupwise(f, data)
+
+        splitter = self._get_splitter(data)
+        starts, ends = lib.generate_slices(splitter._slabels, splitter.ngroups)
+        nworkers = max_workers or os.cpu_count() or 1
+
+        # split the groups into contiguous batches of about the same number
+        #  of rows, several per worker so that uneven groups balance out
+        sizes = np.cumsum(ends - starts)
+        nbatches = min(4 * nworkers, self.ngroups)
+        targets = sizes[-1] * np.arange(1, nbatches) / nbatches
+        bounds = np.unique(
+            np.concatenate([[0], np.searchsorted(sizes, targets) + 1, [self.ngroups]])
+        )
+
+        with ProcessPoolExecutor(
+            max_workers=nworkers,
+            mp_context=mp_context,
+            initializer=_init_apply_worker,
+            initargs=(f, splitter, self.result_index, starts, ends),
+        ) as executor:
+            futures = [
+                executor.submit(_apply_batch, start, stop)
+                for start, stop in zip(bounds[:-1], bounds[1:])
+            ]
+            batches = [future.result() for future in futures]
+
+        result_values = []
+        mutated = False
+        for batch in batches:
+            for res, indexed_like in batch:
+                mutated = mutated or not indexed_like
+                result_values.append(res)
+        return result_values, mutated
+
     # ------------------------------------------------------------
     # Methods for sorting subsets of our GroupBy's object
 
@@ -1208,6 +1267,39 @@ def _is_indexed_like(obj, axes) -> bool:
     return False
 
 
+# State of a worker process of BaseGrouper.apply_groupwise_processes
+_apply_worker_state: tuple | None = None
+
+
+def _init_apply_worker(
+    f: Callable,
+    splitter: DataSplitter,
+    group_keys: Index,
+    starts: npt.NDArray[np.int64],
+    ends: npt.NDArray[np.int64],
+) -> None:
+    global _apply_worker_state
+    _apply_worker_state = (f, splitter, group_keys, starts, ends)
+
+
+def _apply_batch(start: int, stop: int) -> list[tuple[Any, bool]]:
+    """
+    Apply the function to the groups at positions ``start`` to ``stop``,
+    returning each result with whether it is indexed like its group.
+    """
+    assert _apply_worker_state is not None
+    f, splitter, group_keys, starts, ends = _apply_worker_state
+    sdata = splitter._sorted_data
+    results = []
+    for i in range(start, stop):
+        group = splitter._chop(sdata, slice(starts[i], ends[i]))
+        object.__setattr__(group, "name", group_keys[i])
+        group_axes = group.axes
+        res = f(group)
+        results.append((res, _is_indexed_like(res, group_axes)))
+    return results
+
+
 # ----------------------------------------------------------------------
 # Splitting / application
 
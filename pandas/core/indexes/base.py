@@ -885,6 +885,21 @@ class Index(IndexOpsMixin, PandasObject):
         # "ndarray[Any, Any]"; expected "ExtensionArray"
         return self._engine_type(target_values)  # type: ignore[arg-type]
 
+    @final
+    def _extend_engine(self, result: Index) -> Index:
+        """
+        Set up the engine of ``result``, whose values start with ours, from our
+        engine instead of from scratch, if we have built one.
+
+        This keeps lookups cheap when an index is grown by appending to it.
+        """
+        engine = self._cache.get("_engine")
+        if isinstance(engine, libindex.IndexEngine) and result.dtype == self.dtype:
+            new_engine = result._engine
+            if isinstance(new_engine, libindex.IndexEngine):
+                new_engine.extend_from(engine)
+        return result
+
     @final
     @cache_readonly
     def _dir_additions_for_owner(self) -> set[str_t]:
@@ -5319,7 +5334,7 @@ class Index(IndexOpsMixin, PandasObject):
         names = {obj.name for obj in to_concat}
         name = None if len(names) > 1 else self.name
 
-        return self._concat(to_concat, name)
+        return self._extend_engine(self._concat(to_concat, name))
 
     def _concat(self, to_concat: list[Index], name: Hashable) -> Index:
         """
@@ -6920,7 +6935,10 @@ class Index(IndexOpsMixin, PandasObject):
         try:
             if isinstance(arr, ExtensionArray):
                 res_values = arr.insert(loc, item)
-                return type(self)._simple_new(res_values, name=self.name)
+                out = type(self)._simple_new(res_values, name=self.name)
+                if loc == len(self):
+                    self._extend_engine(out)
+                return out
             else:
                 item = self._validate_fill_value(item)
         except (TypeError, ValueError, LossySetitemError):
@@ -6951,6 +6969,8 @@ class Index(IndexOpsMixin, PandasObject):
 
         # GH#51363 stopped doing dtype inference here
         out = Index(new_values, dtype=new_values.dtype, name=self.name)
+        if loc == len(self):
+            self._extend_engine(out)
         return out
 
     def drop(
@@ -10,6 +10,7 @@ from collections.abc import (
 )
 from functools import wraps
 from sys import getsizeof
+import threading
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -24,6 +25,7 @@ from pandas._config import get_option
 
 from pandas._libs import (
     algos as libalgos,
+    hashtable as libhashtable,
     index as libindex,
     lib,
 )
@@ -120,6 +122,8 @@ if TYPE_CHECKING:
     )
 
 _index_doc_kwargs = dict(ibase._index_doc_kwargs)
+# guards the computation of the levels and codes of deferred MultiIndexes
+_deferred_lock = threading.RLock()
 _index_doc_kwargs.update(
     {"klass": "MultiIndex", "target_klass": "MultiIndex or list of tuples"}
 )
@@ -165,6 +169,86 @@ class MultiIndexUInt8Engine(libindex.BaseMultiIndexCodesEngine, libindex.UInt8En
     _codes_dtype = "uint8"
 
 
+class MultiIndexRankedUInt64Engine(
+    libindex.BaseMultiIndexCodesEngine, libindex.UInt64Engine
+):
+    """Manages a MultiIndex by mapping label combinations to positive integers.
+
+    This class manages the cases in which the number of possible label
+    combinations overflows the 64 bits integers. Levels are packed as in
+    MultiIndexUInt64Engine until the next level would overflow, then the
+    packed leading levels are replaced by their rank among the combinations
+    present in the index, which needs at most as many bits as the length of
+    the index, before packing the following levels.
+    """
+
+    _base = libindex.UInt64Engine
+    _codes_dtype = "uint64"
+
+    def __init__(self, levels, labels, offsets) -> None:
+        self._level_bits = [
+            int(np.ceil(np.log2(len(level) + libindex.multiindex_nulls_shift)))
+            for level in levels
+        ]
+        # rank of each packed combination of leading levels in the index, for
+        #  each rank step, set by _codes_to_ints on the codes of the index
+        self._rank_tables: list[libhashtable.UInt64HashTable] | None = None
+        super().__init__(levels, labels, offsets)
+
+    def _codes_to_ints(self, codes: np.ndarray) -> np.ndarray:
+        if codes.ndim == 1:
+            # Single key, after the codes of the index
+            return self._key_codes_to_int(codes)
+
+        codes = codes.astype(np.uint64, copy=False)
+        building = self._rank_tables is None
+        tables = [] if self._rank_tables is None else self._rank_tables
+
+        result = codes[:, 0].copy()
+        used = self._level_bits[0]
+        step = 0
+        for i in range(1, codes.shape[1]):
+            bits = self._level_bits[i]
+            if used + bits > 64:
+                if building:
+                    ranks, uniques = algos.factorize(result, sort=True)
+                    table = libhashtable.UInt64HashTable(len(uniques))
+                    table.map_locations(uniques)
+                    tables.append(table)
+                else:
+                    # combinations not in the index get -1
+                    table = tables[step]
+                    ranks = table.lookup(result)
+                step += 1
+                # ranks start at 1 to keep 0 for missing combinations
+                result = (ranks + 1).astype(np.uint64)
+                used = len(table).bit_length()
+            result <<= np.uint64(bits)
+            result |= codes[:, i]
+            used += bits
+
+        self._rank_tables = tables
+        return result
+
+    def _key_codes_to_int(self, codes: np.ndarray) -> np.uint64:
+        tables = iter(self._rank_tables or [])
+        result = int(codes[0])
+        used = self._level_bits[0]
+        for i in range(1, len(codes)):
+            bits = self._level_bits[i]
+            if used + bits > 64:
+                table = next(tables)
+                try:
+                    rank = table.get_item(result)
+                except KeyError:
+                    rank = -1
+                result = rank + 1
+                used = len(table).bit_length()
+            result = (result << bits) | int(codes[i])
+            used += bits
+        return np.uint64(result)
+
+
 class MultiIndexPyIntEngine(libindex.BaseMultiIndexCodesEngine, libindex.ObjectEngine):
     """Manages a MultiIndex by mapping label combinations to positive integers.
 
@@ -288,8 +372,10 @@ class MultiIndex(Index):
     # initialize to zero-length tuples to make everything work
     _typ = "multiindex"
     _names: list[Hashable | None] = []
-    _levels = FrozenList()
-    _codes = FrozenList()
+    _levels: FrozenList
+    _codes: FrozenList
+    # set by _new_deferred until the levels and codes are computed
+    _deferred: tuple[Callable[[], tuple[list, list]], int, int]
     _comparables = ["names"]
 
     sortorder: int | None
@@ -343,6 +429,54 @@ class MultiIndex(Index):
 
         return result
 
+    @classmethod
+    def _new_deferred(
+        cls,
+        make_levels_codes: Callable[[], tuple[list, list]],
+        nlevels: int,
+        length: int,
+        sortorder=None,
+        names=None,
+    ) -> Self:
+        """
+        Create a MultiIndex whose levels and codes are computed on first use.
+
+        ``make_levels_codes`` is called without arguments the first time
+        ``_levels`` or ``_codes`` is accessed and must return valid levels and
+        codes, which are not verified.
+        """
+        result = object.__new__(cls)
+        result._cache = {}
+        result._deferred = (make_levels_codes, nlevels, length)
+        result._names = [None] * nlevels
+        if names is not None:
+            result._set_names(names)
+        result.sortorder = None if sortorder is None else int(sortorder)
+        result._reset_identity()
+        result._references = None
+        return result
+
+    if not TYPE_CHECKING:
+        # hidden from type checkers, which would otherwise accept any attribute
+
+        def __getattr__(self, name: str):
+            # only reached for attributes that are not set, which for _levels
+            #  and _codes means the index was created by _new_deferred
+            if name in ("_levels", "_codes") and "_deferred" in self.__dict__:
+                with _deferred_lock:
+                    # another thread may have computed them in the meantime
+                    deferred = self.__dict__.get("_deferred")
+                    if deferred is not None:
+                        levels, codes = deferred[0]()
+                        self._set_levels(levels, validate=False)
+                        self._set_codes(codes, validate=False)
+                        # only drop the thunk once both are set, so that other
+                        #  threads and a retry after an error still find it
+                        del self.__dict__["_deferred"]
+                return self.__dict__[name]
+            # raise the original error, e.g. from an accessor
+            return object.__getattribute__(self, name)
+
     def _validate_codes(self, level: Index, code: np.ndarray) -> np.ndarray:
         """
         Reassign code values as -1 if their corresponding levels are NaN.
@@ -501,10 +635,35 @@ class MultiIndex(Index):
             if len(arrays[i]) != len(arrays[i - 1]):
                 raise ValueError("all arrays must be same length")
 
-        codes, levels = factorize_from_iterables(arrays)
         if names is lib.no_default:
             names = [getattr(arr, "name", None) for arr in arrays]
 
+        if len(arrays) and all(
+            isinstance(arr, (Index, ABCSeries))
+            and not isinstance(arr, MultiIndex)
+            and not is_object_dtype(arr.dtype)
+            for arr in arrays
+        ):
+            # factorizing these cannot fail, so defer it until the codes are
+            #  needed. A shallow copy keeps later writes to a Series out.
+            pinned = [
+                arr.copy(deep=False) if isinstance(arr, ABCSeries) else arr
+                for arr in arrays
+            ]
+
+            def make_levels_codes():
+                codes, levels = factorize_from_iterables(pinned)
+                return levels, codes
+
+            return cls._new_deferred(
+                make_levels_codes,
+                len(arrays),
+                len(arrays[0]),
+                sortorder=sortorder,
+                names=names,
+            )
+
+        codes, levels = factorize_from_iterables(arrays)
         return cls(
             levels=levels,
             codes=codes,
@@ -648,6 +807,21 @@ class MultiIndex(Index):
         if names is lib.no_default:
             names = [getattr(it, "name", None) for it in iterables]
 
+        if sortorder is None and len(codes):
+            # factorized levels are valid, so the cartesian product of the
+            #  codes is only computed once the codes are needed
+
+            def make_levels_codes():
+                # codes are all ndarrays, so cartesian_product is lossless
+                return levels, cartesian_product(codes)
+
+            sizes = np.cumprod([len(code) for code in codes], dtype=np.intp)
+            if np.any(sizes < 0):
+                raise ValueError("Product space too large to allocate arrays!")
+            return cls._new_deferred(
+                make_levels_codes, len(levels), int(sizes[-1]), names=names
+            )
+
         # codes are all ndarrays, so cartesian_product is lossless
         codes = cartesian_product(codes)
         return cls(levels, codes, sortorder=sortorder, names=names)
@@ -803,6 +977,9 @@ class MultiIndex(Index):
         return Series([level.dtype for level in self.levels], index=Index(names))
 
     def __len__(self) -> int:
+        deferred = self.__dict__.get("_deferred")
+        if deferred is not None:
+            return deferred[2]
         return len(self.codes[0])
 
     @property
@@ -1067,6 +1244,9 @@ class MultiIndex(Index):
         >>> mi.nlevels
         3
         """
+        deferred = self.__dict__.get("_deferred")
+        if deferred is not None:
+            return deferred[1]
         return len(self._levels)
 
     @property
@@ -1267,7 +1447,12 @@ class MultiIndex(Index):
 
         # Check the total number of bits needed for our representation:
         if lev_bits[0] > 64:
-            # The levels would overflow a 64 bit uint - use Python integers:
+            # The levels would overflow a 64 bit uint - rank the leading
+            # levels when they overflow, unless a rank and a level can
+            # still overflow:
+            if sizes.max() + (len(self) + 1).bit_length() <= 64:
+                return MultiIndexRankedUInt64Engine(self.levels, self.codes, offsets)
+            # - use Python integers:
             return MultiIndexPyIntEngine(self.levels, self.codes, offsets)
         if lev_bits[0] > 32:
             # The levels would overflow a 32 bit uint - use uint64
@@ -2881,8 +3066,38 @@ class MultiIndex(Index):
             self._raise_if_missing(key, indexer, axis_name)
             return self[indexer], indexer
 
+        if len(keyarr) and 1 < len(keyarr[0]) < self.nlevels:
+            # partial keys for the first levels
+            nkey = len(keyarr[0])
+            if isinstance(keyarr, MultiIndex) or all(
+                isinstance(k, tuple) and len(k) == nkey for k in keyarr
+            ):
+                indexer = self._get_indexer_partial(keyarr, nkey, key, axis_name)
+                return self[indexer], indexer
+
         return super()._get_indexer_strict(key, axis_name)
 
+    def _get_indexer_partial(
+        self, keyarr, nkey: int, key, axis_name: str
+    ) -> npt.NDArray[np.intp]:
+        """
+        Locations of the labels starting with each of the partial keys in
+        ``keyarr`` (of length ``nkey``), in the order of the keys.
+        """
+        if isinstance(keyarr, MultiIndex):
+            target = keyarr
+        else:
+            target = MultiIndex.from_tuples(keyarr)
+        head = self._drop_level_numbers(list(range(self.nlevels - 1, nkey - 1, -1)))
+        indexer, missing = head.get_indexer_non_unique(target)
+
+        if len(missing):
+            if len(missing) == len(target):
+                raise KeyError(f"None of [{key}] are in the [{axis_name}]")
+            not_found = list(target[missing].unique())
+            raise KeyError(f"{not_found} not in index")
+        return indexer
+
     def _raise_if_missing(self, key, indexer, axis_name: str) -> None:
         keyarr = key
         if not isinstance(key, Index):
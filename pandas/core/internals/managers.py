@@ -15,6 +15,7 @@ from typing import (
     final,
 )
 import warnings
+import weakref
 
 import numpy as np
 
@@ -63,7 +64,11 @@ from pandas.core.dtypes.missing import (
 )
 
 import pandas.core.algorithms as algos
-from pandas.core.arrays import DatetimeArray
+from pandas.core.arrays import (
+    ArrowExtensionArray,
+    BaseMaskedArray,
+    DatetimeArray,
+)
 from pandas.core.arrays._mixins import NDArrayBackedExtensionArray
 from pandas.core.base import PandasObject
 from pandas.core.construction import (
@@ -527,7 +532,7 @@ class BaseBlockManager(PandasObject):
             inplace=inplace,
             regex=regex,
         )
-        bm._consolidate_inplace()
+        bm._maybe_consolidate_inplace()
         return bm
 
     def interpolate(self, inplace: bool, **kwargs) -> Self:
@@ -726,7 +731,7 @@ class BaseBlockManager(PandasObject):
                 res._blklocs = self._blklocs.copy()
 
         if deep:
-            res._consolidate_inplace()
+            res._maybe_consolidate_inplace()
         return res
 
     def is_consolidated(self) -> bool:
@@ -748,9 +753,23 @@ class BaseBlockManager(PandasObject):
         bm._consolidate_inplace()
         return bm
 
+    def maybe_consolidate(self) -> Self:
+        """
+        Join together blocks having same dtype if the ``mode.consolidation``
+        option allows consolidating without an explicit request.
+
+        Returns
+        -------
+        y : BlockManager
+        """
+        return self
+
     def _consolidate_inplace(self) -> None:
         return
 
+    def _maybe_consolidate_inplace(self) -> None:
+        return
+
     @final
     def reindex_axis(
         self,
@@ -1501,8 +1520,13 @@ class BlockManager(libinternals.BlockManager, BaseBlockManager):
 
         self._known_consolidated = False
 
-        if (
-            get_option("performance_warnings")
+        policy = get_option("mode.consolidation")
+        if policy == "threshold":
+            if _implicit_consolidation_allowed(len(self.blocks)):
+                self._consolidate_inplace()
+        elif (
+            policy == "eager"
+            and get_option("performance_warnings")
             and sum(not block.is_extension for block in self.blocks) > 100
         ):
             warnings.warn(
@@ -1904,6 +1928,19 @@ class BlockManager(libinternals.BlockManager, BaseBlockManager):
             self._known_consolidated = True
             self._rebuild_blknos_and_blklocs()
 
+    def maybe_consolidate(self) -> Self:
+        if self.is_consolidated() or not _implicit_consolidation_allowed(
+            len(self.blocks)
+        ):
+            return self
+        return self.consolidate()
+
+    def _maybe_consolidate_inplace(self) -> None:
+        if not self.is_consolidated() and _implicit_consolidation_allowed(
+            len(self.blocks)
+        ):
+            self._consolidate_inplace()
+
     # ----------------------------------------------------------------
     # Concatenation
 
@@ -2123,7 +2160,9 @@ class SingleBlockManager(BaseBlockManager):
 
     def external_values(self):
         """The array that Series.values returns"""
-        return self._block.external_values()
+        values = self._block.external_values()
+        _mark_values_exposed(values)
+        return values
 
     def internal_values(self):
         """The array that Series._values returns"""
@@ -2131,7 +2170,9 @@ class SingleBlockManager(BaseBlockManager):
 
     def array_values(self) -> ExtensionArray:
         """The array that Series.array returns"""
-        return self._block.array_values
+        values = self._block.array_values
+        _mark_values_exposed(values)
+        return values
 
     def get_numeric_data(self) -> Self:
         if self._block.is_numeric:
@@ -2168,6 +2209,7 @@ class SingleBlockManager(BaseBlockManager):
             # NumPy 1.25 deprecation: https://github.com/numpy/numpy/pull/10615
             value = value[0, ...]
 
+        self._reset_cache("_stats")
         arr[indexer] = value
 
     def idelete(self, indexer) -> SingleBlockManager:
@@ -2201,6 +2243,55 @@ class SingleBlockManager(BaseBlockManager):
         # which handles CoW by setting the refs manually if necessary
         self.blocks[0].values = values
         self.blocks[0]._mgr_locs = BlockPlacement(slice(len(values)))
+        self._reset_cache("_stats")
+
+    # ----------------------------------------------------------------
+    # Cached statistics
+
+    @property
+    def _stats(self) -> dict[Hashable, Any]:
+        # stored in _cache so that every _reset_cache() call also clears it
+        try:
+            cache = self._cache
+        except AttributeError:
+            cache = self._cache = {}
+        return cache.setdefault("_stats", {})
+
+    def cached_stat(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        Return a statistic of the values, computing it with ``func`` once.
+
+        Operations that modify the values create a new manager (and thus
+        start with an empty cache), except ``setitem_inplace`` and
+        ``set_values`` which clear the cache. With Copy-on-Write, values
+        shared with another object are copied before they are modified
+        through pandas. Values that were handed out as a writable array
+        (e.g. by ``Series.array``) can be modified behind our back, so their
+        statistics are not cached.
+        """
+        if _values_exposed(self._block.values):
+            return func()
+        stats = self._stats
+        try:
+            return stats[key]
+        except KeyError:
+            result = stats[key] = func()
+            return result
+
+    def known_stat(self, key: Hashable) -> Any | None:
+        """
+        Return a cached statistic without computing it, None if unknown.
+        """
+        if _values_exposed(self._block.values):
+            return None
+        return self._stats.get(key)
+
+    def record_stat(self, key: Hashable, value: Any) -> None:
+        """
+        Store a statistic that is known from the way the values were built.
+        """
+        if not _values_exposed(self._block.values):
+            self._stats[key] = value
 
     def _equal_values(self, other: Self) -> bool:
         """
@@ -2223,6 +2314,71 @@ class SingleBlockManager(BaseBlockManager):
         return mgr
 
 
+# --------------------------------------------------------------------
+# Values handed out to users
+
+# Arrays owning the memory of values that were returned as writable arrays,
+#  keyed by id. Writes to them bypass the managers, so statistics of values
+#  backed by them are not cached (see SingleBlockManager.cached_stat).
+_exposed_arrays: dict[int, weakref.ReferenceType[np.ndarray]] = {}
+
+
+def _value_roots(values: ArrayLike) -> list[np.ndarray] | None:
+    """
+    Return the arrays owning the memory of ``values``, None if unknown.
+
+    Views of the same memory, such as the values of shallow copies, have the
+    same roots.
+    """
+    if isinstance(values, np.ndarray):
+        arrays = [values]
+    elif isinstance(values, NDArrayBackedExtensionArray):
+        arrays = [values._ndarray]
+    elif isinstance(values, BaseMaskedArray):
+        arrays = [values._data, values._mask]
+    elif isinstance(values, ArrowExtensionArray):
+        # pyarrow arrays are immutable
+        arrays = []
+    else:
+        return None
+
+    roots = []
+    for arr in arrays:
+        while isinstance(arr.base, np.ndarray):
+            arr = arr.base
+        roots.append(arr)
+    return roots
+
+
+def _mark_values_exposed(values: ArrayLike) -> None:
+    """
+    Record that ``values`` was handed out to the user, if it is writable.
+    """
+    if isinstance(values, np.ndarray) and not values.flags.writeable:
+        return
+    for root in _value_roots(values) or []:
+        key = id(root)
+        _exposed_arrays[key] = weakref.ref(
+            root, lambda _, key=key: _exposed_arrays.pop(key, None)
+        )
+
+
+def _values_exposed(values: ArrayLike) -> bool:
+    """
+    Whether ``values`` may have been modified without going through pandas.
+    """
+    roots = _value_roots(values)
+    if roots is None:
+        return True
+    if not _exposed_arrays:
+        return False
+    for root in roots:
+        ref = _exposed_arrays.get(id(root))
+        if ref is not None and ref() is root:
+            return True
+    return False
+
+
 # --------------------------------------------------------------------
 # Constructor Helpers
 
@@ -2391,6 +2547,25 @@ def _stack_arrays(tuples, dtype: np.dtype):
     return stacked, placement
 
 
+# Counters of the consolidations done in this process, exposed through
+#  pandas.api.internals.consolidation_stats
+_consolidation_stats = {"consolidations": 0, "blocks_merged": 0, "bytes_copied": 0}
+
+
+def _implicit_consolidation_allowed(nblocks: int) -> bool:
+    """
+    Whether the ``mode.consolidation`` option allows consolidating a manager
+    with ``nblocks`` blocks without an explicit request.
+    """
+    policy = get_option("mode.consolidation")
+    if policy == "eager":
+        return True
+    elif policy == "never":
+        return False
+    threshold = get_option("mode.consolidation_threshold")
+    return threshold is not None and nblocks > threshold
+
+
 def _consolidate(blocks: tuple[Block, ...]) -> tuple[Block, ...]:
     """
     Merge blocks having same dtype, exclude non-consolidating blocks
@@ -2401,10 +2576,15 @@ def _consolidate(blocks: tuple[Block, ...]) -> tuple[Block, ...]:
 
     new_blocks: list[Block] = []
     for (_can_consolidate, dtype), group_blocks in grouper:
-        merged_blocks, _ = _merge_blocks(
-            list(group_blocks), dtype=dtype, can_consolidate=_can_consolidate
+        group = list(group_blocks)
+        merged_blocks, merged = _merge_blocks(
+            group, dtype=dtype, can_consolidate=_can_consolidate
         )
+        if merged:
+            _consolidation_stats["blocks_merged"] += len(group)
+            _consolidation_stats["bytes_copied"] += merged_blocks[0].values.nbytes
         new_blocks = extend_blocks(merged_blocks, new_blocks)
+    _consolidation_stats["consolidations"] += 1
     return tuple(new_blocks)
 
 
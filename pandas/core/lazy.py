@@ -0,0 +1,1124 @@
+"""
+Deferred execution of DataFrame pipelines.
+
+A :class:`LazyFrame` records a chain of DataFrame operations as a logical
+plan instead of running them. Calling :meth:`LazyFrame.collect` rewrites the
+plan and then runs it through the regular eager DataFrame methods. The
+rewrites are:
+
+* predicate pushdown: string filters are moved below sorts, column
+  selections, row-wise assignments and joins so fewer rows reach them,
+* projection pushdown: only the columns the plan needs are kept, and for
+  CSV and parquet sources only those columns are read,
+* ``sort_values(...).head(n)`` is run as ``nlargest``/``nsmallest``.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tokenize
+from typing import (
+    TYPE_CHECKING,
+    Any,
+)
+
+from pandas.compat._optional import import_optional_dependency
+from pandas.errors import AbstractMethodError
+from pandas.util._decorators import set_module
+
+from pandas.core.dtypes.common import is_list_like
+
+from pandas.core.computation.parsing import (
+    clean_column_name,
+    tokenize_string,
+)
+from pandas.core.indexes.api import Index
+from pandas.core.methods.selectn import SelectN
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        Callable,
+        Hashable,
+        Sequence,
+    )
+
+    from pandas._typing import (
+        FilePath,
+        MergeHow,
+        Suffixes,
+    )
+
+    from pandas import DataFrame
+
+
+def _expr_columns(expr: str, columns: Index | None) -> set[Hashable] | None:
+    """
+    Return the column labels of ``columns`` referenced in a query expression.
+
+    Returns None when ``columns`` is unknown, in which case the caller has to
+    assume that every column is needed.
+    """
+    if columns is None:
+        return None
+    lookup = {clean_column_name(col): col for col in columns}
+    names = set()
+    prev = None
+    for toknum, tokval in tokenize_string(expr):
+        # ``@name`` refers to a local variable, ``obj.name`` to an attribute
+        if toknum == tokenize.NAME and prev not in ("@", "."):
+            if tokval in lookup:
+                names.add(lookup[tokval])
+        prev = tokval
+    return names
+
+
+def _expr_uses_only_columns(expr: str, columns: Index | None) -> bool:
+    """
+    Whether a query expression refers to nothing but the labels of ``columns``
+    (and local variables), in particular not to the index or its levels.
+    """
+    if columns is None:
+        return False
+    lookup = {clean_column_name(col) for col in columns}
+    toks = [tok for tok in tokenize_string(expr) if tok[1].strip()]
+    for i, (toknum, tokval) in enumerate(toks):
+        if toknum != tokenize.NAME or tokval in _EXPR_KEYWORDS:
+            continue
+        prev = toks[i - 1][1] if i else None
+        nxt = toks[i + 1][1] if i + 1 < len(toks) else None
+        if prev in ("@", ".") or nxt == "(":
+            # local variable, attribute or function
+            continue
+        if tokval not in lookup:
+            return False
+    return True
+
+
+_EXPR_KEYWORDS = frozenset(["and", "or", "not", "in", "is", "True", "False", "None"])
+
+
+def _eval_targets(expr: str) -> list[str]:
+    """
+    Return the names assigned to in a (possibly multi-line) eval expression.
+    """
+    targets = []
+    for line in expr.strip().splitlines():
+        toks = [tok for tok in tokenize_string(line.strip()) if tok[1].strip()]
+        if len(toks) >= 2 and toks[0][0] == tokenize.NAME and toks[1][1] == "=":
+            targets.append(toks[0][1])
+    return targets
+
+
+def _as_list(keys) -> list:
+    if keys is None:
+        return []
+    if is_list_like(keys) and not isinstance(keys, tuple):
+        return list(keys)
+    return [keys]
+
+
+# ---------------------------------------------------------------------
+# Logical plan nodes
+
+
+class _Node:
+    """
+    Base class of the logical plan nodes.
+
+    Nodes are immutable; optimizer passes build new trees with
+    :meth:`with_children`.
+    """
+
+    children: tuple[_Node, ...] = ()
+
+    @property
+    def child(self) -> _Node:
+        return self.children[0]
+
+    def with_children(self, children: Sequence[_Node]) -> _Node:
+        new = object.__new__(type(self))
+        new.__dict__.update(self.__dict__)
+        new.children = tuple(children)
+        return new
+
+    def schema(self) -> Index | None:
+        """
+        Output column labels, or None if they are not known before execution.
+        """
+        return self.child.schema()
+
+    def input_labels_used(self, labels_used: bool) -> bool:
+        """
+        Whether the row labels of the inputs affect the result, given whether
+        the row labels of the output are used by the rest of the plan.
+
+        Nodes that keep the index pass ``labels_used`` on; nodes that build
+        a new index without reading the old one return False.
+        """
+        return True
+
+    def execute(self, *inputs: DataFrame) -> DataFrame:
+        raise AbstractMethodError(self)
+
+    def describe(self) -> str:
+        raise AbstractMethodError(self)
+
+
+class _FrameScan(_Node):
+    def __init__(self, frame: DataFrame) -> None:
+        self.frame = frame
+
+    def schema(self) -> Index:
+        return self.frame.columns
+
+    def execute(self) -> DataFrame:
+        return self.frame
+
+    def describe(self) -> str:
+        return f"FrameScan(shape={self.frame.shape})"
+
+
+class _ReadScan(_Node):
+    """
+    Scan of a file that is read with ``read_csv`` or ``read_parquet``.
+    """
+
+    def __init__(
+        self, kind: str, path, kwargs: dict, columns: list | None = None
+    ) -> None:
+        self.kind = kind
+        self.path = path
+        self.kwargs = kwargs
+        self.columns = columns
+        self._schema: Index | None = None
+
+    def _can_prune(self) -> bool:
+        if not isinstance(self.path, (str, os.PathLike)):
+            # reading the header of a buffer would consume it
+            return False
+        if self.kind == "csv":
+            usecols = self.kwargs.get("usecols")
+            return self.kwargs.get("index_col") in (None, False) and (
+                usecols is None or is_list_like(usecols)
+            )
+        return True
+
+    def schema(self) -> Index | None:
+        if self.columns is not None:
+            return Index(self.columns)
+        if self._schema is None and self._can_prune():
+            self._schema = self._read_schema()
+        return self._schema
+
+    def _read_schema(self) -> Index | None:
+        if self.kind == "csv":
+            from pandas.io.parsers import read_csv
+
+            kwargs = {**self.kwargs, "nrows": 0}
+            return read_csv(self.path, **kwargs).columns
+
+        pq = import_optional_dependency("pyarrow.parquet", errors="ignore")
+        if pq is None:
+            return None
+        try:
+            arrow_schema = pq.read_schema(self.path)
+        except (OSError, ValueError):
+            return None
+        index_columns = set()
+        metadata = arrow_schema.pandas_metadata or {}
+        for col in metadata.get("index_columns", []):
+            if isinstance(col, str):
+                index_columns.add(col)
+        names = [name for name in arrow_schema.names if name not in index_columns]
+        if self.kwargs.get("columns") is not None:
+            names = [name for name in names if name in self.kwargs["columns"]]
+        return Index(names)
+
+    def execute(self) -> DataFrame:
+        kwargs = dict(self.kwargs)
+        if self.kind == "csv":
+            from pandas.io.parsers import read_csv
+
+            if self.columns is not None:
+                kwargs["usecols"] = self.columns
+            return read_csv(self.path, **kwargs)
+
+        from pandas.io.parquet import read_parquet
+
+        if self.columns is not None:
+            kwargs["columns"] = self.columns
+        return read_parquet(self.path, **kwargs)
+
+    def describe(self) -> str:
+        reader = "read_csv" if self.kind == "csv" else "read_parquet"
+        cols = "*" if self.columns is None else self.columns
+        return f"ReadScan({reader}, {self.path!r}, columns={cols})"
+
+
+class _Project(_Node):
+    def __init__(self, child: _Node, columns: list) -> None:
+        self.children = (child,)
+        self.columns = columns
+
+    def schema(self) -> Index:
+        return Index(self.columns)
+
+    def input_labels_used(self, labels_used: bool) -> bool:
+        return labels_used
+
+    def execute(self, frame: DataFrame) -> DataFrame:
+        return frame[self.columns]
+
+    def describe(self) -> str:
+        return f"Project({self.columns})"
+
+
+class _Filter(_Node):
+    def __init__(
+        self,
+        child: _Node,
+        predicate: str | Callable,
+        local_dict: dict | None = None,
+        global_dict: dict | None = None,
+    ) -> None:
+        self.children = (child,)
+        self.predicate = predicate
+        self.local_dict = local_dict
+        self.global_dict = global_dict
+
+    def columns_used(self, schema: Index | None) -> set[Hashable] | None:
+        if not isinstance(self.predicate, str):
+            return None
+        return _expr_columns(self.predicate, schema)
+
+    def uses_only_columns(self) -> bool:
+        """
+        Whether the predicate only refers to columns, not to the row labels.
+        """
+        return isinstance(self.predicate, str) and _expr_uses_only_columns(
+            self.predicate, self.child.schema()
+        )
+
+    def input_labels_used(self, labels_used: bool) -> bool:
+        return labels_used or not self.uses_only_columns()
+
+    def execute(self, frame: DataFrame) -> DataFrame:
+        if isinstance(self.predicate, str):
+            return frame.query(
+                self.predicate, local_dict=self.local_dict, global_dict=self.global_dict
+            )
+        return frame[self.predicate(frame)]
+
+    def describe(self) -> str:
+        return f"Filter({self.predicate!r})"
+
+
+class _Assign(_Node):
+    """
+    Column assignment, either ``DataFrame.assign`` keywords or an
+    ``DataFrame.eval`` assignment expression.
+    """
+
+    def __init__(
+        self,
+        child: _Node,
+        kwargs: dict | None = None,
+        expr: str | None = None,
+        local_dict: dict | None = None,
+        global_dict: dict | None = None,
+    ) -> None:
+        self.children = (child,)
+        self.kwargs = kwargs
+        self.expr = expr
+        self.local_dict = local_dict
+        self.global_dict = global_dict
+
+    @property
+    def targets(self) -> list[Hashable]:
+        if self.expr is not None:
+            return list(_eval_targets(self.expr))
+        return list(self.kwargs)
+
+    @property
+    def is_rowwise(self) -> bool:
+        # callables and array-likes may depend on the row set or row count
+        if self.expr is not None:
+            return True
+        return not any(
+            callable(value) or is_list_like(value) for value in self.kwargs.values()
+        )
+
+    def columns_used(self, schema: Index | None) -> set[Hashable] | None:
+        if self.expr is not None:
+            return _expr_columns(self.expr, schema)
+        if any(callable(value) for value in self.kwargs.values()):
+            return None
+        return set()
+
+    def input_labels_used(self, labels_used: bool) -> bool:
+        if self.expr is not None:
+            return labels_used or not _expr_uses_only_columns(
+                self.expr, self.child.schema()
+            )
+        # array-likes are aligned on the index, callables may read it
+        return labels_used or not self.is_rowwise
+
+    def schema(self) -> Index | None:
+        schema = self.child.schema()
+        if schema is None:
+            return None
+        new = [name for name in self.targets if name not in schema]
+        return schema.append(Index(new)) if new else schema
+
+    def execute(self, frame: DataFrame) -> DataFrame:
+        if self.expr is not None:
+            return frame.eval(
+                self.expr, local_dict=self.local_dict, global_dict=self.global_dict
+            )
+        return frame.assign(**self.kwargs)
+
+    def describe(self) -> str:
+        if self.expr is not None:
+            return f"Assign({self.expr!r})"
+        return f"Assign({self.targets})"
+
+
+class _Sort(_Node):
+    def __init__(self, child: _Node, by: list, kwargs: dict) -> None:
+        self.children = (child,)
+        self.by = by
+        self.kwargs = kwargs
+
+    def topn_method(self) -> str | None:
+        """
+        Return "nsmallest"/"nlargest" if the sort followed by ``head`` can
+        be replaced by it.
+        """
+        kwargs = self.kwargs
+        if kwargs["key"] is not None or kwargs["na_position"] != "last":
+            return None
+        ascending = kwargs["ascending"]
+        if is_list_like(ascending):
+            ascending = list(ascending)
+            if len(ascending) != len(self.by) or len(set(ascending)) != 1:
+                return None
+            ascending = ascending[0]
+        return "nsmallest" if ascending else "nlargest"
+
+    def input_labels_used(self, labels_used: bool) -> bool:
+        schema = self.child.schema()
+        if schema is None or not all(col in schema for col in self.by):
+            # sorting by index levels
+            return True
+        return labels_used and not self.kwargs["ignore_index"]
+
+    def execute(self, frame: DataFrame) -> DataFrame:
+        return frame.sort_values(self.by, **self.kwargs)
+
+    def describe(self) -> str:
+        return f"Sort(by={self.by}, ascending={self.kwargs['ascending']})"
+
+
+class _Head(_Node):
+    def __init__(self, child: _Node, n: int) -> None:
+        self.children = (child,)
+        self.n = n
+
+    def input_labels_used(self, labels_used: bool) -> bool:
+        return labels_used
+
+    def execute(self, frame: DataFrame) -> DataFrame:
+        return frame.head(self.n)
+
+    def describe(self) -> str:
+        return f"Head(n={self.n})"
+
+
+class _TopN(_Node):
+    """
+    ``sort_values(by).head(n)`` executed as ``nlargest``/``nsmallest``.
+    """
+
+    def __init__(self, child: _Node, n: int, sort: _Sort, method: str) -> None:
+        self.children = (child,)
+        self.n = n
+        self.sort = sort
+        self.method = method
+
+    def input_labels_used(self, labels_used: bool) -> bool:
+        return self.sort.input_labels_used(labels_used)
+
+    def execute(self, frame: DataFrame) -> DataFrame:
+        by = self.sort.by
+        if frame.columns.is_unique and all(
+            col in frame.columns and SelectN.is_valid_dtype_n_method(frame[col].dtype)
+            for col in by
+        ):
+            result = getattr(frame, self.method)(self.n, by, keep="first")
+            if self.sort.kwargs["ignore_index"]:
+                result = result.reset_index(drop=True)
+            return result
+        return self.sort.execute(frame).head(self.n)
+
+    def describe(self) -> str:
+        return f"TopN({self.method}, n={self.n}, by={self.sort.by})"
+
+
+class _Merge(_Node):
+    def __init__(self, left: _Node, right: _Node, kwargs: dict) -> None:
+        self.children = (left, right)
+        self.kwargs = kwargs
+
+    def _keys(self) -> tuple[list, list] | None:
+        """
+        Return the left and right key labels, None if the join is not on
+        column labels.
+        """
+        kw = self.kwargs
+        if kw["left_index"] or kw["right_index"]:
+            return None
+        if kw["how"] == "cross":
+            return [], []
+        if kw["on"] is not None:
+            on = _as_list(kw["on"])
+            left_on, right_on = on, on
+        elif kw["left_on"] is not None or kw["right_on"] is not None:
+            left_on, right_on = _as_list(kw["left_on"]), _as_list(kw["right_on"])
+        else:
+            lschema, rschema = self.children[0].schema(), self.children[1].schema()
+            if lschema is None or rschema is None:
+                return None
+            on = list(lschema.intersection(rschema))
+            left_on, right_on = on, on
+        keys = left_on + right_on
+        if any(is_list_like(key) for key in keys):
+            # array keys
+            return None
+        return left_on, right_on
+
+    def column_sources(self) -> dict[Hashable, list[tuple[int, Hashable]]] | None:
+        """
+        Map output column labels to the ``(side, label)`` input columns.
+
+        ``side`` is 0 for the left and 1 for the right input. Join keys
+        that have the same label on both sides map to both inputs.
+        """
+        keys = self._keys()
+        lschema, rschema = self.children[0].schema(), self.children[1].schema()
+        suffixes = self.kwargs["suffixes"]
+        if (
+            keys is None
+            or lschema is None
+            or rschema is None
+            or not lschema.is_unique
+            or not rschema.is_unique
+            or not all(isinstance(suffix, str) for suffix in suffixes)
+        ):
+            return None
+        left_on, right_on = keys
+        shared = {lk for lk, rk in zip(left_on, right_on) if lk == rk}
+        overlap = set(lschema.intersection(rschema)) - shared
+        lsuffix, rsuffix = suffixes
+
+        sources: dict[Hashable, list[tuple[int, Hashable]]] = {}
+        for col in lschema:
+            name = f"{col}{lsuffix}" if col in overlap else col
+            sources[name] = [(0, col)]
+        for col in rschema:
+            if col in shared:
+                sources[col].append((1, col))
+                continue
+            name = f"{col}{rsuffix}" if col in overlap else col
+            sources[name] = [(1, col)]
+        return sources
+
+    def input_labels_used(self, labels_used: bool) -> bool:
+        # a merge on columns builds a new default index
+        keys = self._keys()
+        lschema, rschema = self.children[0].schema(), self.children[1].schema()
+        return (
+            keys is None
+            or lschema is None
+            or rschema is None
+            or not all(key in lschema for key in keys[0])
+            or not all(key in rschema for key in keys[1])
+        )
+
+    def schema(self) -> Index | None:
+        sources = self.column_sources()
+        if sources is None:
+            return None
+        schema = Index(list(sources))
+        indicator = self.kwargs["indicator"]
+        if indicator:
+            name = "_merge" if indicator is True else indicator
+            schema = schema.append(Index([name]))
+        return schema
+
+    def execute(self, left: DataFrame, right: DataFrame) -> DataFrame:
+        return left.merge(right, **self.kwargs)
+
+    def describe(self) -> str:
+        kw = self.kwargs
+        on = kw["on"] if kw["on"] is not None else (kw["left_on"], kw["right_on"])
+        return f"Merge(how={kw['how']!r}, on={on})"
+
+
+class _GroupByAgg(_Node):
+    def __init__(
+        self, child: _Node, by: list, groupby_kwargs: dict, func, kwargs: dict
+    ) -> None:
+        self.children = (child,)
+        self.by = by
+        self.groupby_kwargs = groupby_kwargs
+        self.func = func
+        self.kwargs = kwargs
+
+    def columns_used(self) -> set[Hashable] | None:
+        """
+        Columns needed by the aggregation, None if it uses all columns.
+        """
+        if self.func is None and self.kwargs:
+            # named aggregation: ``new_name=(column, func)``
+            cols = set()
+            for spec in self.kwargs.values():
+                if not isinstance(spec, tuple) or len(spec) != 2:
+                    return None
+                cols.add(spec[0])
+        elif isinstance(self.func, dict):
+            cols = set(self.func)
+        else:
+            return None
+        return cols | set(self.by)
+
+    def input_labels_used(self, labels_used: bool) -> bool:
+        # the result is indexed by the group keys (or a default index)
+        schema = self.child.schema()
+        return (
+            schema is None
+            or not all(key in schema for key in self.by)
+            or self.groupby_kwargs.get("level") is not None
+        )
+
+    def schema(self) -> None:
+        return None
+
+    def execute(self, frame: DataFrame) -> DataFrame:
+        gb = frame.groupby(self.by, **self.groupby_kwargs)
+        return gb.agg(self.func, **self.kwargs)
+
+    def describe(self) -> str:
+        func = self.func if self.func is not None else self.kwargs
+        return f"GroupByAgg(by={self.by}, func={func})"
+
+
+# ---------------------------------------------------------------------
+# Optimizer passes
+
+
+def _rewrite_topn(node: _Node) -> _Node:
+    node = node.with_children([_rewrite_topn(child) for child in node.children])
+    if isinstance(node, _Head) and isinstance(node.child, _Sort) and node.n >= 0:
+        sort = node.child
+        method = sort.topn_method()
+        if method is not None:
+            return _TopN(sort.child, node.n, sort, method)
+    return node
+
+
+def _push_filter(node: _Filter, labels_used: bool) -> _Node:
+    """
+    Move a single filter as far down the plan as is safe.
+
+    ``labels_used`` tells whether the row labels of the filter's output are
+    used by the rest of the plan. A filter is only moved below a node that
+    builds a new index (a merge or a sort with ``ignore_index=True``) when
+    they are not, since the new labels would be built from fewer rows.
+    """
+    child = node.child
+    if not isinstance(node.predicate, str):
+        # callables may look at the whole frame (e.g. ``df.a.diff() > 0``)
+        return node
+
+    if isinstance(child, _Sort):
+        if not child.kwargs["ignore_index"]:
+            return child.with_children(
+                [_push_filter(node.with_children([child.child]), labels_used)]
+            )
+        if not labels_used and node.uses_only_columns():
+            return child.with_children(
+                [_push_filter(node.with_children([child.child]), False)]
+            )
+
+    elif isinstance(child, _Project):
+        used = node.columns_used(child.child.schema())
+        if used is not None and used <= set(child.columns):
+            return child.with_children(
+                [_push_filter(node.with_children([child.child]), labels_used)]
+            )
+
+    elif isinstance(child, _Assign) and child.is_rowwise:
+        used = node.columns_used(child.schema())
+        if used is not None and not used & set(child.targets):
+            return child.with_children(
+                [_push_filter(node.with_children([child.child]), labels_used)]
+            )
+
+    elif isinstance(child, _Merge):
+        if not labels_used and node.uses_only_columns():
+            return _push_filter_into_merge(node, child)
+
+    return node
+
+
+def _push_filter_into_merge(node: _Filter, merge: _Merge) -> _Node:
+    sources = merge.column_sources()
+    used = node.columns_used(merge.schema())
+    if sources is None or used is None or not used:
+        return node
+
+    # only push the predicate into a side where every column it references
+    # exists under the same label
+    sides = [
+        side
+        for side in (0, 1)
+        if all(any(src == (side, col) for src in sources[col]) for col in used)
+    ]
+
+    how = merge.kwargs["how"]
+    if how in ("inner", "cross"):
+        pushable = sides
+    elif how == "left":
+        pushable = [side for side in sides if side == 0]
+    elif how == "right":
+        pushable = [side for side in sides if side == 1]
+    else:
+        pushable = []
+    if not pushable:
+        return node
+
+    children = list(merge.children)
+    for side in pushable:
+        children[side] = _push_filter(node.with_children([children[side]]), False)
+    return merge.with_children(children)
+
+
+def _pushdown_predicates(node: _Node, labels_used: bool = True) -> _Node:
+    """
+    Push the filters of the plan down, ``labels_used`` telling whether the
+    row labels of the output of ``node`` are used.
+    """
+    child_labels_used = node.input_labels_used(labels_used)
+    node = node.with_children(
+        [_pushdown_predicates(child, child_labels_used) for child in node.children]
+    )
+    if isinstance(node, _Filter):
+        return _push_filter(node, labels_used)
+    return node
+
+
+def _prune(node: _Node, required: set[Hashable] | None) -> _Node:
+    """
+    Drop the columns that are not in ``required`` as early as possible.
+
+    ``required`` is the set of output columns of ``node`` that are used by
+    the rest of the plan, None meaning all of them.
+    """
+    if isinstance(node, _FrameScan):
+        schema = node.schema()
+        if required is not None and schema.is_unique:
+            cols = [col for col in schema if col in required]
+            if len(cols) < len(schema):
+                return _Project(node, cols)
+        return node
+
+    if isinstance(node, _ReadScan):
+        schema = node.schema() if node._can_prune() else None
+        if required is not None and schema is not None:
+            cols = [col for col in schema if col in required]
+            if len(cols) < len(schema):
+                return _ReadScan(node.kind, node.path, node.kwargs, cols)
+        return node
+
+    if isinstance(node, _Project):
+        return node.with_children([_prune(node.child, set(node.columns))])
+
+    if isinstance(node, _Filter):
+        used = node.columns_used(node.child.schema())
+        child_required = None if required is None or used is None else required | used
+        return node.with_children([_prune(node.child, child_required)])
+
+    if isinstance(node, _Assign):
+        used = node.columns_used(node.child.schema())
+        if required is None or used is None:
+            child_required = None
+        else:
+            child_required = (required - set(node.targets)) | used
+        return node.with_children([_prune(node.child, child_required)])
+
+    if isinstance(node, _Sort):
+        child_required = None if required is None else required | set(node.by)
+        return node.with_children([_prune(node.child, child_required)])
+
+    if isinstance(node, _TopN):
+        child_required = None if required is None else required | set(node.sort.by)
+        return node.with_children([_prune(node.child, child_required)])
+
+    if isinstance(node, _Head):
+        return node.with_children([_prune(node.child, required)])
+
+    if isinstance(node, _GroupByAgg):
+        return node.with_children([_prune(node.child, node.columns_used())])
+
+    if isinstance(node, _Merge):
+        sources = node.column_sources()
+        if required is None or sources is None:
+            return node.with_children([_prune(child, None) for child in node.children])
+        keys = node._keys()
+        assert keys is not None
+        side_required: list[set[Hashable]] = [set(keys[0]), set(keys[1])]
+        for col in required:
+            for side, src in sources.get(col, []):
+                side_required[side].add(src)
+                if src != col:
+                    # a suffixed column only keeps its name if the other side
+                    #  still has a column with the same label
+                    side_required[1 - side].add(src)
+        return node.with_children(
+            [
+                _prune(child, side_required[side])
+                for side, child in enumerate(node.children)
+            ]
+        )
+
+    return node.with_children([_prune(child, None) for child in node.children])
+
+
+def _optimize(node: _Node) -> _Node:
+    node = _rewrite_topn(node)
+    node = _pushdown_predicates(node)
+    return _prune(node, None)
+
+
+def _execute(node: _Node) -> DataFrame:
+    inputs = [_execute(child) for child in node.children]
+    return node.execute(*inputs)
+
+
+def _format_plan(node: _Node, depth: int = 0) -> list[str]:
+    lines = ["  " * depth + node.describe()]
+    for child in node.children:
+        lines.extend(_format_plan(child, depth + 1))
+    return lines
+
+
+def _caller_scope(level: int) -> tuple[dict, dict]:
+    # resolve ``@variable`` references when the expression is recorded,
+    # not when the plan is executed from inside ``collect``
+    frame = sys._getframe(level + 1)
+    try:
+        return dict(frame.f_locals), frame.f_globals
+    finally:
+        del frame
+
+
+# ---------------------------------------------------------------------
+# Public API
+
+
+@set_module("pandas.api.typing")
+class LazyFrame:
+    """
+    A DataFrame computation that is planned and optimized before it runs.
+
+    A LazyFrame is created with :meth:`DataFrame.lazy`,
+    :meth:`LazyFrame.scan_csv` or :meth:`LazyFrame.scan_parquet`. Its
+    methods return new LazyFrame objects and no data is touched until
+    :meth:`LazyFrame.collect` is called, which optimizes the recorded plan
+    and executes it using the eager DataFrame methods.
+
+    See Also
+    --------
+    DataFrame.lazy : Start a lazy computation from a DataFrame.
+
+    Notes
+    -----
+    Filters given as query strings are assumed to be row-wise, i.e. whether
+    a row is kept does not depend on the other rows. Only such filters are
+    moved by the optimizer, and the result has the same index as the eager
+    computation: a filter is only moved below a merge or a sort with
+    ``ignore_index=True``, which build a new default index, when the rest of
+    the plan does not use the row labels (e.g. a groupby aggregation).
+
+    Examples
+    --------
+    >>> df = pd.DataFrame({"a": [3, 1, 2], "b": [4, 5, 6], "c": [7, 8, 9]})
+    >>> lf = df.lazy().filter("b > 4").sort_values("a").head(1)[["a"]]
+    >>> lf.collect()
+       a
+    1  1
+    """
+
+    def __init__(self, plan: _Node) -> None:
+        self._plan = plan
+
+    @classmethod
+    def _from_frame(cls, frame: DataFrame) -> LazyFrame:
+        return cls(_FrameScan(frame))
+
+    @classmethod
+    def scan_csv(cls, filepath_or_buffer: FilePath, **kwargs) -> LazyFrame:
+        """
+        Lazily read a CSV file.
+
+        Only the columns used by the plan are parsed, by passing ``usecols``
+        to :func:`read_csv`.
+
+        Parameters
+        ----------
+        filepath_or_buffer : str or path object
+            Path of the file to read.
+        **kwargs
+            Keyword arguments passed to :func:`read_csv`.
+
+        Returns
+        -------
+        LazyFrame
+        """
+        return cls(_ReadScan("csv", filepath_or_buffer, kwargs))
+
+    @classmethod
+    def scan_parquet(cls, path: FilePath, **kwargs) -> LazyFrame:
+        """
+        Lazily read a parquet file.
+
+        Only the columns used by the plan are read, by passing ``columns``
+        to :func:`read_parquet`.
+
+        Parameters
+        ----------
+        path : str or path object
+            Path of the file to read.
+        **kwargs
+            Keyword arguments passed to :func:`read_parquet`.
+
+        Returns
+        -------
+        LazyFrame
+        """
+        return cls(_ReadScan("parquet", path, kwargs))
+
+    def __repr__(self) -> str:
+        return "LazyFrame\n" + "\n".join(_format_plan(self._plan, 1))
+
+    @property
+    def columns(self) -> Index | None:
+        """
+        The column labels of the result, or None if only known after execution.
+        """
+        return self._plan.schema()
+
+    def __getitem__(self, key) -> LazyFrame:
+        if not is_list_like(key) or isinstance(key, tuple):
+            raise TypeError("LazyFrame only supports selecting a list of columns")
+        return LazyFrame(_Project(self._plan, list(key)))
+
+    def filter(self, predicate: str | Callable[[DataFrame], Any]) -> LazyFrame:
+        """
+        Keep the rows for which ``predicate`` is True.
+
+        Parameters
+        ----------
+        predicate : str or callable
+            A boolean expression as accepted by :meth:`DataFrame.query`, or
+            a callable taking the DataFrame and returning a boolean mask.
+            Only string predicates can be moved by the optimizer.
+
+        Returns
+        -------
+        LazyFrame
+        """
+        local_dict = global_dict = None
+        if isinstance(predicate, str):
+            local_dict, global_dict = _caller_scope(1)
+        return LazyFrame(_Filter(self._plan, predicate, local_dict, global_dict))
+
+    def assign(self, **kwargs) -> LazyFrame:
+        """
+        Add columns, as :meth:`DataFrame.assign`.
+
+        Returns
+        -------
+        LazyFrame
+        """
+        return LazyFrame(_Assign(self._plan, kwargs=kwargs))
+
+    def eval(self, expr: str) -> LazyFrame:
+        """
+        Add columns from assignment expressions, as :meth:`DataFrame.eval`.
+
+        Unlike callables passed to :meth:`assign`, the columns used by
+        an expression are known to the optimizer.
+
+        Parameters
+        ----------
+        expr : str
+            One or more lines of the form ``"new = a + b"``.
+
+        Returns
+        -------
+        LazyFrame
+        """
+        if not _eval_targets(expr):
+            raise ValueError("LazyFrame.eval requires an assignment expression")
+        local_dict, global_dict = _caller_scope(1)
+        return LazyFrame(
+            _Assign(
+                self._plan, expr=expr, local_dict=local_dict, global_dict=global_dict
+            )
+        )
+
+    def sort_values(
+        self,
+        by,
+        *,
+        ascending: bool | Sequence[bool] = True,
+        kind: str = "quicksort",
+        na_position: str = "last",
+        ignore_index: bool = False,
+        key: Callable | None = None,
+    ) -> LazyFrame:
+        """
+        Sort by the values of columns, as :meth:`DataFrame.sort_values`.
+
+        Returns
+        -------
+        LazyFrame
+        """
+        kwargs = {
+            "ascending": ascending,
+            "kind": kind,
+            "na_position": na_position,
+            "ignore_index": ignore_index,
+            "key": key,
+        }
+        return LazyFrame(_Sort(self._plan, _as_list(by), kwargs))
+
+    def head(self, n: int = 5) -> LazyFrame:
+        """
+        Return the first `n` rows, as :meth:`DataFrame.head`.
+
+        Returns
+        -------
+        LazyFrame
+        """
+        return LazyFrame(_Head(self._plan, n))
+
+    def merge(
+        self,
+        right: LazyFrame | DataFrame,
+        how: MergeHow = "inner",
+        on=None,
+        left_on=None,
+        right_on=None,
+        left_index: bool = False,
+        right_index: bool = False,
+        sort: bool = False,
+        suffixes: Suffixes = ("_x", "_y"),
+        indicator: str | bool = False,
+        validate: str | None = None,
+    ) -> LazyFrame:
+        """
+        Join with another LazyFrame or DataFrame, as :meth:`DataFrame.merge`.
+
+        Returns
+        -------
+        LazyFrame
+        """
+        if not isinstance(right, LazyFrame):
+            right = right.lazy()
+        kwargs = {
+            "how": how,
+            "on": on,
+            "left_on": left_on,
+            "right_on": right_on,
+            "left_index": left_index,
+            "right_index": right_index,
+            "sort": sort,
+            "suffixes": tuple(suffixes),
+            "indicator": indicator,
+            "validate": validate,
+        }
+        return LazyFrame(_Merge(self._plan, right._plan, kwargs))
+
+    def groupby(
+        self, by, *, as_index: bool = True, sort: bool = True, dropna: bool = True
+    ) -> LazyGroupBy:
+        """
+        Group by columns, as :meth:`DataFrame.groupby`.
+
+        Only column labels are supported as keys.
+
+        Returns
+        -------
+        LazyGroupBy
+        """
+        return LazyGroupBy(
+            self, _as_list(by), {"as_index": as_index, "sort": sort, "dropna": dropna}
+        )
+
+    def explain(self, optimized: bool = True) -> str:
+        """
+        Return a description of the plan.
+
+        Parameters
+        ----------
+        optimized : bool, default True
+            Whether to describe the plan after optimization.
+
+        Returns
+        -------
+        str
+        """
+        plan = _optimize(self._plan) if optimized else self._plan
+        return "\n".join(_format_plan(plan))
+
+    def collect(self) -> DataFrame:
+        """
+        Optimize and execute the plan.
+
+        Returns
+        -------
+        DataFrame
+        """
+        return _execute(_optimize(self._plan))
+
+
+@set_module("pandas.api.typing")
+class LazyGroupBy:
+    """
+    Deferred groupby, returned by :meth:`LazyFrame.groupby`.
+    """
+
+    def __init__(self, obj: LazyFrame, by: list, kwargs: dict) -> None:
+        self._obj = obj
+        self._by = by
+        self._kwargs = kwargs
+
+    def agg(self, func=None, **kwargs) -> LazyFrame:
+        """
+        Aggregate the groups, as :meth:`.DataFrameGroupBy.agg`.
+
+        Only the columns named in a dict ``func`` or in named aggregations
+        are read from the source.
+
+        Returns
+        -------
+        LazyFrame
+        """
+        return LazyFrame(
+            _GroupByAgg(self._obj._plan, self._by, self._kwargs, func, kwargs)
+        )
+
+    aggregate = agg
@@ -0,0 +1,252 @@
+"""
+Label lookups on a pinned snapshot of a Series or DataFrame.
+
+``.loc`` and ``.at`` validate the key, dispatch on its type and find the
+block holding the column on every call. A :class:`LookupAccessor` does this
+work once: it keeps the index (with its populated hash table) and the arrays
+of the requested columns, so a lookup is a ``get_loc`` on the index engine
+followed by a positional access into the column array.
+"""
+
+from __future__ import annotations
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+)
+
+from pandas._libs import (
+    index as libindex,
+    lib,
+)
+from pandas._libs.tslibs import (
+    Timedelta,
+    Timestamp,
+)
+from pandas.errors import InvalidIndexError
+from pandas.util._decorators import set_module
+
+from pandas.core.dtypes.common import is_list_like
+
+from pandas.core.indexes.api import (
+    DatetimeIndex,
+    Index,
+    MultiIndex,
+    TimedeltaIndex,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        Callable,
+        Hashable,
+        Sequence,
+    )
+
+    from pandas._typing import ArrayLike
+
+    from pandas import (
+        DataFrame,
+        Series,
+    )
+
+
+@set_module("pandas.api.typing")
+class LookupAccessor:
+    """
+    Fast label lookups on a snapshot of a Series or DataFrame.
+
+    A LookupAccessor is created with :meth:`DataFrame.lookup_accessor` or
+    :meth:`Series.lookup_accessor`. It requires a unique index and keeps the
+    index hash table and the column arrays, so that
+    :meth:`LookupAccessor.get` and :meth:`LookupAccessor.get_many` skip the
+    key validation and block lookups done by ``.loc`` and ``.at``.
+
+    See Also
+    --------
+    DataFrame.at : Access a single value for a row/column label pair.
+    DataFrame.loc : Access a group of rows and columns by label(s).
+
+    Notes
+    -----
+    The accessor holds the values the object had when the accessor was
+    created. Later modifications of the object are not reflected.
+
+    Examples
+    --------
+    >>> df = pd.DataFrame({"a": [1, 2, 3], "b": [4.0, 5.0, 6.0]}, index=["x", "y", "z"])
+    >>> acc = df.lookup_accessor(["b"])
+    >>> acc.get("y")
+    np.float64(5.0)
+    >>> acc.get_many(["z", "x"])
+    array([6., 4.])
+    """
+
+    def __init__(
+        self,
+        obj: Series | DataFrame,
+        columns: Hashable | Sequence[Hashable] | None = None,
+    ) -> None:
+        # With Copy-on-Write, holding a shallow copy makes later writes to
+        #  ``obj`` copy its data instead of modifying the arrays kept here
+        obj = obj.copy(deep=False)
+        self._obj = obj
+        index = obj.index
+        if not index.is_unique:
+            raise InvalidIndexError("lookup_accessor requires a unique index")
+        self._index = index
+
+        engine = index._engine
+        self._get_loc: Callable[[Any], Any] = index.get_loc
+        # Lookup through the engine's hash table for the keys accepted by
+        #  _engine_key (all keys if None), which gives the same answer as
+        #  get_loc for a unique index
+        self._engine_get_loc: Callable[[Any], int] | None = None
+        self._engine_key: Callable[[Any], bool] | None = None
+        if isinstance(index, MultiIndex):
+            # going through the engine restricts keys to complete tuples,
+            #  matching DataFrame._get_value
+            self._get_loc = engine.get_loc
+        elif type(index) is Index and isinstance(engine, libindex.IndexEngine):
+            # Index.get_loc only forwards to the engine
+            self._engine_get_loc = engine.get_loc_hashed
+        elif isinstance(index, DatetimeIndex):
+            naive = index.tz is None
+            self._engine_get_loc = engine.get_loc_hashed
+            self._engine_key = (
+                lambda key: type(key) is Timestamp and (key.tzinfo is None) is naive
+            )
+        elif isinstance(index, TimedeltaIndex):
+            self._engine_get_loc = engine.get_loc_hashed
+            self._engine_key = lambda key: type(key) is Timedelta
+
+        if self._engine_get_loc is not None:
+            # build the hash table now instead of on the first lookup
+            engine.populate_mapping()
+
+        self._arrays: dict[Hashable, ArrayLike] = {}
+        self._default: ArrayLike | None = None
+        if obj.ndim == 1:
+            if columns is not None:
+                raise TypeError("columns cannot be specified for a Series")
+            self._default = obj._values  # type: ignore[union-attr]
+        else:
+            frame: DataFrame = obj  # type: ignore[assignment]
+            if columns is None:
+                columns = frame.columns
+            elif not is_list_like(columns):
+                columns = [columns]  # type: ignore[list-item]
+            for col in columns:
+                loc = frame.columns.get_loc(col)
+                if not lib.is_integer(loc):
+                    raise InvalidIndexError(
+                        f"lookup_accessor requires unique column labels, "
+                        f"{col!r} is duplicated"
+                    )
+                self._arrays[col] = frame._get_column_array(loc)
+            if len(self._arrays) == 1:
+                self._default = next(iter(self._arrays.values()))
+
+    def _column_array(self, column) -> ArrayLike:
+        if column is None:
+            if self._default is None:
+                raise ValueError(
+                    "column must be specified when the accessor holds more than "
+                    "one column"
+                )
+            return self._default
+        try:
+            return self._arrays[column]
+        except KeyError:
+            raise KeyError(column) from None
+
+    def get(self, key: Hashable, column: Hashable | None = None) -> Any:
+        """
+        Return the value for a row label.
+
+        Parameters
+        ----------
+        key : label
+            Row label, as accepted by ``.loc``.
+        column : label, optional
+            Column to return the value of. Can be omitted for a Series and
+            for an accessor holding a single column.
+
+        Returns
+        -------
+        scalar
+            The value at ``key``.
+
+        Raises
+        ------
+        KeyError
+            If ``key`` is not in the index or ``column`` is not held by the
+            accessor.
+
+        See Also
+        --------
+        LookupAccessor.get_many : Return the values for several row labels.
+
+        Examples
+        --------
+        >>> ser = pd.Series([10, 20, 30], index=[100, 200, 300])
+        >>> ser.lookup_accessor().get(200)
+        np.int64(20)
+        """
+        values = self._default if column is None else None
+        if values is None:
+            values = self._column_array(column)
+        if self._engine_get_loc is not None and (
+            self._engine_key is None or self._engine_key(key)
+        ):
+            try:
+                return values[self._engine_get_loc(key)]
+            except (KeyError, TypeError):
+                # let get_loc raise the error users expect
+                pass
+        return values[self._get_loc(key)]
+
+    def get_many(
+        self, keys: Sequence[Hashable], column: Hashable | None = None
+    ) -> ArrayLike:
+        """
+        Return the values for several row labels.
+
+        Parameters
+        ----------
+        keys : list-like
+            Row labels, as accepted by ``.loc``.
+        column : label, optional
+            Column to return the values of. Can be omitted for a Series and
+            for an accessor holding a single column.
+
+        Returns
+        -------
+        numpy.ndarray or ExtensionArray
+            The values at ``keys``, in the order of ``keys``.
+
+        Raises
+        ------
+        KeyError
+            If any of ``keys`` is not in the index or ``column`` is not held
+            by the accessor.
+
+        See Also
+        --------
+        LookupAccessor.get : Return the value for a single row label.
+
+        Examples
+        --------
+        >>> ser = pd.Series([10, 20, 30], index=[100, 200, 300])
+        >>> ser.lookup_accessor().get_many([300, 100])
+        array([30, 10])
+        """
+        values = self._column_array(column)
+        if not is_list_like(keys):
+            raise TypeError(f"keys must be list-like, got {type(keys).__name__}")
+        if not isinstance(keys, Index):
+            keys = Index(keys, tupleize_cols=isinstance(self._index, MultiIndex))
+        indexer = self._index.get_indexer(keys)
+        missing = indexer == -1
+        if missing.any():
+            raise KeyError(f"{list(keys[missing])} not in index")
+        return values.take(indexer)
@@ -233,26 +233,18 @@ def to_dict(
 
     elif orient == "records":
         columns = df.columns.tolist()
-        if are_all_object_dtype_cols:
-            return [
-                into_c(zip(columns, map(maybe_box_native, row)))
-                for row in df.itertuples(index=False, name=None)
-            ]
-        else:
-            data = [
-                into_c(zip(columns, t)) for t in df.itertuples(index=False, name=None)
-            ]
-            if box_native_indices:
-                object_dtype_indices_as_set = set(box_native_indices)
-                object_dtype_cols = {
-                    col
-                    for i, col in enumerate(df.columns)
-                    if i in object_dtype_indices_as_set
-                }
-                for row in data:
-                    for col in object_dtype_cols:
-                        row[col] = maybe_box_native(row[col])
-            return data  # type: ignore[return-value]
+        # box the values a column at a time, as itertuples would
+        object_dtype_indices_as_set = set(box_native_indices)
+        values = [
+            list(map(maybe_box_native, arr.tolist()))
+            if i in object_dtype_indices_as_set
+            else arr.tolist()
+            for i, arr in enumerate(df._iter_column_arrays())
+        ]
+        if into_c is dict:
+            # like zip, no rows without columns
+            return lib.columns_to_dicts(values, columns, len(df) if values else 0)
+        return [into_c(zip(columns, row)) for row in zip(*values)]
 
     elif orient == "index":
         if not df.index.is_unique:
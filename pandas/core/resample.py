@@ -230,7 +230,7 @@ class Resampler(BaseGroupBy, PandasObject):
         -------
         Series or DataFrame
         """
-        return obj._consolidate()
+        return obj._maybe_consolidate()
 
     def _get_binner_for_time(self):
         raise AbstractMethodError(self)
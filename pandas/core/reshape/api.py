@@ -12,6 +12,7 @@ from pandas.core.reshape.merge import (
     merge,
     merge_asof,
     merge_ordered,
+    merge_range,
 )
 from pandas.core.reshape.pivot import (
     crosstab,
@@ -34,6 +35,7 @@ __all__ = [
     "merge",
     "merge_asof",
     "merge_ordered",
+    "merge_range",
     "pivot",
     "pivot_table",
     "qcut",
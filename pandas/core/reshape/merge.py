@@ -32,6 +32,7 @@ from pandas._typing import (
     AnyArrayLike,
     ArrayLike,
     IndexLabel,
+    IntervalClosedType,
     JoinHow,
     MergeHow,
     Shape,
@@ -79,6 +80,7 @@ from pandas import (
     ArrowDtype,
     Categorical,
     Index,
+    IntervalIndex,
     MultiIndex,
     Series,
 )
@@ -144,7 +146,7 @@ _known = (np.ndarray, ExtensionArray, Index, ABCSeries)
 @set_module("pandas")
 def merge(
     left: DataFrame | Series,
-    right: DataFrame | Series,
+    right: DataFrame | Series | JoinIndex,
     how: MergeHow = "inner",
     on: IndexLabel | AnyArrayLike | None = None,
     left_on: IndexLabel | AnyArrayLike | None = None,
@@ -178,8 +180,10 @@ def merge(
     ----------
     left : DataFrame or named Series
         First pandas object to merge.
-    right : DataFrame or named Series
-        Second pandas object to merge.
+    right : DataFrame, named Series or JoinIndex
+        Second pandas object to merge. A ``JoinIndex`` built with
+        :meth:`DataFrame.build_join_index` merges with its DataFrame on the
+        indexed keys, reusing the prebuilt hashtable for inner and left joins.
     how : {'left', 'right', 'outer', 'inner', 'cross', 'left_anti', 'right_anti},
         default 'inner'
         Type of merge to be performed.
@@ -368,6 +372,22 @@ def merge(
     """
     left_df = _validate_operand(left)
     left._check_copy_deprecation(copy)
+    join_index = None
+    if isinstance(right, JoinIndex):
+        join_index = right
+        right = join_index.obj
+        if right_index or right_on is not None:
+            raise MergeError(
+                "Can not pass 'right_on' or 'right_index' when merging with a JoinIndex"
+            )
+        if on is not None and com.maybe_make_list(on) != join_index.on:
+            raise MergeError(
+                f"'on' must match the keys of the JoinIndex: {join_index.on}"
+            )
+        if left_on is not None or left_index:
+            right_on = join_index.on
+        else:
+            on = join_index.on
     right_df = _validate_operand(right)
     if how == "cross":
         return _cross_merge(
@@ -397,6 +417,7 @@ def merge(
             suffixes=suffixes,
             indicator=indicator,
             validate=validate,
+            join_index=join_index,
         )
         return op.get_result()
 
@@ -930,6 +951,403 @@ def merge_asof(
     return op.get_result()
 
 
+@set_module("pandas")
+def merge_range(
+    left: DataFrame | Series,
+    right: DataFrame | Series,
+    left_on: Hashable,
+    right_start: Hashable,
+    right_end: Hashable,
+    closed: IntervalClosedType = "left",
+    how: Literal["inner", "left"] = "inner",
+    suffixes: Suffixes = ("_x", "_y"),
+) -> DataFrame:
+    """
+    Merge DataFrame objects by matching values to ranges.
+
+    Every row of ``left`` is matched with all rows of ``right`` whose range
+    from ``right_start`` to ``right_end`` contains the ``left_on`` value,
+    e.g. to join events to the periods in which they are valid. The
+    matching pairs are found with an interval tree, or a binary search if
+    the ranges are sorted and do not overlap, so the result is computed
+    without materializing a cross join.
+
+    Parameters
+    ----------
+    left : DataFrame or named Series
+        First pandas object to merge.
+    right : DataFrame or named Series
+        Second pandas object to merge, holding the ranges.
+    left_on : label
+        Column or index level name in ``left`` with the values to match.
+    right_start : label
+        Column or index level name in ``right`` with the start of the ranges.
+    right_end : label
+        Column or index level name in ``right`` with the end of the ranges.
+    closed : {'left', 'right', 'both', 'neither'}, default 'left'
+        Whether the ranges are closed on the left-side, right-side, both or
+        neither.
+    how : {'inner', 'left'}, default 'inner'
+        Type of merge to be performed.
+
+        * inner: only keep rows of ``left`` that fall into a range.
+        * left: keep all rows of ``left``, rows that do not fall into a range
+          get missing values in the columns of ``right``.
+    suffixes : list-like, default is ("_x", "_y")
+        A length-2 sequence where each element is optionally a string
+        indicating the suffix to add to overlapping column names in
+        `left` and `right` respectively.
+
+    Returns
+    -------
+    DataFrame
+        A DataFrame of the two merged objects, with the rows of ``left`` in
+        their original order. A row of ``left`` that falls into several
+        ranges is repeated for each of them, in the order of ``right``.
+
+    See Also
+    --------
+    merge : Merge with a database-style join.
+    merge_asof : Merge on nearest keys.
+    IntervalIndex.get_indexer_non_unique : Find the intervals containing
+        values.
+
+    Examples
+    --------
+    >>> events = pd.DataFrame({"ts": [1, 4, 6, 9], "event": list("abcd")})
+    >>> prices = pd.DataFrame(
+    ...     {"start": [0, 3, 5], "end": [5, 7, 8], "price": [10, 20, 30]}
+    ... )
+    >>> pd.merge_range(
+    ...     events, prices, left_on="ts", right_start="start", right_end="end"
+    ... )
+       ts event  start  end  price
+    0   1     a      0    5     10
+    1   4     b      0    5     10
+    2   4     b      3    7     20
+    3   6     c      3    7     20
+    4   6     c      5    8     30
+
+    >>> pd.merge_range(
+    ...     events,
+    ...     prices,
+    ...     left_on="ts",
+    ...     right_start="start",
+    ...     right_end="end",
+    ...     how="left",
+    ... )
+       ts event  start  end  price
+    0   1     a    0.0  5.0   10.0
+    1   4     b    0.0  5.0   10.0
+    2   4     b    3.0  7.0   20.0
+    3   6     c    3.0  7.0   20.0
+    4   6     c    5.0  8.0   30.0
+    5   9     d    NaN  NaN    NaN
+    """
+    left_df = _validate_operand(left)
+    right_df = _validate_operand(right)
+    if how not in ["inner", "left"]:
+        raise ValueError(f"'how' must be 'inner' or 'left', got {how}")
+
+    values = Index(left_df._get_label_or_level_values(left_on))
+    start = Index(right_df._get_label_or_level_values(right_start))
+    end = Index(right_df._get_label_or_level_values(right_end))
+    if needs_i8_conversion(values.dtype):
+        # e.g. datetimes with different resolutions
+        dtype = find_common_type([values.dtype, start.dtype, end.dtype])
+        if needs_i8_conversion(dtype):
+            values = values.astype(dtype)
+            start = start.astype(dtype)
+            end = end.astype(dtype)
+    intervals = IntervalIndex.from_arrays(start, end, closed=closed)
+    if not intervals._should_partial_index(values):
+        raise MergeError(
+            f"incompatible merge keys: values of dtype {values.dtype} can not "
+            f"be matched to ranges of dtype {intervals.dtype.subtype}"
+        )
+    values = intervals._maybe_convert_i8(values)
+    lidx, ridx = _get_range_join_indexers(np.asarray(values), intervals, how)
+
+    join_index = default_index(len(lidx))
+    llabels, rlabels = _items_overlap_with_suffix(
+        left_df.columns, right_df.columns, suffixes
+    )
+    lmgr = left_df._mgr.reindex_indexer(
+        join_index, lidx, axis=1, allow_dups=True, use_na_proxy=True
+    )
+    rmgr = right_df._mgr.reindex_indexer(
+        join_index, ridx, axis=1, allow_dups=True, use_na_proxy=True
+    )
+    result_left = left_df._constructor_from_mgr(lmgr, axes=lmgr.axes)
+    result_right = right_df._constructor_from_mgr(rmgr, axes=rmgr.axes)
+    result_left.columns = llabels
+    result_right.columns = rlabels
+
+    from pandas import concat
+
+    result = concat([result_left, result_right], axis=1)
+    return result.__finalize__(left_df, method="merge_range")
+
+
+def _get_range_join_indexers(
+    values: np.ndarray, intervals: IntervalIndex, how: Literal["inner", "left"]
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+    """
+    Get the positions of the values and the intervals containing them.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Values to look up, converted to the numeric representation used by
+        the IntervalTree of ``intervals``.
+    intervals : IntervalIndex
+    how : {'inner', 'left'}
+
+    Returns
+    -------
+    np.ndarray[np.intp]
+        Indexer into values.
+    np.ndarray[np.intp]
+        Indexer into intervals, -1 for values without a matching interval.
+    """
+    if (
+        intervals.is_non_overlapping_monotonic
+        and intervals.left.is_monotonic_increasing
+        and intervals.left.is_unique
+        and not intervals.hasnans
+    ):
+        # every value lies in at most one interval: binary search the starts.
+        # Empty intervals sharing a start would shadow the interval after them.
+        starts = np.asarray(intervals._maybe_convert_i8(intervals.left))
+        ends = np.asarray(intervals._maybe_convert_i8(intervals.right))
+        side = "right" if intervals.closed_left else "left"
+        ridx = starts.searchsorted(values, side=side).astype(np.intp) - 1
+        matched = ridx >= 0
+        if intervals.closed_right:
+            matched[matched] = values[matched] <= ends[ridx[matched]]
+        else:
+            matched[matched] = values[matched] < ends[ridx[matched]]
+        if how == "left":
+            ridx[~matched] = -1
+            return np.arange(len(values), dtype=np.intp), ridx
+        return np.flatnonzero(matched).astype(np.intp), ridx[matched]
+
+    lidx, ridx = intervals._engine.get_indexer_pairs(values)
+    # list the intervals of every value in their original order
+    order = np.lexsort([ridx, lidx])
+    lidx, ridx = lidx[order], ridx[order]
+    if how == "left":
+        unmatched = np.ones(len(values), dtype=bool)
+        unmatched[lidx] = False
+        missing = np.flatnonzero(unmatched).astype(np.intp)
+        lidx = np.concatenate([lidx, missing])
+        ridx = np.concatenate([ridx, np.full(len(missing), -1, dtype=np.intp)])
+        order = np.argsort(lidx, kind="stable")
+        lidx, ridx = lidx[order], ridx[order]
+    return lidx, ridx
+
+
+@set_module("pandas.api.typing")
+class JoinIndex:
+    """
+    Prebuilt hashtable over the join keys of a DataFrame.
+
+    A ``JoinIndex`` factorizes the key columns of a (dimension) table once,
+    so that repeated :func:`merge` calls against the same table only need
+    to look up the keys of the other side instead of rebuilding a
+    hashtable on every call.
+
+    Do not construct this class directly, use
+    :meth:`DataFrame.build_join_index` instead.
+
+    See Also
+    --------
+    DataFrame.build_join_index : Build a ``JoinIndex`` for a DataFrame.
+    merge : Merge DataFrame objects with a database-style join.
+
+    Examples
+    --------
+    >>> dim = pd.DataFrame({"key": [1, 2, 3], "name": ["a", "b", "c"]})
+    >>> dim_index = dim.build_join_index(on="key")
+    >>> fact = pd.DataFrame({"key": [3, 1, 3], "value": [10, 20, 30]})
+    >>> pd.merge(fact, dim_index, how="left")
+       key  value name
+    0    3     10    c
+    1    1     20    a
+    2    3     30    c
+    """
+
+    def __init__(self, obj: DataFrame, on: IndexLabel) -> None:
+        if not isinstance(obj, ABCDataFrame):
+            raise TypeError(
+                f"Can only build a JoinIndex for a DataFrame, not {type(obj)}"
+            )
+        on = com.maybe_make_list(on)
+        if not on:
+            raise ValueError("'on' must contain at least one key")
+        # With Copy-on-Write, holding a shallow copy makes later writes to
+        #  ``obj`` copy its data instead of going out of sync with the table
+        obj = obj.copy(deep=False)
+        self.obj = obj
+        self.on = on
+        keys = [extract_array(obj._get_label_or_level_values(k)) for k in on]
+        self._dtypes = [key.dtype for key in keys]
+
+        # per key the factorizer and number of groups, and per additional
+        #  key the factorizer of the combined codes; None if one of the keys
+        #  can not be looked up in a hashtable, in which case merges fall
+        #  back to the regular join
+        self._rizers: list[tuple[libhashtable.Factorizer, int]] | None = []
+        self._pair_rizers: list[libhashtable.Int64Factorizer] = []
+        codes = np.zeros(len(obj), dtype=np.intp)
+        ngroups = 1
+        for i, key in enumerate(keys):
+            prepared = self._prepare_key(key)
+            if prepared is None:
+                self._rizers = None
+                return
+            rizer, kcodes, count = self._factorize_key(*prepared)
+            self._rizers.append((rizer, count))
+            if i == 0:
+                codes, ngroups = kcodes, count
+            else:
+                # factorize the pairs so the combined codes never overflow
+                pair_rizer = libhashtable.Int64Factorizer(len(codes))
+                codes = pair_rizer.factorize(ensure_int64(codes * count + kcodes))
+                ngroups = pair_rizer.get_count()
+                self._pair_rizers.append(pair_rizer)
+
+        # group the right rows by code so they can be located per left row
+        self._counts = np.bincount(codes, minlength=ngroups).astype(np.intp, copy=False)
+        self._starts = np.cumsum(self._counts) - self._counts
+        self._sorter = np.argsort(codes, kind="stable").astype(np.intp, copy=False)
+        self._unique = len(codes) == 0 or self._counts.max() <= 1
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(on={self.on}, rows={len(self.obj)})"
+
+    @staticmethod
+    def _prepare_key(
+        key: ArrayLike,
+    ) -> tuple[np.ndarray, npt.NDArray[np.bool_] | None] | None:
+        """
+        Get the values and mask to look up ``key`` in a hashtable.
+
+        Returns None if the key is not supported.
+        """
+        mask = None
+        if isinstance(key, BaseMaskedArray):
+            values, mask = key._data, key._mask
+        elif isinstance(key.dtype, (CategoricalDtype, ArrowDtype)) or (
+            isinstance(key.dtype, StringDtype) and key.dtype.storage == "pyarrow"
+        ):
+            return None
+        elif isinstance(key, ExtensionArray):
+            values, _ = key._values_for_factorize()
+        else:
+            values = key
+
+        if values.dtype.kind in "mM":
+            values = values.view("i8")
+        if values.dtype.type not in _factorizers:
+            return None
+        return values, mask
+
+    @staticmethod
+    def _factorize_key(
+        values: np.ndarray, mask: npt.NDArray[np.bool_] | None
+    ) -> tuple[libhashtable.Factorizer, npt.NDArray[np.intp], int]:
+        """
+        Factorize ``values`` keeping the hashtable for later lookups.
+        """
+        klass = _factorizers[values.dtype.type]
+        if klass is libhashtable.ObjectFactorizer:
+            values = ensure_object(values)
+        rizer = klass(len(values), uses_mask=mask is not None)
+        codes = rizer.factorize(values, mask=mask)
+        # missing values are matched against each other in the last group
+        count = rizer.get_count()
+        codes[codes == -1] = count
+        return rizer, codes, count + 1
+
+    def _get_left_codes(self, left_keys: list[ArrayLike]) -> npt.NDArray[np.intp]:
+        """
+        Find the group of right rows that each left row joins with.
+
+        Rows without a match are labeled -1.
+        """
+        assert self._rizers is not None
+        codes = np.zeros(len(left_keys[0]), dtype=np.intp)
+        for i, (key, (rizer, count)) in enumerate(zip(left_keys, self._rizers)):
+            prepared = self._prepare_key(key)
+            assert prepared is not None
+            values, mask = prepared
+            kcodes = rizer.table.lookup(values, mask)  # type: ignore[attr-defined]
+            # missing values belong to the last group
+            if mask is not None:
+                kcodes[mask] = count - 1
+            elif values.dtype.kind in "fcO":
+                kcodes[isna(values)] = count - 1
+
+            if i == 0:
+                codes = kcodes
+            else:
+                missing = (codes == -1) | (kcodes == -1)
+                pair_rizer = self._pair_rizers[i - 1]
+                codes = pair_rizer.table.lookup(ensure_int64(codes * count + kcodes))
+                codes[missing] = -1
+        return codes
+
+    def _get_join_indexers(
+        self,
+        left_keys: list[ArrayLike],
+        right_keys: list[ArrayLike],
+        how: JoinHow,
+        sort: bool,
+    ) -> tuple[npt.NDArray[np.intp] | None, npt.NDArray[np.intp]] | None:
+        """
+        Get the join indexers by probing the prebuilt hashtable.
+
+        Returns None if the join can not use this index.
+        """
+        if (
+            self._rizers is None
+            or how not in ["inner", "left"]
+            or sort
+            or len(left_keys) != len(self._dtypes)
+            or any(
+                lk.dtype != dtype or rk.dtype != dtype
+                for lk, rk, dtype in zip(left_keys, right_keys, self._dtypes)
+            )
+        ):
+            return None
+
+        codes = self._get_left_codes(left_keys)
+        matched = codes != -1
+        starts = np.zeros(len(codes), dtype=np.intp)
+        counts = np.zeros(len(codes), dtype=np.intp)
+        starts[matched] = self._starts[codes[matched]]
+        counts[matched] = self._counts[codes[matched]]
+
+        if how == "left" and self._unique:
+            ridx = np.full(len(codes), -1, dtype=np.intp)
+            ridx[matched] = self._sorter[starts[matched]]
+            return None, ridx
+
+        if how == "left":
+            # unmatched left rows are kept once, paired with -1
+            counts[~matched] = 1
+        lidx = np.repeat(np.arange(len(codes), dtype=np.intp), counts)
+        positions = _expand_ranges(starts, counts)
+        if how == "inner":
+            return lidx, self._sorter[positions]
+
+        ridx = np.full(len(positions), -1, dtype=np.intp)
+        keep = np.repeat(matched, counts)
+        ridx[keep] = self._sorter[positions[keep]]
+        return lidx, ridx
+
+
 # TODO: transformations??
 class _MergeOperation:
     """
@@ -968,12 +1386,14 @@ class _MergeOperation:
         suffixes: Suffixes = ("_x", "_y"),
         indicator: str | bool = False,
         validate: str | None = None,
+        join_index: JoinIndex | None = None,
     ) -> None:
         _left = _validate_operand(left)
         _right = _validate_operand(right)
         self.left = self.orig_left = _left
         self.right = self.orig_right = _right
         self.how, self.anti_join = self._validate_how(how)
+        self.join_index = join_index
 
         self.on = com.maybe_make_list(on)
 
@@ -1368,6 +1788,12 @@ class _MergeOperation:
         """return the join indexers"""
         # make mypy happy
         assert self.how != "asof"
+        if self.join_index is not None:
+            indexers = self.join_index._get_join_indexers(
+                self.left_join_keys, self.right_join_keys, self.how, self.sort
+            )
+            if indexers is not None:
+                return indexers
         return get_join_indexers(
             self.left_join_keys, self.right_join_keys, sort=self.sort, how=self.how
         )
@@ -2049,9 +2475,24 @@ def get_join_indexers(
     ):
         _, lidx, ridx = left.join(right, how=how, return_indexers=True, sort=sort)
     else:
-        lidx, ridx = get_join_indexers_non_unique(
-            left._values, right._values, sort, how
-        )
+        result = None
+        if (
+            how in ["inner", "left", "right", "outer"]
+            and left.dtype == right.dtype
+            and left._can_use_libjoin
+            and right._can_use_libjoin
+            and left.is_monotonic_increasing
+            and right.is_monotonic_increasing
+        ):
+            # many-to-many join on sorted keys: merge-join without a hashtable
+            result = get_join_indexers_sorted(
+                left._get_join_target(), right._get_join_target(), sort, how
+            )
+        if result is None:
+            result = get_join_indexers_non_unique(
+                left._values, right._values, sort, how
+            )
+        lidx, ridx = result
 
     if lidx is not None and is_range_indexer(lidx, len(left)):
         lidx = None
@@ -2060,6 +2501,94 @@ def get_join_indexers(
     return lidx, ridx
 
 
+def _expand_ranges(
+    starts: npt.NDArray[np.intp], counts: npt.NDArray[np.intp]
+) -> npt.NDArray[np.intp]:
+    """
+    Concatenate ``range(start, start + count)`` for each start and count.
+    """
+    ends = np.cumsum(counts)
+    offsets = np.repeat(starts - (ends - counts), counts)
+    return np.arange(ends[-1] if len(ends) else 0, dtype=np.intp) + offsets
+
+
+def get_join_indexers_sorted(
+    left: np.ndarray,
+    right: np.ndarray,
+    sort: bool = False,
+    how: JoinHow = "inner",
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]] | None:
+    """
+    Get join indexers for monotonic increasing keys that may be non-unique.
+
+    The matches of every left key are located with a binary search into
+    ``right``, so no hashtable is built. The result is ordered like the
+    hash-based join: by left position for inner and left joins, by right
+    position for right joins and, for outer joins, by key if ``sort`` else
+    with the unmatched right rows appended at the end.
+
+    Parameters
+    ----------
+    left : np.ndarray
+        Monotonic increasing left keys without missing values.
+    right : np.ndarray
+        Monotonic increasing right keys without missing values.
+    sort : bool, default False
+        Order the result of an outer join by key.
+    how : {'inner', 'outer', 'left', 'right'}, default 'inner'
+
+    Returns
+    -------
+    tuple[np.ndarray[np.intp], np.ndarray[np.intp]] or None
+        Indexers into left and right, or None for an inner join without
+        ``sort`` with as many matches as left rows of which some match
+        several times. The hash-based join orders those differently.
+    """
+    if how == "right":
+        result = get_join_indexers_sorted(right, left, how="left")
+        assert result is not None
+        ridx, lidx = result
+        return lidx, ridx
+
+    starts = right.searchsorted(left, side="left").astype(np.intp, copy=False)
+    counts = right.searchsorted(left, side="right").astype(np.intp, copy=False)
+    counts -= starts
+    if (
+        how == "inner"
+        and not sort
+        and len(counts)
+        and counts.sum() == len(left)
+        and counts.max() > 1
+    ):
+        # libjoin.inner_join restores the order of the left rows with a
+        #  shortcut when there are as many matches as left rows
+        return None
+    if how != "inner":
+        # unmatched left rows are kept once, paired with -1
+        unmatched = counts == 0
+        counts[unmatched] = 1
+
+    lidx = np.repeat(np.arange(len(left), dtype=np.intp), counts)
+    ridx = _expand_ranges(starts, counts)
+    if how == "inner":
+        return lidx, ridx
+
+    ridx[np.repeat(unmatched, counts)] = -1
+    if how == "outer":
+        rstarts = left.searchsorted(right, side="left")
+        rmissing = np.flatnonzero(left.searchsorted(right, side="right") == rstarts)
+        if sort:
+            # insert the unmatched right rows at their key position
+            row_offsets = np.concatenate([[0], np.cumsum(counts)])
+            loc = row_offsets[rstarts[rmissing]]
+            lidx = np.insert(lidx, loc, -1)
+            ridx = np.insert(ridx, loc, rmissing)
+        else:
+            lidx = np.concatenate([lidx, np.full(len(rmissing), -1, dtype=np.intp)])
+            ridx = np.concatenate([ridx, rmissing])
+    return lidx, ridx
+
+
 def get_join_indexers_non_unique(
     left: ArrayLike,
     right: ArrayLike,
@@ -192,6 +192,7 @@ if TYPE_CHECKING:
         SortKind,
         StorageOptions,
         Suffixes,
+        T,
         ValueKeyFunc,
         WriteBuffer,
         npt,
@@ -199,6 +200,7 @@ if TYPE_CHECKING:
 
     from pandas.core.frame import DataFrame
     from pandas.core.groupby.generic import SeriesGroupBy
+    from pandas.core.lookup import LookupAccessor
 
 __all__ = ["Series"]
 
@@ -1054,6 +1056,44 @@ class Series(base.IndexOpsMixin, NDFrame):  # type: ignore[misc]
         else:
             return self.iloc[loc]
 
+    def lookup_accessor(self) -> LookupAccessor:
+        """
+        Return an object for fast repeated label lookups.
+
+        The returned :class:`pandas.api.typing.LookupAccessor` keeps the
+        index hash table and the values of the Series, so looking up a label
+        skips the key validation done by ``.loc`` and ``.at``. It reflects the
+        Series at the time it was created.
+
+        Returns
+        -------
+        LookupAccessor
+            An accessor with :meth:`~LookupAccessor.get` for a single label
+            and :meth:`~LookupAccessor.get_many` for several labels.
+
+        Raises
+        ------
+        InvalidIndexError
+            If the index is not unique.
+
+        See Also
+        --------
+        Series.at : Access a single value for a row label.
+        DataFrame.lookup_accessor : Fast repeated lookups on a DataFrame.
+
+        Examples
+        --------
+        >>> ser = pd.Series([1.5, 2.5, 3.5], index=["a", "b", "c"])
+        >>> acc = ser.lookup_accessor()
+        >>> acc.get("b")
+        np.float64(2.5)
+        >>> acc.get_many(["c", "a"])
+        array([3.5, 1.5])
+        """
+        from pandas.core.lookup import LookupAccessor
+
+        return LookupAccessor(self)
+
     def __setitem__(self, key, value) -> None:
         if not PYPY:
             if sys.getrefcount(self) <= 3:
@@ -1992,6 +2032,11 @@ class Series(base.IndexOpsMixin, NDFrame):  # type: ignore[misc]
     # ----------------------------------------------------------------------
     # Statistics, overridden ndarray methods
 
+    def _cached_stat(self, key: Hashable, func: Callable[[], T]) -> T:
+        # Statistics are cached on the manager so that they are shared by
+        # everything that uses it and are cleared when the values change.
+        return self._mgr.cached_stat(key, func)
+
     # TODO: integrate bottleneck
     def count(self) -> int:
         """
@@ -2012,7 +2057,9 @@ class Series(base.IndexOpsMixin, NDFrame):  # type: ignore[misc]
         >>> s.count()
         2
         """
-        return notna(self._values).sum().astype("int64")
+        return self._cached_stat(
+            "count", lambda: notna(self._values).sum().astype("int64")
+        )
 
     def mode(self, dropna: bool = True) -> Series:
         """
@@ -3559,6 +3606,15 @@ class Series(base.IndexOpsMixin, NDFrame):  # type: ignore[misc]
         if na_position not in ["first", "last"]:
             raise ValueError(f"invalid na_position: {na_position}")
 
+        monotonic_key = (
+            "is_monotonic_increasing" if ascending else "is_monotonic_decreasing"
+        )
+        if not key and self._mgr.known_stat(monotonic_key):
+            # already sorted (which implies no missing values), skip the argsort
+            if inplace:
+                return self._update_inplace(self)
+            return self.copy(deep=False)
+
         # GH 35922. Make sorting stable by leveraging nargsort
         if key:
             values_to_sort = cast(Series, ensure_key_mapped(self, key))._values
@@ -3574,6 +3630,8 @@ class Series(base.IndexOpsMixin, NDFrame):  # type: ignore[misc]
         result = self._constructor(
             self._values[sorted_index], index=self.index[sorted_index], copy=False
         )
+        if not key and self.dtype.kind in "iufbmM" and not self.hasnans:
+            result._mgr.record_stat(monotonic_key, True)
 
         if ignore_index:
             result.index = default_index(len(sorted_index))
@@ -6707,6 +6765,10 @@ class Series(base.IndexOpsMixin, NDFrame):  # type: ignore[misc]
         >>> s.min()
         0
         """
+        if not kwargs and not numeric_only and axis in (0, None, "index"):
+            return self._cached_stat(
+                ("min", skipna), lambda: NDFrame.min(self, axis=axis, skipna=skipna)
+            )
         return NDFrame.min(
             self, axis=axis, skipna=skipna, numeric_only=numeric_only, **kwargs
         )
@@ -6778,6 +6840,10 @@ class Series(base.IndexOpsMixin, NDFrame):  # type: ignore[misc]
         >>> s.max()
         8
         """
+        if not kwargs and not numeric_only and axis in (0, None, "index"):
+            return self._cached_stat(
+                ("max", skipna), lambda: NDFrame.max(self, axis=axis, skipna=skipna)
+            )
         return NDFrame.max(
             self, axis=axis, skipna=skipna, numeric_only=numeric_only, **kwargs
         )
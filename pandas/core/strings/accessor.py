@@ -358,7 +358,18 @@ class StringMethods(NoNewAttributesMixin):
                     else:
                         return [x]
 
-                result = [cons_row(x) for x in result]
+                if self._is_categorical:
+                    # Rows with the same code hold the same value, so expand
+                    # one row per code and take the expanded rows by code.
+                    shifted_codes = self._orig.array.codes.astype(np.intp) + 1
+                    present = np.flatnonzero(np.bincount(shifted_codes))
+                    positions = np.empty(len(self._parent) + 1, dtype=np.intp)
+                    positions[shifted_codes] = np.arange(len(shifted_codes))
+                    rows = result.take(positions[present])
+                else:
+                    rows = result
+
+                result = [cons_row(x) for x in rows]
                 if result and not self._is_string:
                     # propagate nan values to match longest sequence (GH 18450)
                     max_len = max(len(x) for x in result)
@@ -367,6 +378,13 @@ class StringMethods(NoNewAttributesMixin):
                         for x in result
                     ]
 
+                if self._is_categorical and result:
+                    expanded = lib.to_object_array(result)
+                    positions[present] = np.arange(len(present))
+                    expanded = expanded.take(positions[shifted_codes], axis=0)
+                    labels = range(expanded.shape[1]) if name is None else name
+                    result = dict(zip(labels, expanded.T))
+
         if not isinstance(expand, bool):
             raise ValueError("expand must be True or False")
 
@@ -1375,6 +1393,94 @@ class StringMethods(NoNewAttributesMixin):
         result = self._data.array._str_contains(pat, case, flags, na, regex)
         return self._wrap_result(result, fill_value=na, returns_string=False)
 
+    @forbid_nonstring_types(["bytes"])
+    def contains_any(
+        self,
+        pats,
+        case: bool = True,
+        flags: int = 0,
+        na=lib.no_default,
+        regex: bool = False,
+    ):
+        r"""
+        Test if any of several patterns is contained within each string.
+
+        The patterns are combined into a single regular expression that is
+        matched once against each string, which is much faster than calling
+        :meth:`Series.str.contains` once per pattern. Literal patterns are
+        merged into a prefix tree, so strings sharing a prefix are only
+        compared once.
+
+        .. versionadded:: 3.0.0
+
+        Parameters
+        ----------
+        pats : list-like of str
+            Character sequences or regular expressions.
+        case : bool, default True
+            If True, case sensitive.
+        flags : int, default 0 (no flags)
+            Flags to pass through to the re module, e.g. re.IGNORECASE.
+        na : scalar, optional
+            Fill value for missing values. The default depends on dtype of the
+            array. For object-dtype, ``numpy.nan`` is used. For the nullable
+            ``StringDtype``, ``pandas.NA`` is used. For the ``"str"`` dtype,
+            ``False`` is used.
+        regex : bool, default False
+            If True, assumes the patterns are regular expressions.
+
+            If False, treats the patterns as literal strings.
+
+        Returns
+        -------
+        Series or Index of boolean values
+            A Series or Index of boolean values indicating whether any of the
+            given patterns is contained within the string of each element
+            of the Series or Index.
+
+        See Also
+        --------
+        Series.str.contains : Test if a single pattern or regex is contained
+            within each string.
+
+        Examples
+        --------
+        >>> s = pd.Series(["Mouse", "dog", "house and parrot", "23", np.nan])
+        >>> s.str.contains_any(["dog", "parrot"])
+        0    False
+        1     True
+        2     True
+        3    False
+        4      NaN
+        dtype: object
+
+        >>> s.str.contains_any(["MOUSE", r"\d+"], case=False, regex=True)
+        0     True
+        1    False
+        2    False
+        3     True
+        4      NaN
+        dtype: object
+        """
+        if isinstance(pats, (str, bytes)) or not is_list_like(pats):
+            raise TypeError(
+                f"pats must be a list-like of strings, not {type(pats).__name__}"
+            )
+        pats = list(dict.fromkeys(pats))
+        if not all(isinstance(pat, str) for pat in pats):
+            raise TypeError("pats must be a list-like of strings")
+
+        if not pats:
+            # a lookahead that never matches
+            pat = "(?!)"
+        elif regex:
+            pat = "|".join(f"(?:{pat})" for pat in pats)
+        else:
+            pat = _literals_to_regex(pats)
+
+        result = self._data.array._str_contains(pat, case, flags, na, regex=True)
+        return self._wrap_result(result, fill_value=na, returns_string=False)
+
     @forbid_nonstring_types(["bytes"])
     def match(self, pat: str, case: bool = True, flags: int = 0, na=lib.no_default):
         """
@@ -3933,6 +4039,42 @@ def _get_single_group_name(regex: re.Pattern) -> Hashable:
         return None
 
 
+def _literals_to_regex(words: list[str]) -> str:
+    """
+    Build a regular expression matching any of ``words`` from a prefix tree.
+
+    Words sharing a prefix share a branch of the expression, so the regex
+    engine does not backtrack over the common prefix for each word. Since the
+    expression is only used to test containment, a word that extends another
+    word is dropped.
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            if None in node:
+                break
+            node = node.setdefault(char, {})
+        else:
+            node.clear()
+            node[None] = {}
+
+    def build(node: dict) -> str:
+        parts = []
+        # follow chains without branches iteratively to bound the recursion
+        while len(node) == 1 and None not in node:
+            char, node = next(iter(node.items()))
+            parts.append(re.escape(char))
+        if None not in node:
+            alternatives = [
+                re.escape(char) + build(child) for char, child in node.items()
+            ]
+            parts.append("(?:" + "|".join(alternatives) + ")")
+        return "".join(parts)
+
+    return build(trie)
+
+
 def _get_group_names(regex: re.Pattern) -> list[Hashable] | range:
     """
     Get named groups from compiled regex.
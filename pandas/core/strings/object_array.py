@@ -14,6 +14,7 @@ import warnings
 import numpy as np
 
 from pandas._libs import lib
+from pandas._libs import strings as libstrings
 import pandas._libs.missing as libmissing
 import pandas._libs.ops as libops
 from pandas.util._exceptions import find_stack_level
@@ -525,15 +526,9 @@ class ObjectStringArrayMixin(BaseStringArrayMethods):
 
             return self._str_map(g, convert=False)
 
-        empty_row = [na_value] * regex.groups
+        from pandas.core.strings.accessor import _get_group_names
 
-        def f(x):
-            if not isinstance(x, str):
-                return empty_row
-            m = regex.search(x)
-            if m:
-                return [na_value if item is None else item for item in m.groups()]
-            else:
-                return empty_row
-
-        return [f(val) for val in np.asarray(self)]
+        columns = libstrings.str_extract(
+            np.asarray(self, dtype=object), regex, na_value
+        )
+        return dict(zip(_get_group_names(regex), columns))
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from collections import abc
-from datetime import date
+from datetime import (
+    date,
+    datetime,
+)
 from functools import partial
-from itertools import islice
 from typing import (
     TYPE_CHECKING,
     TypedDict,
@@ -15,6 +17,8 @@ import warnings
 
 import numpy as np
 
+from pandas._config import get_option
+
 from pandas._libs import (
     lib,
     tslib,
@@ -27,6 +31,10 @@ from pandas._libs.tslibs import (
     is_supported_dtype,
     timezones as libtimezones,
 )
+from pandas._libs.hashtable import (
+    estimate_unique,
+    value_count,
+)
 from pandas._libs.tslibs.conversion import cast_from_unit_vectorized
 from pandas._libs.tslibs.dtypes import NpyDatetimeUnit
 from pandas._libs.tslibs.parsing import (
@@ -41,6 +49,7 @@ from pandas._typing import (
 )
 from pandas.util._exceptions import find_stack_level
 
+from pandas.core.dtypes.cast import construct_1d_object_array_from_listlike
 from pandas.core.dtypes.common import (
     ensure_object,
     is_float,
@@ -64,7 +73,10 @@ from pandas.arrays import (
     IntegerArray,
     NumpyExtensionArray,
 )
-from pandas.core.algorithms import unique
+from pandas.core.algorithms import (
+    factorize,
+    unique,
+)
 from pandas.core.arrays import ArrowExtensionArray
 from pandas.core.arrays.base import ExtensionArray
 from pandas.core.arrays.datetimes import (
@@ -122,6 +134,8 @@ class FulldatetimeDict(YearMonthDayDict, total=False):
 
 DictConvertible = Union[FulldatetimeDict, "DataFrame"]
 start_caching_at = 50
+# number of elements of a list-like sampled to decide on caching
+cache_sample_size = 10_000
 
 
 # ---------------------------------------------------------------------
@@ -174,10 +188,14 @@ def should_cache(
     Notes
     -----
     By default for a sequence of less than 50 items in size, we don't do
-    caching; for the number of elements less than 5000, we take ten percent of
-    all elements to check for a uniqueness share; if the sequence size is more
-    than 5000, then we check only the first 500 elements.
-    All constants were chosen empirically by.
+    caching; otherwise the number of unique elements is estimated with a
+    HyperLogLog sketch, which hashes every element once. Arrays are estimated
+    as a whole, as a prefix or a sample of a few hundred elements cannot tell
+    values repeated a few times apart from unique values, nor see repetition
+    that only appears late in the sequence. Other list-likes are sampled
+    evenly spread over the sequence instead of being converted as a whole.
+    If `check_count` is given, the `check_count` elements are taken evenly
+    spread over the sequence and their unique elements are counted exactly.
     """
     do_caching = True
 
@@ -186,11 +204,6 @@ def should_cache(
         # in this case, the gain from caching is negligible
         if len(arg) <= start_caching_at:
             return False
-
-        if len(arg) <= 5000:
-            check_count = len(arg) // 10
-        else:
-            check_count = 500
     else:
         assert 0 <= check_count <= len(arg), (
             "check_count must be in next bounds: [0; len(arg)]"
@@ -200,12 +213,33 @@ def should_cache(
 
     assert 0 < unique_share < 1, "unique_share must be in next bounds: (0; 1)"
 
+    exact = check_count is not None
+    if isinstance(arg, (np.ndarray, ExtensionArray, Index, ABCSeries)):
+        values = extract_array(arg, extract_numpy=True)
+        if not isinstance(values, np.ndarray) or values.ndim != 1:
+            values = np.asarray(values, dtype=object).ravel()
+        if exact:
+            positions = np.linspace(0, len(values) - 1, check_count).astype(np.intp)
+            values = values.take(positions)
+    else:
+        # sample the elements instead of converting the whole list-like
+        if not isinstance(arg, (list, tuple)):
+            arg = list(arg)
+        if check_count is None:
+            check_count = min(len(arg), cache_sample_size)
+        positions = np.linspace(0, len(arg) - 1, check_count).astype(np.intp)
+        values = construct_1d_object_array_from_listlike([arg[i] for i in positions])
+    if values.dtype.kind not in "biufmMO":
+        values = values.astype(object)
+
     try:
         # We can't cache if the items are not hashable.
-        unique_elements = set(islice(arg, check_count))
+        n_unique = estimate_unique(values)
     except TypeError:
         return False
-    if len(unique_elements) > check_count * unique_share:
+    if exact:
+        n_unique = len(value_count(values, False)[0])
+    if n_unique > len(values) * unique_share:
         do_caching = False
     return do_caching
 
@@ -432,6 +466,11 @@ def _convert_listlike_datetimes(
     if format is not None and format != "mixed":
         return _array_strptime_with_fallback(arg, name, utc, format, exact, errors)
 
+    if format == "mixed" and not yearfirst:
+        result = _objects_to_datetime64_by_shape(arg, dayfirst, utc, errors)
+        if result is not None:
+            return _box_as_indexlike(result, utc=utc, name=name)
+
     result, tz_parsed = objects_to_datetime64(
         arg,
         dayfirst=dayfirst,
@@ -464,7 +503,14 @@ def _array_strptime_with_fallback(
     """
     Call array_strptime, with fallback behavior depending on 'errors'.
     """
-    result, tz_out = array_strptime(arg, fmt, exact=exact, errors=errors, utc=utc)
+    result, tz_out = array_strptime(
+        arg,
+        fmt,
+        exact=exact,
+        errors=errors,
+        utc=utc,
+        nthreads=get_option("compute.parse_threads"),
+    )
     if tz_out is not None:
         unit = np.datetime_data(result.dtype)[0]
         dtype = DatetimeTZDtype(tz=tz_out, unit=unit)
@@ -479,6 +525,111 @@ def _array_strptime_with_fallback(
     return Index(result, dtype=result.dtype, name=name)
 
 
+# strings with the same characters after mapping digits to "0" and ASCII
+#  letters to "a" share a shape, and are parsed with one inferred format
+_SHAPE_TABLE = str.maketrans(
+    "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ",
+    "0" * 10 + "a" * 52,
+)
+# shapes with fewer strings are parsed element by element
+_MIN_SHAPE_COUNT = 4
+# strings of a shape a format is guessed from before giving up on the shape
+_SHAPE_GUESS_TRIES = 8
+
+
+def _guess_shape_format(value: str, dayfirst: bool | None) -> str | None:
+    """
+    Guess the format used for all strings with the shape of ``value``.
+
+    Returns None if the format does not pin down the parsed value the way
+    parsing each string individually would.
+    """
+    with warnings.catch_warnings():
+        # format="mixed" does not warn about the order of day and month
+        warnings.filterwarnings("ignore", "Parsing dates in", UserWarning)
+        fmt = guess_datetime_format(value, dayfirst=dayfirst)
+        if fmt is None or "%Y" not in fmt or "%z" in fmt or "%Z" in fmt:
+            return None
+        if "%d" in fmt and "%m" in fmt:
+            # ``value`` may only be valid with day and month in the order that
+            #  is not preferred, guess again from a string where both are valid
+            probe = datetime(2000, 1, 2, 3, 4, 5).strftime(fmt)
+            preferred = guess_datetime_format(probe, dayfirst=dayfirst)
+            swapped = fmt.replace("%d", "%\0").replace("%m", "%d").replace("%\0", "%m")
+            if preferred not in (fmt, swapped):
+                return None
+            fmt = preferred
+    return fmt
+
+
+def _objects_to_datetime64_by_shape(
+    arg: np.ndarray, dayfirst: bool | None, utc: bool, errors: str
+) -> np.ndarray | None:
+    """
+    Parse strings of mixed formats, inferring one format per shape.
+
+    Strings are grouped by shape and each group is parsed with
+    ``array_strptime`` using a format guessed from one of its strings. Values
+    that do not match their group's format are parsed individually as with
+    ``format="mixed"``.
+
+    Returns None if no group could be parsed with a format, or if the values
+    parsed individually are not all tz-naive (or converted to UTC), in which
+    case the caller parses every value individually.
+    """
+    shapes = np.array(
+        [x.translate(_SHAPE_TABLE) if type(x) is str else None for x in arg],
+        dtype=object,
+    )
+    codes, _ = factorize(shapes)
+    counts = np.bincount(codes + 1)
+    order = np.argsort(codes, kind="stable")
+    bounds = np.cumsum(counts)
+
+    parsed = np.zeros(len(arg), dtype=bool)
+    pieces = []
+    for code in np.flatnonzero(counts[1:] >= _MIN_SHAPE_COUNT):
+        positions = order[bounds[code] : bounds[code + 1]]
+        # guessing can fail for some strings of a shape, try a few of them
+        step = max(len(positions) // _SHAPE_GUESS_TRIES, 1)
+        for value in arg[positions[::step][:_SHAPE_GUESS_TRIES]]:
+            fmt = _guess_shape_format(value, dayfirst)
+            if fmt is not None:
+                break
+        else:
+            continue
+        values, _ = array_strptime(arg[positions], fmt, errors="coerce")
+        mask = ~np.isnat(values)
+        pieces.append((positions[mask], values[mask]))
+        parsed[positions[mask]] = True
+
+    if not pieces:
+        return None
+
+    remaining = np.flatnonzero(~parsed)
+    if len(remaining):
+        try:
+            values, tz_parsed = objects_to_datetime64(
+                arg[remaining],
+                dayfirst=dayfirst,
+                yearfirst=False,
+                utc=utc,
+                errors=errors,
+                allow_object=True,
+            )
+        except (ValueError, TypeError):
+            # re-raise with the positions of the whole array
+            return None
+        if values.dtype == object or (tz_parsed is not None and not utc):
+            return None
+        pieces.append((remaining, values))
+
+    result = np.empty(len(arg), dtype=np.result_type(*(v.dtype for _, v in pieces)))
+    for positions, values in pieces:
+        result[positions] = values
+    return result
+
+
 def _to_datetime_with_unit(arg, unit, name, utc: bool, errors: str) -> Index:
     """
     to_datetime specalized to the case where a 'unit' is passed.
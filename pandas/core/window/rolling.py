@@ -475,7 +475,7 @@ class BaseWindow(SelectionMixin):
         if name == "count":
             # GH 12541: Special case for count where we support date-like types
             obj = notna(obj).astype(int)
-            obj._mgr = obj._mgr.consolidate()
+            obj._mgr = obj._mgr.maybe_consolidate()
 
         taker = []
         res_values = []
@@ -764,6 +764,18 @@ def date_converter(
     if date_col.dtype.kind in "Mm":
         return date_col
 
+    if cache_dates and tools.should_cache(date_col):
+        # convert each distinct value once, missing values are a value too
+        codes, uniques = algorithms.factorize(date_col, use_na_sentinel=False)
+        result = date_converter(
+            uniques,
+            col=col,
+            dayfirst=dayfirst,
+            cache_dates=False,
+            date_format=date_format,
+        )
+        return result.take(codes)
+
     date_fmt = date_format.get(col) if isinstance(date_format, dict) else date_format
 
     str_objs = lib.ensure_string_array(np.asarray(date_col))
@@ -26,6 +26,8 @@ import warnings
 
 import numpy as np
 
+from pandas._config import get_option
+
 from pandas._libs import lib
 from pandas._libs.parsers import STR_NA_VALUES
 from pandas.errors import (
@@ -44,10 +46,14 @@ from pandas.core.dtypes.common import (
     is_float,
     is_integer,
     is_list_like,
+    is_object_dtype,
     pandas_dtype,
 )
 
-from pandas import Series
+from pandas import (
+    Series,
+    StringDtype,
+)
 from pandas.core.frame import DataFrame
 from pandas.core.indexes.api import RangeIndex
 from pandas.core.shared_docs import _shared_docs
@@ -668,6 +674,10 @@ def _validate_names(names: Sequence[Hashable] | None) -> None:
             raise ValueError("Names should be an ordered collection.")
 
 
+# rows checked before counting the unique values of a whole column
+_DICTIONARY_ENCODE_PREFIX = 1000
+
+
 def _read(
     filepath_or_buffer: FilePath | ReadCsvBuffer[bytes] | ReadCsvBuffer[str], kwds
 ) -> DataFrame | TextFileReader:
@@ -716,7 +726,36 @@ def _read(
         return parser
 
     with parser:
-        return parser.read(nrows)
+        frame = parser.read(nrows)
+
+    unique_ratio = get_option("io.parser.auto_dictionary_encode")
+    if unique_ratio is not None:
+        frame = _dictionary_encode(frame, unique_ratio, kwds.get("dtype"))
+    return frame
+
+
+def _dictionary_encode(frame: DataFrame, unique_ratio: float, dtype) -> DataFrame:
+    """
+    Convert object and string columns with few unique values to ``category``.
+
+    Columns given an explicit dtype are left unchanged. Since a prefix of a
+    column cannot have more unique values than the whole column, most high
+    cardinality columns are ruled out by looking at their first rows only.
+    """
+    if len(frame) == 0 or (dtype is not None and not isinstance(dtype, dict)):
+        return frame
+
+    max_uniques = unique_ratio * len(frame)
+    for i, (name, values) in enumerate(frame.items()):
+        if dtype is not None and name in dtype:
+            continue
+        if not (is_object_dtype(values.dtype) or isinstance(values.dtype, StringDtype)):
+            continue
+        if values.iloc[:_DICTIONARY_ENCODE_PREFIX].nunique(dropna=False) > max_uniques:
+            continue
+        if values.nunique(dropna=False) <= max_uniques:
+            frame.isetitem(i, values.astype("category"))
+    return frame
 
 
 @overload
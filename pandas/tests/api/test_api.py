@@ -58,6 +58,7 @@ class TestPDApi(Base):
         "Categorical",
         "CategoricalIndex",
         "DataFrame",
+        "DataFrameBuilder",
         "DateOffset",
         "DatetimeIndex",
         "ExcelFile",
@@ -126,6 +127,7 @@ class TestPDApi(Base):
         "merge",
         "merge_ordered",
         "merge_asof",
+        "merge_range",
         "period_range",
         "pivot",
         "pivot_table",
@@ -259,6 +261,10 @@ class TestApi(Base):
         "ExponentialMovingWindowGroupby",
         "FrozenList",
         "JsonReader",
+        "JoinIndex",
+        "LazyFrame",
+        "LazyGroupBy",
+        "LookupAccessor",
         "NaTType",
         "NAType",
         "NoDefault",
@@ -424,6 +430,7 @@ def test_set_module():
     assert pd.merge.__module__ == "pandas"
     assert pd.merge_ordered.__module__ == "pandas"
     assert pd.merge_asof.__module__ == "pandas"
+    assert pd.merge_range.__module__ == "pandas"
     assert pd.read_csv.__module__ == "pandas"
     assert pd.read_table.__module__ == "pandas"
     assert pd.read_fwf.__module__ == "pandas"
@@ -1791,3 +1791,110 @@ def test_agg_dist_like_and_nonunique_columns():
     result = df.agg({"A": "count"})
     expected = df["A"].count()
     tm.assert_series_equal(result, expected)
+
+
+def test_apply_vectorize():
+    df = DataFrame({"A": [1.0, 2.0, np.nan], "B": [4, 5, 6]}, index=list("xyz"))
+    calls = []
+
+    def func(row, c):
+        calls.append(type(row))
+        return row["A"] * c + row["B"]
+
+    result = df.apply(func, axis=1, args=(2,), vectorize=True)
+    expected = Series([6.0, 9.0, np.nan], index=list("xyz"))
+    tm.assert_series_equal(result, expected)
+    # once with the frame, then with a sample of rows to check the result
+    assert calls == [DataFrame, Series, Series, Series]
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        # control flow on row values raises with a DataFrame
+        lambda row: row["A"] if row["B"] > 4 else 0,
+        # returns a Series aligned with the columns
+        lambda row: row.sum(),
+        # list-like results
+        lambda row: [row["A"], row["B"]],
+    ],
+)
+def test_apply_vectorize_fallback(func):
+    df = DataFrame({"A": [1.0, 2.0, 3.0], "B": [4, 5, 6]})
+    result = df.apply(func, axis=1, vectorize=True)
+    expected = df.apply(func, axis=1)
+    tm.assert_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        DataFrame(np.arange(9).reshape(3, 3)),
+        # the first row agrees with the frame-wise sum
+        DataFrame(
+            [[1, 2, 3], [2, 5, 0], [3, 1, 9]], index=list("abc"), columns=list("abc")
+        ),
+    ],
+)
+def test_apply_vectorize_reduction_matching_index(df):
+    # square frame whose columns equal the index: the frame-wise sum looks
+    #  aligned with the index, but is not the row-wise result
+    result = df.apply(lambda row: row.sum(), axis=1, vectorize=True)
+    expected = df.apply(lambda row: row.sum(), axis=1)
+    tm.assert_series_equal(result, expected)
+
+
+def test_apply_vectorize_columns_in_index():
+    df = DataFrame(
+        [[1, 2, 3], [2, 5, 0], [3, 1, 9]], index=list("abc"), columns=list("abc")
+    )
+    calls = []
+
+    def func(row):
+        calls.append(type(row))
+        return row["a"] + row["c"]
+
+    result = df.apply(func, axis=1, vectorize=True)
+    expected = Series([4, 2, 12], index=list("abc"))
+    tm.assert_series_equal(result, expected)
+    # no fallback to the row-wise path
+    assert calls == [DataFrame, Series, Series, Series]
+
+
+@pytest.mark.parametrize(
+    "df, func",
+    [
+        # the rows of a frame with int and float columns are upcast to float
+        (DataFrame({"A": [1, 2], "B": [0.5, 1.5]}), lambda row: row["A"]),
+        # integer division by zero gives inf on columns but 0 on rows, in a
+        #  row that is not sampled
+        (
+            DataFrame({"a": range(1, 11), "b": [1, 1, 1, 0, 1, 1, 1, 1, 1, 1]}),
+            lambda row: row["a"] // row["b"],
+        ),
+        (
+            DataFrame({"a": range(1, 11), "b": [1, 1, 1, 0, 1, 1, 1, 1, 1, 1]}),
+            lambda row: row["a"] % row["b"],
+        ),
+    ],
+)
+def test_apply_vectorize_dtype_mismatch(df, func):
+    # results with another dtype than the row-wise results are not used
+    with np.errstate(all="ignore"):
+        expected = df.apply(func, axis=1)
+        result = df.apply(func, axis=1, vectorize=True)
+    tm.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "kwargs, msg",
+    [
+        ({"axis": 0}, "only supported with axis=1"),
+        ({"axis": 1, "raw": True}, "only supported with raw=False"),
+        ({"axis": 1, "engine": "numba"}, "only supported with raw=False"),
+    ],
+)
+def test_apply_vectorize_invalid(kwargs, msg):
+    df = DataFrame({"A": [1, 2]})
+    with pytest.raises(ValueError, match=msg):
+        df.apply(lambda row: row["A"], vectorize=True, **kwargs)
@@ -99,6 +99,19 @@ def test_period_array_freq_mismatch():
         PeriodArray(arr, dtype=dtype)
 
 
+@pytest.mark.parametrize("n", [10, 5000])
+def test_period_array_repeated_values(n):
+    # strings are parsed once per distinct value
+    data = np.array(["2000-01", "NaT", pd.Period("2000-02", "M"), "2000-03"] * n)
+    result = period_array(data, freq="M")
+    expected = period_array(["2000-01", None, "2000-02", "2000-03"] * n, freq="M")
+    tm.assert_period_array_equal(result, expected)
+
+    data[-1] = pd.Period("2000-03", "D")
+    with pytest.raises(IncompatibleFrequency, match="freq"):
+        period_array(data, freq="M")
+
+
 def test_from_sequence_disallows_i8():
     arr = period_array(["2000", "2001"], freq="D")
 
@@ -764,3 +764,50 @@ def test_string_array_view_type_error():
     arr = pd.array(["a", "b", "c"], dtype="string")
     with pytest.raises(TypeError, match="Cannot change data-type for string array."):
         arr.view("i8")
+
+
+@pytest.mark.parametrize("na_value", [pd.NA, np.nan])
+def test_str_methods_python_storage(na_value):
+    # the common methods of the python storage use dedicated kernels
+    dtype = pd.StringDtype("python", na_value=na_value)
+    ser = pd.Series([" aBc", None, "x.y ", "abc"], dtype=dtype)
+    obj = ser.astype(object)
+
+    for result, expected in [
+        (ser.str.lower(), obj.str.lower()),
+        (ser.str.upper(), obj.str.upper()),
+        (ser.str.strip(), obj.str.strip()),
+        (ser.str.lstrip(" a"), obj.str.lstrip(" a")),
+        (ser.str.rstrip(), obj.str.rstrip()),
+        (ser.str.replace("b", "-", regex=False), obj.str.replace("b", "-")),
+        (ser.str.replace(".", "-", regex=True), obj.str.replace(".", "-", regex=True)),
+        (ser.str.replace("c", "-", n=1), obj.str.replace("c", "-", n=1)),
+    ]:
+        tm.assert_series_equal(result, expected.astype(dtype))
+
+    if na_value is pd.NA:
+        bool_dtype = "boolean"
+        expected_len = pd.Series([4, pd.NA, 4, 3], dtype="Int64")
+    else:
+        # NaN propagates as False
+        bool_dtype = bool
+        expected_len = pd.Series([4, np.nan, 4, 3])
+    expected_bool = pd.Series([True, na_value, False, True]).astype(bool_dtype)
+    if na_value is np.nan:
+        expected_bool[1] = False
+    tm.assert_series_equal(ser.str.contains("b", case=False), expected_bool)
+    tm.assert_series_equal(
+        ser.str.contains("B", regex=False, case=False), expected_bool
+    )
+    tm.assert_series_equal(ser.str.endswith(("c", "C")), expected_bool)
+    tm.assert_series_equal(ser.str.len(), expected_len)
+
+    result = ser.str.startswith(("a", " a"), na=True)
+    expected = pd.Series([True, True, False, True], dtype=bool_dtype)
+    tm.assert_series_equal(result, expected)
+
+    # regex special characters are not treated as literals
+    result = ser.str.contains(".")
+    expected = pd.Series([True, True, True, True], dtype=bool_dtype)
+    expected[1] = na_value if na_value is pd.NA else False
+    tm.assert_series_equal(result, expected)
@@ -909,6 +909,40 @@ class TestDatetimeArray(SharedTests):
             expected = pd.array(expected, dtype=pd.StringDtype(na_value=np.nan))
         tm.assert_equal(result, expected)
 
+    @pytest.mark.parametrize(
+        "date_format",
+        ["%d/%m/%Y %H:%M:%S.%f", "%Y%m%d", "%H%%%M", "%Y %b", "week %d/%m"],
+    )
+    @pytest.mark.parametrize("tz", [None, "US/Eastern"])
+    def test_strftime_repeated_values(self, date_format, tz):
+        # values are formatted once per distinct value (or date)
+        dti = pd.date_range("0999-12-29", periods=8, freq="37h", unit="s", tz=tz)
+        dti = dti.append(
+            pd.date_range("2016-03-12", periods=30, freq="1h41min", unit="s", tz=tz)
+        )
+        dti = dti.as_unit("us").insert(3, NaT)[np.arange(5000) % 39]
+        arr = dti._data
+
+        result = arr._format_native_types(date_format=date_format)
+        expected = np.array(
+            [x.strftime(date_format) if x is not NaT else "NaT" for x in dti],
+            dtype=object,
+        )
+        tm.assert_numpy_array_equal(result, expected)
+        assert result[40] is result[1]
+
+    @pytest.mark.parametrize("unit", ["ms", "us", "ns"])
+    def test_format_native_types_default(self, unit):
+        dti = pd.date_range("2016-01-01", periods=5, freq="1001ms", unit="ms")
+        dti = dti.as_unit(unit)[np.arange(5000) % 5]
+
+        # millisecond resolution is shown whatever the unit
+        result = dti._data._format_native_types()
+        expected = np.array(
+            [x.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3] for x in dti], dtype=object
+        )
+        tm.assert_numpy_array_equal(result, expected)
+
 
 class TestTimedeltaArray(SharedTests):
     index_cls = TimedeltaIndex
@@ -1191,6 +1225,40 @@ class TestPeriodArray(SharedTests):
             expected = pd.array(expected, dtype=pd.StringDtype(na_value=np.nan))
         tm.assert_equal(result, expected)
 
+    @pytest.mark.parametrize("date_format", [None, "%Y-%m", "%b %Y"])
+    @pytest.mark.parametrize("repeats", [True, False])
+    def test_strftime_repeated_values(self, date_format, repeats):
+        # values are formatted once per distinct ordinal
+        pi = pd.period_range("2000-01", periods=5000, freq="M").insert(3, NaT)
+        if repeats:
+            pi = pi[np.arange(5000) % 39]
+        arr = pi._data
+
+        result = arr._format_native_types(date_format=date_format)
+        if date_format is None:
+            expected = np.array([str(x) for x in pi], dtype=object)
+        else:
+            expected = np.array(
+                [x.strftime(date_format) if x is not NaT else "NaT" for x in pi],
+                dtype=object,
+            )
+        tm.assert_numpy_array_equal(result, expected)
+        if repeats:
+            assert result[40] is result[1]
+
+    def test_astype_object_repeated_values(self):
+        pi = PeriodIndex(["2000-01", NaT, "2000-03"], freq="M")[np.arange(5000) % 3]
+        result = pi._data.astype(object)
+        assert list(result) == list(pi)
+        assert result[1] is NaT
+        assert result[3] is result[0]
+
+    def test_sub_period_repeated_values(self):
+        pi = PeriodIndex(["2000-01", NaT, "2000-03"], freq="2M")[np.arange(10) % 3]
+        result = pi._data - pi[0]
+        expected = np.array([p - pi[0] for p in pi], dtype=object)
+        tm.assert_numpy_array_equal(result, expected)
+
 
 @pytest.mark.parametrize(
     "arr,casting_nats",
@@ -12,6 +12,7 @@ from pandas.errors import PerformanceWarning
 from pandas import (
     DataFrame,
     Index,
+    option_context,
 )
 import pandas._testing as tm
 
@@ -85,6 +86,26 @@ class TestDataFrameInsert:
         assert df.iloc[0, 0] == df[0][0]
         assert df.iloc[0, 0] != 99
 
+    def test_insert_consolidation_threshold(self):
+        df = DataFrame(np.random.default_rng(2).standard_normal((4, 3)))
+        with option_context(
+            "mode.consolidation", "threshold", "mode.consolidation_threshold", 10
+        ):
+            with tm.assert_produces_warning(None):
+                for n in range(150):
+                    df[n + 3] = df[1] * n
+                    assert len(df._mgr.blocks) <= 10
+        assert df.shape == (4, 153)
+        tm.assert_series_equal(df[5], df[1] * 2, check_names=False)
+
+    def test_insert_consolidation_never(self):
+        df = DataFrame(np.random.default_rng(2).standard_normal((4, 3)))
+        with option_context("mode.consolidation", "never"):
+            with tm.assert_produces_warning(None):
+                for n in range(150):
+                    df[n + 3] = df[1] * n
+        assert len(df._mgr.blocks) == 151
+
     def test_insert_EA_no_warning(self):
         # PerformanceWarning about fragmented frame should not be raised when
         # using EAs (https://github.com/pandas-dev/pandas/issues/44098)
@@ -0,0 +1,47 @@
+import numpy as np
+
+import pandas as pd
+from pandas import DataFrame
+import pandas._testing as tm
+from pandas.api.internals import nblocks
+
+
+class TestCompact:
+    def test_compact(self):
+        df = DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+        for i in range(5):
+            df[f"c{i}"] = np.arange(3, dtype=np.float64) + i
+        assert nblocks(df) == 7
+
+        result = df.compact()
+        assert nblocks(result) == 3
+        assert nblocks(df) == 7
+        tm.assert_frame_equal(result, df)
+
+    def test_compact_does_not_share_writes(self):
+        df = DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+        df["c"] = 1.5
+        df["d"] = 2.5
+
+        result = df.compact()
+        result.iloc[0, 0] = 10
+        result.iloc[0, 1] = "w"
+        assert df.iloc[0, 0] == 1
+        assert df.iloc[0, 1] == "x"
+
+        df.iloc[1, 1] = "v"
+        assert result.iloc[1, 1] == "y"
+
+    def test_compact_consolidated(self):
+        df = DataFrame({"a": [1, 2], "b": [3, 4]})
+        result = df.compact()
+        assert result is not df
+        assert nblocks(result) == 1
+        tm.assert_frame_equal(result, df)
+
+    def test_compact_with_consolidation_never(self):
+        df = DataFrame({"a": [1, 2]})
+        with pd.option_context("mode.consolidation", "never"):
+            df["b"] = [3, 4]
+            assert nblocks(df.copy()) == 2
+            assert nblocks(df.compact()) == 1
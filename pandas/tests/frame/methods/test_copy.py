@@ -1,6 +1,7 @@
 import numpy as np
 import pytest
 
+import pandas as pd
 from pandas import DataFrame
 
 
@@ -39,3 +40,10 @@ class TestCopy:
         assert len(df._mgr.blocks) == 11
         result = df.copy()
         assert len(result._mgr.blocks) == 1
+
+    def test_copy_consolidation_never(self):
+        df = DataFrame({"a": [1, 2]})
+        df["b"] = [3, 4]
+        with pd.option_context("mode.consolidation", "never"):
+            result = df.copy()
+        assert len(result._mgr.blocks) == 2
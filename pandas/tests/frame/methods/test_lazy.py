@@ -0,0 +1,238 @@
+import numpy as np
+import pytest
+
+import pandas as pd
+from pandas import DataFrame
+import pandas._testing as tm
+from pandas.api.typing import LazyFrame
+
+
+@pytest.fixture
+def left():
+    return DataFrame(
+        {
+            "key": [1, 2, 3, 4, 5, 6],
+            "a": [5.0, 3.0, np.nan, 1.0, 4.0, 2.0],
+            "b": list("abcdef"),
+            "unused": range(6),
+        }
+    )
+
+
+@pytest.fixture
+def right():
+    return DataFrame(
+        {
+            "key": [1, 2, 3, 4, 7],
+            "c": [10, 20, 30, 40, 70],
+            "b": list("vwxyz"),
+            "unused2": range(5),
+        }
+    )
+
+
+def test_lazy_returns_lazyframe(left):
+    lf = left.lazy()
+    assert isinstance(lf, LazyFrame)
+    tm.assert_frame_equal(lf.collect(), left)
+    tm.assert_index_equal(lf.columns, left.columns)
+
+
+def test_lazy_filter_sort_head(left):
+    lf = left.lazy().filter("a > 1").sort_values("a").head(2)
+    expected = left.query("a > 1").sort_values("a").head(2)
+    tm.assert_frame_equal(lf.collect(), expected)
+
+
+def test_lazy_filter_local_variable(left):
+    threshold = 2
+    result = left.lazy().filter("key > @threshold").collect()
+    tm.assert_frame_equal(result, left[left["key"] > threshold])
+
+
+def test_lazy_filter_callable(left):
+    result = left.lazy().filter(lambda df: df["b"] != "c").collect()
+    tm.assert_frame_equal(result, left[left["b"] != "c"])
+
+
+@pytest.mark.parametrize("ascending", [True, False])
+def test_lazy_sort_head_uses_topn(left, ascending):
+    lf = left.lazy().sort_values("a", ascending=ascending).head(3)
+    method = "nsmallest" if ascending else "nlargest"
+    assert f"TopN({method}" in lf.explain()
+    expected = left.sort_values("a", ascending=ascending, kind="stable").head(3)
+    tm.assert_frame_equal(lf.collect(), expected)
+
+
+def test_lazy_sort_head_topn_fallback_dtype(left):
+    # object column is not supported by nlargest
+    lf = left.lazy().sort_values("b", ascending=False).head(2)
+    expected = left.sort_values("b", ascending=False).head(2)
+    tm.assert_frame_equal(lf.collect(), expected)
+
+
+def test_lazy_sort_head_no_topn_with_key(left):
+    lf = left.lazy().sort_values("a", key=lambda x: -x).head(2)
+    assert "TopN" not in lf.explain()
+    expected = left.sort_values("a", key=lambda x: -x).head(2)
+    tm.assert_frame_equal(lf.collect(), expected)
+
+
+def test_lazy_assign_and_eval(left):
+    lf = left.lazy().assign(d=lambda df: df["key"] * 2).eval("e = key + d")
+    expected = left.assign(d=left["key"] * 2)
+    expected["e"] = expected["key"] + expected["d"]
+    tm.assert_frame_equal(lf.collect(), expected)
+
+
+def test_lazy_projection_pushdown_frame(left):
+    lf = left.lazy().eval("d = key * 2").filter("a > 1")[["d"]]
+    plan = lf.explain()
+    assert plan.splitlines()[-2].strip() == "Project(['key', 'a'])"
+    expected = left.eval("d = key * 2").query("a > 1")[["d"]]
+    tm.assert_frame_equal(lf.collect(), expected)
+
+
+def test_lazy_callable_assign_blocks_projection(left):
+    lf = left.lazy().assign(d=lambda df: df["key"] * 2)[["d"]]
+    assert "FrameScan" in lf.explain().splitlines()[-1]
+    assert "Project(['d'])" == lf.explain().splitlines()[0]
+    tm.assert_frame_equal(lf.collect(), left.assign(d=left["key"] * 2)[["d"]])
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+def test_lazy_merge_filter_pushdown(left, right, how):
+    lf = (
+        left.lazy()
+        .merge(right.lazy(), on="key", how=how)
+        .filter("a > 1")
+        .groupby("b_y")
+        .agg({"c": "sum"})
+    )
+    expected = (
+        left.merge(right, on="key", how=how)
+        .query("a > 1")
+        .groupby("b_y")
+        .agg({"c": "sum"})
+    )
+    plan = lf.explain().splitlines()
+    if how in ("inner", "left"):
+        # the index of the merge is not used, so the predicate is applied to
+        #  the left input before joining
+        assert plan[1].strip().startswith("Merge")
+    else:
+        assert plan[1].strip().startswith("Filter")
+    tm.assert_frame_equal(lf.collect(), expected)
+
+
+@pytest.mark.parametrize("how", ["inner", "left"])
+def test_lazy_merge_filter_keeps_index(left, right, how):
+    # the merge builds a new default index from its rows, filtering before
+    #  it would give other labels
+    lf = left.lazy().merge(right.lazy(), on="key", how=how).filter("a > 1")
+    assert lf.explain().splitlines()[0].startswith("Filter")
+    expected = left.merge(right, on="key", how=how).query("a > 1")
+    tm.assert_frame_equal(lf.collect(), expected)
+
+
+def test_lazy_merge_filter_on_key_pushed_to_both_sides(left, right):
+    lf = (
+        left.lazy()
+        .merge(right, on="key")
+        .filter("key >= 2")
+        .sort_values("key", ignore_index=True)
+    )
+    plan = lf.explain()
+    assert plan.count("Filter") == 2
+    expected = (
+        left.merge(right, on="key")
+        .query("key >= 2")
+        .sort_values("key", ignore_index=True)
+    )
+    tm.assert_frame_equal(lf.collect(), expected)
+
+
+@pytest.mark.parametrize("predicate", ["index < 2", "a > 1"])
+def test_lazy_filter_not_pushed_below_sort_ignore_index(left, predicate):
+    lf = left.lazy().sort_values("a", ignore_index=True).filter(predicate)
+    assert lf.explain().splitlines()[0].startswith("Filter")
+    expected = left.sort_values("a", ignore_index=True).query(predicate)
+    tm.assert_frame_equal(lf.collect(), expected)
+
+
+def test_lazy_filter_on_index_not_pushed_into_merge(left, right):
+    lf = (
+        left.lazy()
+        .merge(right, on="key")
+        .filter("index > 1")
+        .groupby("b_x")
+        .agg({"c": "sum"})
+    )
+    assert lf.explain().splitlines()[1].strip().startswith("Filter")
+    expected = (
+        left.merge(right, on="key").query("index > 1").groupby("b_x").agg({"c": "sum"})
+    )
+    tm.assert_frame_equal(lf.collect(), expected)
+
+
+def test_lazy_merge_filter_on_suffixed_column_not_pushed(left, right):
+    lf = left.lazy().merge(right, on="key").filter("b_x != 'a'")
+    assert lf.explain().splitlines()[0].startswith("Filter")
+    expected = left.merge(right, on="key").query("b_x != 'a'")
+    tm.assert_frame_equal(lf.collect(), expected)
+
+
+def test_lazy_merge_projection_pushdown(left, right):
+    lf = left.lazy().merge(right.lazy(), on="key")[["a", "c"]]
+    plan = lf.explain()
+    assert "Project(['key', 'a'])" in plan
+    assert "Project(['key', 'c'])" in plan
+    expected = left.merge(right, on="key")[["a", "c"]]
+    tm.assert_frame_equal(lf.collect(), expected)
+
+
+def test_lazy_groupby_agg(left):
+    lf = left.lazy().groupby("b").agg({"a": "sum"})
+    assert "Project(['a', 'b'])" in lf.explain()
+    expected = left.groupby("b").agg({"a": "sum"})
+    tm.assert_frame_equal(lf.collect(), expected)
+
+    lf = left.lazy().groupby("b", as_index=False).agg(total=("key", "sum"))
+    expected = left.groupby("b", as_index=False).agg(total=("key", "sum"))
+    tm.assert_frame_equal(lf.collect(), expected)
+
+
+def test_lazy_scan_csv_projection(left, tmp_path):
+    path = tmp_path / "data.csv"
+    left.to_csv(path, index=False)
+    lf = LazyFrame.scan_csv(path).filter("key > 2")[["a"]]
+    assert "columns=['key', 'a']" in lf.explain()
+    expected = pd.read_csv(path).query("key > 2")[["a"]]
+    tm.assert_frame_equal(lf.collect(), expected)
+
+
+def test_lazy_scan_parquet_projection(left, right, tmp_path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "data.parquet"
+    right.to_parquet(path)
+    lf = left.lazy().merge(LazyFrame.scan_parquet(path), on="key")[["b_x", "c"]]
+    # b is kept so that the suffix of b_x is applied
+    assert "columns=['key', 'c', 'b']" in lf.explain()
+    expected = left.merge(pd.read_parquet(path), on="key")[["b_x", "c"]]
+    tm.assert_frame_equal(lf.collect(), expected)
+
+
+def test_lazy_explain_unoptimized(left):
+    lf = left.lazy().sort_values("a").head(2)
+    assert lf.explain(optimized=False).splitlines()[0] == "Head(n=2)"
+    assert repr(lf).startswith("LazyFrame")
+
+
+def test_lazy_getitem_requires_list(left):
+    with pytest.raises(TypeError, match="list of columns"):
+        left.lazy()["a"]
+
+
+def test_lazy_eval_requires_assignment(left):
+    with pytest.raises(ValueError, match="assignment"):
+        left.lazy().eval("a + 1")
@@ -0,0 +1,134 @@
+import numpy as np
+import pytest
+
+import pandas as pd
+from pandas import (
+    DataFrame,
+    DataFrameBuilder,
+    Index,
+    Series,
+)
+import pandas._testing as tm
+
+
+class TestDataFrameBuilder:
+    def test_build(self):
+        builder = DataFrameBuilder()
+        for i in range(20):
+            builder[f"i{i}"] = np.arange(3, dtype=np.int64) + i
+            builder.add(f"f{i}", np.arange(3, dtype=np.float64) * i)
+        assert len(builder) == 40
+        assert "i3" in builder
+        result = builder.build()
+
+        expected = DataFrame(
+            {
+                name: values
+                for i in range(20)
+                for name, values in [
+                    (f"i{i}", np.arange(3, dtype=np.int64) + i),
+                    (f"f{i}", np.arange(3, dtype=np.float64) * i),
+                ]
+            }
+        )
+        tm.assert_frame_equal(result, expected)
+        assert result._mgr.nblocks == 2
+        assert result._mgr.is_consolidated()
+
+    def test_build_dtypes(self):
+        builder = DataFrameBuilder()
+        builder["a"] = [1, 2]
+        builder["b"] = pd.date_range("2020-01-01", periods=2)
+        builder["c"] = pd.date_range("2020-01-01", periods=2, tz="UTC")
+        builder["d"] = pd.array([1, None], dtype="Int64")
+        builder["e"] = pd.Categorical(["x", "y"])
+        builder["f"] = pd.timedelta_range("1D", periods=2)
+        builder["g"] = np.array(["x", 1], dtype=object)
+        builder["h"] = [True, False]
+        result = builder.build()
+
+        expected = DataFrame(
+            {
+                "a": [1, 2],
+                "b": pd.date_range("2020-01-01", periods=2),
+                "c": pd.date_range("2020-01-01", periods=2, tz="UTC"),
+                "d": pd.array([1, None], dtype="Int64"),
+                "e": pd.Categorical(["x", "y"]),
+                "f": pd.timedelta_range("1D", periods=2),
+                "g": np.array(["x", 1], dtype=object),
+                "h": [True, False],
+            }
+        )
+        tm.assert_frame_equal(result, expected)
+
+    def test_index(self):
+        builder = DataFrameBuilder(index=["a", "b", "c"])
+        builder["x"] = 1.5
+        builder["y"] = Series([3, 1], index=["c", "a"])
+        builder["z"] = {"b": "v"}
+        result = builder.build()
+
+        expected = DataFrame(
+            {"x": 1.5, "y": [1.0, np.nan, 3.0], "z": [np.nan, "v", np.nan]},
+            index=["a", "b", "c"],
+        )
+        tm.assert_frame_equal(result, expected)
+
+    def test_index_from_first_series(self):
+        builder = DataFrameBuilder()
+        builder["x"] = Series([1, 2], index=["a", "b"])
+        builder["y"] = [3, 4]
+        result = builder.build()
+
+        expected = DataFrame({"x": [1, 2], "y": [3, 4]}, index=["a", "b"])
+        tm.assert_frame_equal(result, expected)
+
+    def test_empty(self):
+        result = DataFrameBuilder().build()
+        tm.assert_frame_equal(result, DataFrame())
+
+        result = DataFrameBuilder(index=Index([1, 2])).build()
+        tm.assert_frame_equal(result, DataFrame(index=Index([1, 2])))
+
+    def test_values_copied(self):
+        arr = np.array([1, 2])
+        ea = pd.array([1, 2], dtype="Int64")
+        ser = Series([1.5, 2.5])
+        builder = DataFrameBuilder()
+        builder["a"] = arr
+        builder["b"] = ea
+        builder["c"] = ser
+        result = builder.build()
+
+        result.iloc[0] = 10
+        assert arr[0] == 1
+        assert ea[0] == 1
+        assert ser.iloc[0] == 1.5
+
+    def test_length_mismatch(self):
+        builder = DataFrameBuilder()
+        builder["a"] = [1, 2, 3]
+        msg = r"Length of values \(2\) does not match length of index \(3\)"
+        with pytest.raises(ValueError, match=msg):
+            builder["b"] = [1, 2]
+
+    def test_duplicate_name(self):
+        builder = DataFrameBuilder()
+        builder["a"] = [1, 2]
+        with pytest.raises(ValueError, match="cannot insert a, already exists"):
+            builder["a"] = [3, 4]
+
+    def test_scalar_without_index(self):
+        builder = DataFrameBuilder()
+        with pytest.raises(ValueError, match="before the index is known"):
+            builder["a"] = 1
+
+    def test_build_twice(self):
+        builder = DataFrameBuilder()
+        builder["a"] = [1, 2]
+        builder.build()
+        msg = "build has already been called"
+        with pytest.raises(ValueError, match=msg):
+            builder.build()
+        with pytest.raises(ValueError, match=msg):
+            builder["b"] = [1, 2]
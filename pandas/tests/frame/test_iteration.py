@@ -12,6 +12,7 @@ from pandas import (
     Categorical,
     DataFrame,
     Series,
+    array,
     date_range,
 )
 import pandas._testing as tm
@@ -158,3 +159,59 @@ class TestIteration:
 
         for c, col in df.items():
             str(col)
+
+    @pytest.mark.parametrize("batch_size", [1, 2, 3, 10])
+    def test_iter_records(self, batch_size):
+        df = DataFrame(
+            {
+                "a": [1, 2, 3],
+                "b": [0.5, 1.5, 2.5],
+                "c": date_range("2020-01-01", periods=3),
+                "d": Categorical(["x", "y", "x"]),
+                "e": array([1, None, 3], dtype="Int64"),
+            },
+            index=["p", "q", "r"],
+        )
+        batches = list(df.iter_records(batch_size=batch_size))
+        assert all(len(batch) <= batch_size for batch in batches)
+        result = [row for batch in batches for row in batch]
+        expected = [tuple(row) for row in df.itertuples(index=False, name=None)]
+        assert result == expected
+        assert type(result[0][0]) is int
+        assert type(result[0][4]) is int
+
+        result = [
+            row
+            for batch in df.iter_records(batch_size=batch_size, as_="dict", index=True)
+            for row in batch
+        ]
+        expected = [
+            {"Index": row[0], **dict(zip(df.columns, row[1:]))}
+            for row in df.itertuples(name=None)
+        ]
+        assert result == expected
+
+    def test_iter_records_empty(self):
+        assert list(DataFrame({"a": []}).iter_records()) == []
+        assert list(DataFrame(index=[0, 1]).iter_records()) == [[(), ()]]
+
+    def test_iter_records_snapshot(self):
+        df = DataFrame({"a": [1, 2]})
+        it = df.iter_records()
+        df.iloc[0, 0] = 10
+        assert list(it) == [[(1,), (2,)]]
+
+    def test_iter_records_duplicate_columns(self):
+        df = DataFrame([[1, 2]], columns=["a", "a"])
+        assert list(df.iter_records()) == [[(1, 2)]]
+        msg = "DataFrame columns are not unique"
+        with tm.assert_produces_warning(UserWarning, match=msg):
+            result = list(df.iter_records(as_="dict"))
+        assert result == [[{"a": 2}]]
+
+    def test_iter_records_invalid(self):
+        df = DataFrame({"a": [1]})
+        with pytest.raises(ValueError, match="batch_size must be a positive integer"):
+            df.iter_records(batch_size=0)
+        with pytest.raises(ValueError, match="as_ must be 'tuple' or 'dict'"):
+            df.iter_records(as_="list")
@@ -1514,3 +1514,57 @@ def test_nonreducer_nonstransform():
     ).set_index(["cat1", "cat2"])["rank"]
     result = df.groupby("cat1").apply(f)
     tm.assert_series_equal(result, expected)
+
+
+def _group_sum(group):
+    return group["v"].sum()
+
+
+def _group_head(group):
+    return group.head(2)
+
+
+def _group_demean(group):
+    return group - group.mean()
+
+
+def _group_name(group):
+    return group.name
+
+
+@pytest.mark.parametrize("func", [_group_sum, _group_head, _group_demean, _group_name])
+@pytest.mark.parametrize("group_keys", [True, False])
+def test_apply_engine_processes(func, group_keys):
+    df = DataFrame(
+        {
+            "k": np.random.default_rng(2).integers(0, 20, size=200),
+            "v": np.random.default_rng(3).standard_normal(200),
+            "w": np.arange(200),
+        }
+    )
+    gb = df.groupby("k", group_keys=group_keys)
+    expected = gb.apply(func)
+    result = gb.apply(func, engine="processes", engine_kwargs={"max_workers": 2})
+    tm.assert_equal(result, expected)
+
+
+def test_apply_engine_processes_series_categorical():
+    ser = Series(
+        range(6), index=pd.Categorical(list("aabbdd"), categories=list("abcd"))
+    )
+    gb = ser.groupby(level=0, observed=False)
+    expected = gb.apply(np.max)
+    result = gb.apply(np.max, engine="processes", engine_kwargs={"max_workers": 2})
+    tm.assert_series_equal(result, expected)
+
+
+def test_apply_engine_processes_invalid():
+    gb = DataFrame({"k": [1, 1, 2], "v": [1, 2, 3]}).groupby("k")
+    with pytest.raises(ValueError, match="engine must be one of"):
+        gb.apply(_group_sum, engine="numba")
+    with pytest.raises(ValueError, match="only supported with engine='processes'"):
+        gb.apply(_group_sum, engine_kwargs={"max_workers": 2})
+    with pytest.raises(ValueError, match="max_workers must be greater than 0"):
+        gb.apply(_group_sum, engine="processes", engine_kwargs={"max_workers": 0})
+    with pytest.raises(NotImplementedError, match="string func"):
+        gb.apply("sum", engine="processes")
@@ -3,6 +3,7 @@ from datetime import (
     datetime,
 )
 import itertools
+import threading
 
 import numpy as np
 import pytest
@@ -344,6 +345,84 @@ def test_from_arrays_respects_none_names():
     tm.assert_index_equal(result, expected)
 
 
+def test_from_arrays_deferred():
+    a = Index([2, 1, 2], name="a")
+    b = Series([0.5, 1.5, 0.5], name="b")
+
+    result = MultiIndex.from_arrays([a, b])
+    assert "_deferred" in result.__dict__
+    assert len(result) == 3
+    assert result.nlevels == 2
+    assert result.names == ["a", "b"]
+    assert "_deferred" in result.__dict__
+
+    expected = MultiIndex(
+        levels=[[1, 2], [0.5, 1.5]], codes=[[1, 0, 1], [0, 1, 0]], names=["a", "b"]
+    )
+    tm.assert_index_equal(result, expected)
+    assert "_deferred" not in result.__dict__
+
+
+def test_from_arrays_deferred_series_modified():
+    ser = Series([1, 2, 3])
+    result = MultiIndex.from_arrays([ser, Index(["a", "b", "c"])])
+    ser.iloc[0] = 10
+
+    expected = MultiIndex.from_arrays([[1, 2, 3], ["a", "b", "c"]])
+    tm.assert_index_equal(result, expected)
+
+
+def test_from_arrays_deferred_threads():
+    # other threads wait for the levels and codes instead of failing to find them
+    result = MultiIndex.from_arrays([Index([2, 1, 2]), Index([0.5, 1.5, 0.5])])
+    make_levels_codes, nlevels, length = result.__dict__["_deferred"]
+    started = threading.Event()
+    proceed = threading.Event()
+
+    def slow_make_levels_codes():
+        started.set()
+        proceed.wait(5)
+        return make_levels_codes()
+
+    result._deferred = (slow_make_levels_codes, nlevels, length)
+    thread = threading.Thread(target=lambda: result.codes)
+    thread.start()
+    started.wait(5)
+    results = []
+    other = threading.Thread(target=lambda: results.append(result.codes))
+    other.start()
+    # give the other thread time to reach the deferred levels and codes
+    other.join(0.1)
+    proceed.set()
+    thread.join()
+    other.join()
+    assert len(results) == 1
+    tm.assert_numpy_array_equal(results[0][0], np.array([1, 0, 1], dtype=np.int8))
+
+
+def test_from_arrays_deferred_error_retried():
+    result = MultiIndex.from_arrays([Index([2, 1, 2]), Index([0.5, 1.5, 0.5])])
+    make_levels_codes, nlevels, length = result.__dict__["_deferred"]
+
+    def failing_make_levels_codes():
+        raise ValueError("failed")
+
+    result._deferred = (failing_make_levels_codes, nlevels, length)
+    with pytest.raises(ValueError, match="failed"):
+        result.levels
+    assert len(result) == 3
+
+    result._deferred = (make_levels_codes, nlevels, length)
+    expected = MultiIndex(levels=[[1, 2], [0.5, 1.5]], codes=[[1, 0, 1], [0, 1, 0]])
+    tm.assert_index_equal(result, expected)
+
+
+def test_from_arrays_object_not_deferred():
+    # unhashable values have to raise at construction
+    with pytest.raises(TypeError, match="unhashable"):
+        MultiIndex.from_arrays([Index([[1], [2]], dtype=object), Index([1, 2])])
+
+
 # ----------------------------------------------------------------------------
 # from_tuples
 # ----------------------------------------------------------------------------
@@ -591,6 +670,21 @@ def test_from_product_readonly():
     tm.assert_index_equal(result, expected)
 
 
+def test_from_product_deferred():
+    result = MultiIndex.from_product([[1, 2, 1], ["a", "b"]], names=["x", "y"])
+    assert "_deferred" in result.__dict__
+    assert len(result) == 6
+    assert result.nlevels == 2
+
+    expected = MultiIndex(
+        levels=[[1, 2], ["a", "b"]],
+        codes=[[0, 0, 1, 1, 0, 0], [0, 1, 0, 1, 0, 1]],
+        names=["x", "y"],
+    )
+    tm.assert_index_equal(result, expected)
+    assert "_deferred" not in result.__dict__
+
+
 def test_create_index_existing_name(idx):
     # GH11193, when an existing index is passed, and a new name is not
     # specified, the new index should inherit the previous object name
@@ -355,3 +355,10 @@ def test_midx_unique_ea_dtype():
     exp_vals_b = np.array([1, 2, 3])
     expected = MultiIndex.from_arrays([exp_vals_a, exp_vals_b], names=["a", "b"])
     tm.assert_index_equal(result, expected)
+
+
+@pytest.mark.parametrize("dropna", [True, False])
+def test_nunique(dropna):
+    mi = MultiIndex.from_arrays([[1, np.nan, np.nan, 1], [np.nan, "a", "a", np.nan]])
+    assert mi.nunique(dropna=dropna) == 2
+    assert "_values" not in mi._cache
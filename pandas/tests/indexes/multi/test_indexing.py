@@ -926,13 +926,14 @@ def test_slice_indexer_with_missing_value(index_arr, expected, start_idx, end_id
         (2, "uint16"),  # 2*4*N = 16
         (4, "uint32"),  # 2*4*N = 32
         (8, "uint64"),  # 2*4*N = 64
-        (10, "object"),  # 2*4*N = 80
+        (10, "uint64"),  # 2*4*N = 80, leading levels ranked
     ],
 )
 def test_pyint_engine(N, expected_dtype):
     # GH#18519 : when combinations of codes cannot be represented in 64
-    # bits, the index underlying the MultiIndex engine works with Python
-    # integers, rather than uint64.
+    # bits, the index underlying the MultiIndex engine replaces the leading
+    # levels by their rank among the combinations in the index, rather than
+    # overflowing.
     keys = [
         tuple(arr)
         for arr in [
@@ -968,6 +969,49 @@ def test_pyint_engine(N, expected_dtype):
     tm.assert_numpy_array_equal(result, expected)
 
 
+def test_ranked_engine():
+    # 4 levels of 2**20 labels need more than 64 bits
+    rng = np.random.default_rng(2)
+    n = 1000
+    codes = [rng.integers(0, 2**20, n) for _ in range(4)]
+    codes[0] = np.arange(n)
+    codes[3][-1] = -1
+    index = MultiIndex(levels=[np.arange(2**20)] * 4, codes=codes)
+    assert index._engine.values.dtype == "uint64"
+    assert len(index._engine._rank_tables) == 1
+
+    assert index.is_unique
+    for i in [0, 10, n - 1]:
+        assert index.get_loc(index[i]) == i
+    tm.assert_numpy_array_equal(
+        index.get_indexer(index[::-1]), np.arange(n, dtype=np.intp)[::-1]
+    )
+
+    # combinations missing from the index, with labels in the levels
+    missing = [index[0][:2] + index[1][2:], index[1][:3] + (np.nan,)]
+    for key in missing:
+        with pytest.raises(KeyError, match=re.escape(str(key))):
+            index.get_loc(key)
+    result = index.get_indexer(MultiIndex.from_tuples(missing + [index[5]]))
+    tm.assert_numpy_array_equal(result, np.array([-1, -1, 5], dtype=np.intp))
+
+
+def test_ranked_engine_monotonic_duplicates():
+    # ranks keep the lexicographic order of the codes
+    n = 2**20
+    level = np.arange(n)
+    index = MultiIndex(
+        levels=[level] * 4,
+        codes=[[0, 0, 0, 1, 1], [5, 5, 6, 0, 0], [1, 1, 0, 2, 2], [0, 0, 9, 3, 3]],
+    )
+    assert index._engine.values.dtype == "uint64"
+    assert index._engine.is_monotonic_increasing
+    assert index.get_loc((0, 5, 1, 0)) == slice(0, 2)
+    assert index.get_loc((1, 0, 2, 3)) == slice(3, 5)
+    with pytest.raises(KeyError, match="2"):
+        index.get_loc((0, 5, 2, 0))
+
+
 @pytest.mark.parametrize(
     "keys,expected",
     [
@@ -1,3 +1,4 @@
+import gc
 import re
 
 import numpy as np
@@ -6,6 +7,7 @@ import pytest
 from pandas._libs import index as libindex
 
 import pandas as pd
+import pandas._testing as tm
 
 
 @pytest.fixture(
@@ -135,6 +137,104 @@ class TestNumericEngine:
         result = engine.get_loc(2)
         assert (result == expected).all()
 
+    def test_get_loc_hashed(self, numeric_indexing_engine_type_and_dtype, monkeypatch):
+        engine_type, dtype = numeric_indexing_engine_type_and_dtype
+
+        with monkeypatch.context() as m:
+            # monotonic values over the size cutoff are searched in get_loc
+            m.setattr(libindex, "_SIZE_CUTOFF", 2)
+            engine = engine_type(np.array([1, 2, 3], dtype=dtype))
+            assert engine.get_loc_hashed(3) == 2
+            assert engine.is_mapping_populated
+            with pytest.raises(KeyError, match="4"):
+                engine.get_loc_hashed(4)
+
+        engine = engine_type(np.array([1, 2, 1], dtype=dtype))
+        with pytest.raises(ValueError, match="unique"):
+            engine.get_loc_hashed(1)
+
+    def test_over_memory_budget(self, numeric_indexing_engine_type_and_dtype):
+        engine_type, dtype = numeric_indexing_engine_type_and_dtype
+
+        with pd.option_context("compute.index_memory_budget", 0):
+            engine = engine_type(np.array([5, 3, 9, 1, 7], dtype=dtype))
+        assert engine.over_memory_budget
+
+        assert engine.is_unique
+        assert engine.get_loc(9) == 2
+        with pytest.raises(KeyError, match="4"):
+            engine.get_loc(4)
+        assert 1 in engine
+        assert 10 not in engine
+        result = engine.get_indexer(np.array([7, 4, 5, 10, 0], dtype=dtype))
+        expected = np.array([4, -1, 0, -1, -1], dtype=np.intp)
+        tm.assert_numpy_array_equal(result, expected)
+
+        # no hash table, only the sorting permutation
+        assert not engine.is_mapping_populated
+        assert engine.sizeof() == 5 * np.dtype(np.intp).itemsize
+
+        with pd.option_context("compute.index_memory_budget", 0):
+            engine = engine_type(np.array([5, 3, 9, 3], dtype=dtype))
+        assert not engine.is_unique
+        expected = np.array([False, True, False, True])
+        tm.assert_numpy_array_equal(engine.get_loc(3), expected)
+        assert not engine.is_mapping_populated
+
+        # under the budget
+        with pd.option_context("compute.index_memory_budget", 1000):
+            engine = engine_type(np.array([5, 3, 9, 1, 7], dtype=dtype))
+        assert not engine.over_memory_budget
+        assert engine.get_loc(9) == 2
+        assert engine.is_mapping_populated
+
+    def test_extend_from(self, numeric_indexing_engine_type_and_dtype):
+        engine_type, dtype = numeric_indexing_engine_type_and_dtype
+
+        base = engine_type(np.array([1, 2, 3], dtype=dtype))
+        assert base.get_loc(2) == 1
+        assert base.is_monotonic_increasing
+
+        engine = engine_type(np.array([1, 2, 3, 5, 4], dtype=dtype))
+        assert engine.extend_from(base) is True
+        assert engine.mapping is base.mapping
+        assert engine.is_unique
+        assert not engine.is_monotonic_increasing
+        assert engine.get_loc(4) == 4
+        tm.assert_numpy_array_equal(
+            engine.get_indexer(np.array([4, 1, 6], dtype=dtype)),
+            np.array([4, 0, -1], dtype=np.intp),
+        )
+
+        # base ignores the values added by engine
+        with pytest.raises(KeyError, match="4"):
+            base.get_loc(4)
+        assert 5 not in base
+        tm.assert_numpy_array_equal(
+            base.get_indexer(np.array([4, 1], dtype=dtype)),
+            np.array([-1, 0], dtype=np.intp),
+        )
+
+        # the mapping of base can only be extended once
+        other = engine_type(np.array([1, 2, 3, 7], dtype=dtype))
+        assert other.extend_from(base) is False
+        assert other.get_loc(7) == 3
+        assert other.is_monotonic_increasing
+
+    @pytest.mark.parametrize("tail", [[2], [4, 4]])
+    def test_extend_from_duplicates(self, numeric_indexing_engine_type_and_dtype, tail):
+        engine_type, dtype = numeric_indexing_engine_type_and_dtype
+
+        base = engine_type(np.array([1, 2, 3], dtype=dtype))
+        assert base.get_loc(2) == 1
+
+        engine = engine_type(np.array([1, 2, 3, *tail], dtype=dtype))
+        assert engine.extend_from(base) is False
+        assert engine.is_unique is False
+        assert base.is_unique is True
+        with pytest.raises(KeyError, match="4"):
+            base.get_loc(4)
+
 
 class TestObjectEngine:
     engine_type = libindex.ObjectEngine
@@ -190,3 +290,139 @@ class TestObjectEngine:
         expected = np.array([False, True, False] * num, dtype=bool)
         result = engine.get_loc("b")
         assert (result == expected).all()
+
+
+class TestExtendEngine:
+    # Index.append and Index.insert at the end build the engine of the result
+    #  from the engine of the original index
+
+    @pytest.mark.parametrize(
+        "index, new",
+        [
+            (pd.Index(["a", "b", "c"]), pd.Index(["d", "e"])),
+            (
+                pd.Index(["a", "b", "c"], dtype="string"),
+                pd.Index(["d", "e"], dtype="string"),
+            ),
+            (pd.Index([1, 2, 3], dtype="Int64"), pd.Index([pd.NA, 5], dtype="Int64")),
+            (pd.date_range("2000", periods=3), pd.date_range("2001", periods=2)),
+            (
+                pd.period_range("2000", periods=3, freq="D"),
+                pd.period_range("2001", periods=2, freq="D"),
+            ),
+        ],
+    )
+    def test_append(self, index, new):
+        assert index.get_loc(index[1]) == 1
+        result = index.append(new)
+        if index._engine.values.dtype == object:
+            # tables of objects are not shared, see test_append_object_freed
+            assert result._engine.mapping is not index._engine.mapping
+        else:
+            assert result._engine.mapping is index._engine.mapping
+
+        for i, key in enumerate(result):
+            assert result.get_loc(key) == i
+        assert result.is_unique
+        for key in new:
+            assert key not in index
+        tm.assert_numpy_array_equal(
+            index.get_indexer(result), np.array([0, 1, 2, -1, -1], dtype=np.intp)
+        )
+
+    @pytest.mark.parametrize("dtype", [object, "string"])
+    def test_append_object_freed(self, dtype):
+        # the values of the appended index must not be kept in the table of
+        #  the original index once the result is freed
+        index = pd.Index([f"k{i}" for i in range(5)], dtype=dtype)
+        assert index.get_loc("k1") == 1
+        result = index.append(pd.Index([f"new{i}" for i in range(100)], dtype=dtype))
+        assert result.get_loc("new99") == 104
+        del result
+        gc.collect()
+
+        for i in range(100):
+            assert f"new{i}" not in index
+            with pytest.raises(KeyError, match=f"new{i}"):
+                index.get_loc(f"new{i}")
+        assert index.get_loc("k4") == 4
+
+    def test_insert(self):
+        index = pd.Index([f"k{i}" for i in range(5)])
+        assert index.get_loc("k0") == 0
+        assert index.is_monotonic_increasing
+
+        result = index.insert(5, "z")
+        del index
+        assert result._engine.is_monotonic_increasing
+        assert result.get_loc("z") == 5
+        assert result.get_loc("k4") == 4
+
+        result = result.insert(6, "a")
+        assert not result.is_monotonic_increasing
+        assert result.get_loc("a") == 6
+
+    def test_insert_existing_value(self):
+        index = pd.Index([1, 2, 3])
+        assert index.get_loc(1) == 0
+        assert index.is_monotonic_increasing
+
+        result = index.insert(3, 2)
+        assert not result.is_unique
+        assert not result.is_monotonic_increasing
+        tm.assert_numpy_array_equal(
+            result.get_loc(2), np.array([False, True, False, True])
+        )
+        assert index.get_loc(2) == 1
+
+
+class TestMemoryBudget:
+    # indexes whose hash table would exceed compute.index_memory_budget use
+    #  binary search instead
+
+    @pytest.mark.parametrize(
+        "index",
+        [
+            pd.Index([3.0, np.nan, 1.0, 2.0]),
+            pd.date_range("2000", periods=4)[::-1],
+            pd.DatetimeIndex(["2001", "NaT", "2000", "2002"]),
+            pd.timedelta_range("1D", periods=4)[[2, 0, 3, 1]],
+            pd.period_range("2000", periods=4, freq="D")[[2, 0, 3, 1]],
+        ],
+    )
+    def test_lookups(self, index):
+        expected_indexer = index.get_indexer(index[::-1])
+        with pd.option_context("compute.index_memory_budget", 0):
+            result = index.copy(deep=True)
+            assert result._engine.over_memory_budget
+
+            assert result.is_unique
+            for i, key in enumerate(index):
+                assert result.get_loc(key) == i
+            tm.assert_numpy_array_equal(
+                result.get_indexer(index[::-1]), expected_indexer
+            )
+            assert not result._engine.is_mapping_populated
+
+    def test_monotonic(self):
+        with pd.option_context("compute.index_memory_budget", 0):
+            index = pd.Index([1, 2, 2, 3])
+            assert index._engine.over_memory_budget
+        assert not index.is_unique
+        assert index.get_loc(2) == slice(1, 3)
+        assert index.get_loc(3) == 3
+
+        # no sorting permutation needed
+        assert index._engine.sizeof() == 0
+        assert not index._engine.is_mapping_populated
+
+    def test_object_dtype_not_affected(self):
+        with pd.option_context("compute.index_memory_budget", 0):
+            index = pd.Index(["b", "a", "c"])
+            assert not index._engine.over_memory_budget
+        assert index.get_loc("a") == 1
+
+    @pytest.mark.parametrize("value", [-1, 1.5, "a"])
+    def test_invalid_option(self, value):
+        with pytest.raises(ValueError, match="Value must be"):
+            pd.set_option("compute.index_memory_budget", value)
@@ -1,3 +1,5 @@
+import re
+
 import numpy as np
 import pytest
 
@@ -930,6 +932,20 @@ def test_mi_partial_indexing_list_raises():
         frame.loc[["b", 2], "Colorado"]
 
 
+@pytest.mark.parametrize("box", [list, MultiIndex.from_tuples])
+def test_loc_getitem_list_of_partial_tuples(box):
+    index = MultiIndex.from_product([[1, 2], [3, 4], [5, 6]], names=["a", "b", "c"])
+    ser = Series(range(8), index=index)
+    result = ser.loc[box([(2, 4), (1, 3)])]
+    expected = ser.iloc[[6, 7, 0, 1]]
+    tm.assert_series_equal(result, expected)
+
+    with pytest.raises(KeyError, match=re.escape("[(9, 9)] not in index")):
+        ser.loc[box([(2, 4), (9, 9)])]
+    with pytest.raises(KeyError, match="None of"):
+        ser.loc[box([(1, 9)])]
+
+
 def test_mi_indexing_list_nonexistent_raises():
     # GH 15452
     s = Series(range(4), index=MultiIndex.from_product([[1, 2], ["a", "b"]]))
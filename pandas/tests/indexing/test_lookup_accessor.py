@@ -0,0 +1,133 @@
+import numpy as np
+import pytest
+
+from pandas.errors import InvalidIndexError
+
+from pandas import (
+    DataFrame,
+    MultiIndex,
+    Series,
+    Timedelta,
+    Timestamp,
+    date_range,
+    timedelta_range,
+)
+import pandas._testing as tm
+
+
+@pytest.mark.parametrize(
+    "index",
+    [
+        [10, 20, 30],
+        [0.5, 1.5, 2.5],
+        ["a", "b", "c"],
+        date_range("2000-01-01", periods=3),
+        date_range("2000-01-01", periods=3, tz="US/Eastern"),
+        timedelta_range("1 day", periods=3),
+        MultiIndex.from_tuples([("a", 1), ("a", 2), ("b", 1)]),
+    ],
+)
+def test_get_matches_at(index):
+    df = DataFrame({"x": [1, 2, 3], "y": [4.5, 5.5, 6.5]}, index=index)
+    acc = df.lookup_accessor()
+
+    for key in df.index:
+        assert acc.get(key, "x") == df.at[key, "x"]
+        assert acc.get(key, "y") == df.at[key, "y"]
+
+    keys = list(df.index[[2, 0]])
+    tm.assert_numpy_array_equal(acc.get_many(keys, "y"), np.array([6.5, 4.5]))
+
+
+def test_get_nullable_index():
+    ser = Series([1.0, 2.0, 3.0], index=Series([1, None, 3], dtype="Int64"))
+    acc = ser.lookup_accessor()
+    assert acc.get(3) == 3.0
+    assert acc.get(ser.index[1]) == 2.0
+
+
+def test_get_keys_cast_like_loc():
+    ser = Series([1, 2, 3], index=date_range("2000-01-01", periods=3))
+    acc = ser.lookup_accessor()
+    assert acc.get("2000-01-02") == 2
+    assert acc.get(Timestamp("2000-01-03").as_unit("s")) == 3
+    assert acc.get(np.datetime64("2000-01-01")) == 1
+    tm.assert_numpy_array_equal(
+        acc.get_many(["2000-01-03", "2000-01-01"]), np.array([3, 1])
+    )
+
+    ser = Series([1, 2, 3], index=[1, 2, 3])
+    assert ser.lookup_accessor().get(2.0) == 2
+
+    ser = Series([1, 2, 3], index=timedelta_range("1 day", periods=3))
+    assert ser.lookup_accessor().get(Timedelta("3 days")) == 3
+
+
+@pytest.mark.parametrize(
+    "index, key",
+    [
+        ([10, 20, 30], 40),
+        ([10, 20, 30], "a"),
+        (["a", "b", "c"], "d"),
+        (date_range("2000-01-01", periods=3), Timestamp("2000-01-02", tz="UTC")),
+        (date_range("2000-01-01", periods=3, tz="UTC"), Timestamp("2000-01-02")),
+        (MultiIndex.from_tuples([("a", 1), ("a", 2), ("b", 1)]), "a"),
+    ],
+)
+def test_get_missing_raises(index, key):
+    ser = Series([1, 2, 3], index=index)
+    acc = ser.lookup_accessor()
+    with pytest.raises(KeyError, match=""):
+        acc.get(key)
+
+
+def test_get_many_missing_raises():
+    acc = Series([1, 2, 3], index=["a", "b", "c"]).lookup_accessor()
+    with pytest.raises(KeyError, match=r"\['d'\] not in index"):
+        acc.get_many(["a", "d"])
+    with pytest.raises(TypeError, match="list-like"):
+        acc.get_many("a")
+
+
+def test_get_many_extension_array():
+    ser = Series([1, None, 3], index=["a", "b", "c"], dtype="Int64")
+    result = ser.lookup_accessor().get_many(["c", "b"])
+    tm.assert_extension_array_equal(result, ser.array[[2, 1]])
+
+
+def test_columns():
+    df = DataFrame({"x": [1, 2], "y": [3, 4], "z": [5, 6]}, index=["a", "b"])
+
+    acc = df.lookup_accessor("y")
+    assert acc.get("b") == 4
+    with pytest.raises(KeyError, match="x"):
+        acc.get("b", "x")
+
+    acc = df.lookup_accessor(["x", "z"])
+    assert acc.get("a", "z") == 5
+    msg = "column must be specified"
+    with pytest.raises(ValueError, match=msg):
+        acc.get("a")
+    with pytest.raises(ValueError, match=msg):
+        acc.get_many(["a"])
+
+    with pytest.raises(TypeError, match="Series"):
+        df["x"].lookup_accessor(["x"])
+
+
+def test_non_unique_raises():
+    df = DataFrame({"x": [1, 2]}, index=["a", "a"])
+    with pytest.raises(InvalidIndexError, match="unique index"):
+        df.lookup_accessor()
+
+    df = DataFrame([[1, 2]], columns=["x", "x"])
+    with pytest.raises(InvalidIndexError, match="unique column labels"):
+        df.lookup_accessor()
+
+
+def test_snapshot():
+    df = DataFrame({"x": [1, 2, 3]}, index=["a", "b", "c"])
+    acc = df.lookup_accessor()
+    df.loc["b", "x"] = 10
+    df["x"] = [7, 8, 9]
+    assert acc.get("b", "x") == 2
@@ -10,7 +10,11 @@ import pytest
 
 import pandas as pd
 import pandas._testing as tm
-from pandas.api.internals import create_dataframe_from_blocks
+from pandas.api.internals import (
+    consolidation_stats,
+    create_dataframe_from_blocks,
+    nblocks,
+)
 from pandas.core import internals
 from pandas.core.internals import api
 
@@ -165,3 +169,25 @@ def test_create_dataframe_from_blocks_1dEA(array):
         [(block.values[0], block.mgr_locs.as_array)], index=df.index, columns=df.columns
     )
     tm.assert_frame_equal(result, df)
+
+
+def test_consolidation_stats():
+    consolidation_stats(reset=True)
+    df = pd.DataFrame({"a": np.arange(4, dtype=np.int64)})
+    df["b"] = np.arange(4, dtype=np.int64)
+    df["c"] = np.arange(4, dtype=np.float64)
+    assert nblocks(df) == 3
+    assert consolidation_stats() == {
+        "consolidations": 0,
+        "blocks_merged": 0,
+        "bytes_copied": 0,
+    }
+
+    result = df.compact()
+    assert nblocks(result) == 2
+    assert consolidation_stats(reset=True) == {
+        "consolidations": 1,
+        "blocks_merged": 2,
+        "bytes_copied": 64,
+    }
+    assert consolidation_stats()["consolidations"] == 0
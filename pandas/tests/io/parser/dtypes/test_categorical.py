@@ -333,3 +333,24 @@ def test_categorical_unexpected_categories(all_parsers):
 
     result = parser.read_csv(StringIO(data), dtype=dtype)
     tm.assert_frame_equal(result, expected)
+
+
+@xfail_pyarrow  # AssertionError: Attributes of DataFrame.iloc[:, 0] are different
+def test_auto_dictionary_encode(all_parsers):
+    parser = all_parsers
+    data = "a,b,c\n" + "".join(f"{'xy'[i % 2]},{i},s{i}\n" for i in range(20))
+
+    with pd.option_context("io.parser.auto_dictionary_encode", 0.1):
+        result = parser.read_csv(StringIO(data))
+        unconverted = parser.read_csv(StringIO(data), dtype={"a": object})
+
+    expected = parser.read_csv(StringIO(data))
+    assert expected["a"].dtype != "category"
+    expected["a"] = expected["a"].astype("category")
+    tm.assert_frame_equal(result, expected)
+    assert unconverted["a"].dtype == object
+
+
+def test_auto_dictionary_encode_invalid():
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        pd.set_option("io.parser.auto_dictionary_encode", 2)
@@ -263,6 +263,22 @@ def test_bad_date_parse(all_parsers, cache, value):
     )
 
 
+def test_parse_dates_repeated_values(all_parsers, cache):
+    # distinct values are converted once and reused
+    parser = all_parsers
+    values = ["2020-01-31", "", "2021-02-28", "2020-01-31"] * (start_caching_at + 1)
+    data = "foo,bar\n" + "".join(f"{v},{i}\n" for i, v in enumerate(values))
+
+    result = parser.read_csv(StringIO(data), parse_dates=["foo"], cache_dates=cache)
+    expected = DataFrame(
+        {
+            "foo": DatetimeIndex(values).as_unit("s"),
+            "bar": range(len(values)),
+        }
+    )
+    tm.assert_frame_equal(result, expected)
+
+
 @pytest.mark.parametrize("value", ["0"])
 def test_bad_date_parse_with_warning(all_parsers, cache, value):
     # if we have an invalid date make sure that we handle this with
@@ -779,3 +779,28 @@ def test_float_complex_int_are_equal_as_objects():
     result = isin(np.array(values, dtype=object), np.asarray(comps))
     expected = np.array([False, True, True, True], dtype=np.bool_)
     tm.assert_numpy_array_equal(result, expected)
+
+
+@pytest.mark.parametrize("n_unique", [1, 10, 1000, 50_000])
+@pytest.mark.parametrize("dtype", [object, "int64", "float64", "M8[ns]"])
+def test_estimate_unique(n_unique, dtype):
+    values = np.arange(100_000) % n_unique
+    if dtype is object:
+        values = np.array([str(x) for x in values], dtype=object)
+    values = values.astype(dtype)
+    result = ht.estimate_unique(values)
+    assert abs(result - n_unique) <= 0.05 * n_unique
+
+
+def test_estimate_unique_missing_and_zeros():
+    values = np.array([np.nan, -0.0, 0.0, float("nan")] * 10)
+    assert round(ht.estimate_unique(values)) == 2
+
+    with pytest.raises(ValueError, match="precision"):
+        ht.estimate_unique(values, precision=20)
+
+
+def test_estimate_unique_unhashable():
+    values = np.array([[1], [2], None], dtype=object)[:2]
+    with pytest.raises(TypeError, match="unhashable"):
+        ht.estimate_unique(values)
@@ -32,6 +32,16 @@ class TestMisc:
         with pytest.raises(TypeError, match=msg):
             libwriters.max_len_string_array(arr.astype("U"))
 
+    def test_columns_to_dicts(self):
+        result = lib.columns_to_dicts([[1, 2], ["x", "y"]], ["a", "b"], 2)
+        assert result == [{"a": 1, "b": "x"}, {"a": 2, "b": "y"}]
+
+        result = lib.columns_to_dicts([[1, 2], ["x", "y"]], ["a", "a"], 2)
+        assert result == [{"a": "x"}, {"a": "y"}]
+
+        with pytest.raises(ValueError, match="must have length n"):
+            lib.columns_to_dicts([[1, 2], ["x"]], ["a", "b"], 2)
+
     def test_fast_unique_multiple_list_gen_sort(self):
         keys = [["p", "a"], ["n", "d"], ["a", "s"]]
 
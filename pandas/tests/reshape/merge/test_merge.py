@@ -32,6 +32,8 @@ import pandas._testing as tm
 from pandas.core.reshape.concat import concat
 from pandas.core.reshape.merge import (
     MergeError,
+    get_join_indexers_non_unique,
+    get_join_indexers_sorted,
     merge,
 )
 
@@ -3060,3 +3062,75 @@ def test_merge_on_all_nan_column():
         {"x": [1, 2, 3], "y": [np.nan, np.nan, np.nan], "z": [4, 5, 6], "zz": [4, 5, 6]}
     )
     tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+@pytest.mark.parametrize("sort", [True, False])
+@pytest.mark.parametrize("dtype", ["int64", "float64", "datetime64[ns]", object])
+def test_merge_sorted_non_unique_keys(how, sort, dtype):
+    # both keys sorted with duplicates on both sides use the sorted merge-join
+    left = DataFrame(
+        {"key": Series([0, 1, 1, 2, 2, 2, 4, 6], dtype=dtype), "a": range(8)}
+    )
+    right = DataFrame(
+        {"key": Series([1, 1, 2, 3, 3, 6, 6, 7], dtype=dtype), "b": range(8)}
+    )
+    assert left["key"].is_monotonic_increasing
+    assert right["key"].is_monotonic_increasing
+    result = merge(left, right, on="key", how=how, sort=sort)
+
+    # same join with unsorted inputs goes through the hash join
+    expected = merge(left.iloc[::-1], right.iloc[::-1], on="key", how=how)
+    if how == "right":
+        by = ["b", "a"]
+    elif how == "outer":
+        by = ["key", "a", "b"]
+    else:
+        by = ["a", "b"]
+    expected = expected.sort_values(by, kind="stable").reset_index(drop=True)
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+def test_get_join_indexers_sorted(how):
+    left = np.array([0, 1, 1, 2, 2, 2, 4, 6])
+    right = np.array([1, 1, 2, 3, 3, 6, 6, 7])
+    result = get_join_indexers_sorted(left, right, sort=True, how=how)
+    expected = get_join_indexers_non_unique(left, right, sort=True, how=how)
+    tm.assert_numpy_array_equal(result[0], expected[0])
+    tm.assert_numpy_array_equal(result[1], expected[1])
+
+
+@pytest.mark.parametrize(
+    "left_key, right_key, expected_a, expected_b",
+    [
+        # one match per left row on average, where libjoin.inner_join takes
+        #  a shortcut to restore the left order
+        ([2, 3, 3, 3, 4, 4], [1, 2, 2, 4, 4], [0, 4, 5, 5, 0, 4], [1, 4, 3, 4, 2, 3]),
+        ([1, 1, 2, 3], [1, 1, 2, 2], [0, 0, 1, 1, 2, 2], [0, 1, 0, 1, 2, 3]),
+    ],
+)
+def test_merge_sorted_non_unique_keys_inner_order(
+    left_key, right_key, expected_a, expected_b
+):
+    # the sorted merge-join keeps the row order of the hash join
+    left = DataFrame({"key": left_key, "a": range(len(left_key))})
+    right = DataFrame({"key": right_key, "b": range(len(right_key))})
+    result = merge(left, right, on="key", how="inner", sort=False)
+    tm.assert_numpy_array_equal(result["a"].to_numpy(), np.array(expected_a))
+    tm.assert_numpy_array_equal(result["b"].to_numpy(), np.array(expected_b))
+
+    lidx, ridx = get_join_indexers_non_unique(
+        np.array(left_key), np.array(right_key), sort=False, how="inner"
+    )
+    tm.assert_numpy_array_equal(lidx, np.array(expected_a, dtype=np.intp))
+    tm.assert_numpy_array_equal(ridx, np.array(expected_b, dtype=np.intp))
+
+
+def test_get_join_indexers_sorted_inner_shortcut():
+    # decided before building the indexers: the hash join orders these
+    left = np.array([2, 3, 3, 3, 4, 4])
+    right = np.array([1, 2, 2, 4, 4])
+    assert get_join_indexers_sorted(left, right, how="inner") is None
+    assert get_join_indexers_sorted(left, right, sort=True, how="inner") is not None
+    assert get_join_indexers_sorted(left, right, how="left") is not None
@@ -0,0 +1,125 @@
+import numpy as np
+import pytest
+
+import pandas as pd
+from pandas import (
+    DataFrame,
+    Series,
+)
+import pandas._testing as tm
+from pandas.api.typing import JoinIndex
+from pandas.core.reshape.merge import (
+    MergeError,
+    merge,
+)
+
+
+@pytest.fixture
+def dim():
+    return DataFrame(
+        {
+            "key": [3, 1, 4, 2, 5, 7],
+            "key2": list("aabbcc"),
+            "label": ["x", "y", "z", "u", "v", "w"],
+        }
+    )
+
+
+@pytest.fixture
+def fact():
+    return DataFrame({"key": [1, 2, 6, 3, 1, 7], "key2": list("abcaca")})
+
+
+@pytest.mark.parametrize("how", ["inner", "left"])
+@pytest.mark.parametrize("on", ["key", ["key", "key2"]])
+def test_merge_join_index(dim, fact, how, on):
+    dim_index = dim.build_join_index(on=on)
+    assert isinstance(dim_index, JoinIndex)
+    result = merge(fact, dim_index, how=how)
+    expected = merge(fact, dim, on=on, how=how)
+    tm.assert_frame_equal(result, expected)
+
+    # the index can be reused
+    result = fact.iloc[::-1].merge(dim_index, how=how)
+    expected = fact.iloc[::-1].merge(dim, on=on, how=how)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_merge_join_index_not_affected_by_mutation(dim, fact):
+    expected = merge(fact, dim, on="key", how="left")
+    dim_index = dim.build_join_index("key")
+    dim.loc[3] = [4, "d", "t"]
+    dim.loc[len(dim)] = [6, "e", "s"]
+    result = fact.merge(dim_index, how="left", on="key")
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("dtype", ["int64", "float64", object, "Int64"])
+def test_merge_join_index_uses_prebuilt_table(dim, fact, dtype):
+    dim_index = dim.astype({"key": dtype}).build_join_index("key")
+    left_keys = [fact["key"].astype(dtype)._values]
+    right_keys = [dim_index.obj["key"]._values]
+    result = dim_index._get_join_indexers(left_keys, right_keys, "left", sort=False)
+    assert result is not None
+    assert dim_index._get_join_indexers(left_keys, right_keys, "left", True) is None
+
+
+def test_merge_join_index_categorical(dim, fact):
+    dim_index = dim.astype({"key2": "category"}).build_join_index("key2")
+    result = merge(fact.astype({"key2": "category"}), dim_index, how="left")
+    expected = merge(
+        fact.astype({"key2": "category"}),
+        dim.astype({"key2": "category"}),
+        on="key2",
+        how="left",
+    )
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("how", ["inner", "left"])
+@pytest.mark.parametrize(
+    "values",
+    [
+        [1.5, np.nan, 2.5, 1.5],
+        Series([1, None, 2, 1], dtype="Int64"),
+        ["a", None, "b", "a"],
+        pd.to_datetime(["2020-01-01", None, "2020-01-02", "2020-01-01"]),
+    ],
+)
+def test_merge_join_index_duplicates_and_missing(values, how):
+    dim = DataFrame({"key": values, "label": range(4)})
+    fact = DataFrame({"key": Series(values).iloc[[1, 0, 2, 1]].to_numpy()})
+    fact["key"] = fact["key"].astype(dim["key"].dtype)
+    result = fact.merge(dim.build_join_index("key"), how=how)
+    expected = fact.merge(dim, on="key", how=how)
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("how", ["right", "outer"])
+def test_merge_join_index_fallback_how(dim, fact, how):
+    result = merge(fact, dim.build_join_index("key"), how=how)
+    expected = merge(fact, dim, on="key", how=how)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_merge_join_index_fallback_dtype(dim, fact):
+    # keys are cast to a common dtype and the prebuilt table is not used
+    fact["key"] = fact["key"].astype("float64")
+    result = merge(fact, dim.build_join_index("key"), how="left")
+    expected = merge(fact, dim, on="key", how="left")
+    tm.assert_frame_equal(result, expected)
+
+
+def test_merge_join_index_left_on(dim):
+    fact = DataFrame({"k": [4, 2, 9]})
+    result = merge(fact, dim.build_join_index("key"), left_on="k", how="left")
+    expected = merge(fact, dim, left_on="k", right_on="key", how="left")
+    tm.assert_frame_equal(result, expected)
+
+
+def test_merge_join_index_invalid_keys(dim, fact):
+    dim_index = dim.build_join_index("key")
+    with pytest.raises(MergeError, match="must match the keys"):
+        merge(fact, dim_index, on="key2")
+    with pytest.raises(MergeError, match="right_on"):
+        merge(fact, dim_index, left_on="key", right_on="key")
@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+
+import pandas as pd
+from pandas import (
+    DataFrame,
+    Series,
+    merge_range,
+)
+import pandas._testing as tm
+from pandas.core.reshape.merge import MergeError
+
+
+def _merge_range_via_cross(left, right, closed, how):
+    # reference implementation: cross merge followed by a filter
+    cross = left.assign(_lpos=np.arange(len(left))).merge(
+        right.assign(_rpos=np.arange(len(right))), how="cross"
+    )
+    if closed in ("left", "both"):
+        mask = cross["ts"] >= cross["start"]
+    else:
+        mask = cross["ts"] > cross["start"]
+    if closed in ("right", "both"):
+        mask &= cross["ts"] <= cross["end"]
+    else:
+        mask &= cross["ts"] < cross["end"]
+    result = cross[mask]
+    if how == "left":
+        unmatched = ~np.isin(np.arange(len(left)), result["_lpos"])
+        result = pd.concat([result, left.assign(_lpos=np.arange(len(left)))[unmatched]])
+    result = result.sort_values(["_lpos", "_rpos"], kind="stable")
+    return result.drop(columns=["_lpos", "_rpos"]).reset_index(drop=True)
+
+
+@pytest.fixture
+def events():
+    return DataFrame({"ts": [1.0, 3.0, 5.0, np.nan, 9.0, 0.0], "a": range(6)})
+
+
+@pytest.mark.parametrize("closed", ["left", "right", "both", "neither"])
+@pytest.mark.parametrize("how", ["inner", "left"])
+@pytest.mark.parametrize(
+    "start, end",
+    [
+        # overlapping intervals use the interval tree
+        ([0, 3, 2, 5], [3, 6, 5, 5]),
+        # sorted non-overlapping intervals use a binary search
+        ([0, 3, 5, 8], [2, 5, 6, 9]),
+    ],
+)
+def test_merge_range(events, closed, how, start, end):
+    ranges = DataFrame({"start": start, "end": end, "b": list("wxyz")})
+    result = merge_range(events, ranges, "ts", "start", "end", closed=closed, how=how)
+    expected = _merge_range_via_cross(events, ranges, closed, how)
+    tm.assert_frame_equal(result, expected, check_dtype=how == "inner")
+
+
+@pytest.mark.parametrize("closed", ["left", "right", "both", "neither"])
+@pytest.mark.parametrize("how", ["inner", "left"])
+def test_merge_range_empty_interval_shared_start(closed, how):
+    # a zero-length interval with the same start must not hide the other one
+    events = DataFrame({"ts": [18, 19, 20]})
+    ranges = DataFrame({"start": [18, 18], "end": [20, 18]})
+    result = merge_range(events, ranges, "ts", "start", "end", closed=closed, how=how)
+    expected = _merge_range_via_cross(events, ranges, closed, how)
+    tm.assert_frame_equal(result, expected, check_dtype=how == "inner")
+
+
+def test_merge_range_datetime_resolution():
+    events = DataFrame(
+        {"ts": pd.to_datetime(["2020-01-01 12:00", "2020-01-05 00:00"]).as_unit("ms")}
+    )
+    periods = DataFrame(
+        {
+            "start": pd.to_datetime(["2020-01-01", "2020-01-02"]).as_unit("s"),
+            "end": pd.to_datetime(["2020-01-02", "2020-01-06"]).as_unit("s"),
+            "v": [1, 2],
+        }
+    )
+    result = merge_range(events, periods, "ts", "start", "end")
+    expected = pd.concat([events, periods], axis=1)
+    tm.assert_frame_equal(result, expected)
+
+
+def test_merge_range_suffixes():
+    left = DataFrame({"ts": [1, 2], "v": [1, 2]})
+    right = DataFrame({"start": [0], "end": [5], "v": [3]})
+    result = merge_range(left, right, "ts", "start", "end", suffixes=("_l", "_r"))
+    expected = DataFrame(
+        {"ts": [1, 2], "v_l": [1, 2], "start": [0, 0], "end": [5, 5], "v_r": [3, 3]}
+    )
+    tm.assert_frame_equal(result, expected)
+
+
+def test_merge_range_series():
+    left = Series([1, 7], name="ts")
+    right = DataFrame({"start": [0, 5], "end": [5, 10]})
+    result = merge_range(left, right, "ts", "start", "end")
+    expected = DataFrame({"ts": [1, 7], "start": [0, 5], "end": [5, 10]})
+    tm.assert_frame_equal(result, expected)
+
+
+def test_merge_range_invalid():
+    left = DataFrame({"ts": pd.to_datetime(["2020-01-01"])})
+    right = DataFrame({"start": [0], "end": [5]})
+    with pytest.raises(MergeError, match="incompatible merge keys"):
+        merge_range(left, right, "ts", "start", "end")
+    with pytest.raises(ValueError, match="'how' must be"):
+        merge_range(left, right, "ts", "start", "end", how="outer")
+    with pytest.raises(ValueError, match="left side of interval must be <="):
+        merge_range(left, right, "ts", "end", "start")
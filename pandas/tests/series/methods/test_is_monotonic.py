@@ -24,3 +24,33 @@ class TestIsMonotonic:
         ser = Series(list(reversed(ser)))
         assert ser.is_monotonic_increasing is False
         assert ser.is_monotonic_decreasing is True
+
+    def test_is_monotonic_cached_until_setitem(self):
+        ser = Series([1, 2, 3])
+        assert ser.is_monotonic_increasing is True
+        assert ser._mgr.known_stat("is_monotonic_increasing") is True
+
+        ser[1] = 10
+        assert ser._mgr.known_stat("is_monotonic_increasing") is None
+        assert ser.is_monotonic_increasing is False
+
+    def test_is_monotonic_cache_not_shared_with_view(self):
+        ser = Series([1, 2, 3])
+        view = ser[:]
+        assert view.is_monotonic_increasing is True
+
+        ser.iloc[0] = 5
+        assert ser.is_monotonic_increasing is False
+        assert view.is_monotonic_increasing is True
+
+    def test_sort_values_records_monotonic(self):
+        ser = Series([3, 1, 2])
+        result = ser.sort_values()
+        assert result._mgr.known_stat("is_monotonic_increasing") is True
+        result = ser.sort_values(ascending=False)
+        assert result._mgr.known_stat("is_monotonic_decreasing") is True
+
+        # missing values are sorted last, the result is not monotonic
+        result = Series([3.0, np.nan, 1.0]).sort_values()
+        assert result._mgr.known_stat("is_monotonic_increasing") is None
+        assert result.is_monotonic_increasing is False
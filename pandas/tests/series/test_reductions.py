@@ -208,3 +208,38 @@ def test_median_with_convertible_string_raises():
     df = ser.to_frame()
     with pytest.raises(TypeError, match=msg):
         df.median()
+
+
+def test_reductions_cached_until_setitem():
+    ser = Series([1.0, 2.0, 3.0])
+    assert ser.min() == 1.0
+    assert ser.max() == 3.0
+    assert ser.count() == 3
+    assert ser.nunique() == 3
+    assert ser._mgr.known_stat(("min", True)) == 1.0
+
+    ser[0] = np.nan
+    assert ser._mgr.known_stat(("min", True)) is None
+    assert ser.min() == 2.0
+    assert np.isnan(ser.min(skipna=False))
+    assert ser.max() == 3.0
+    assert ser.count() == 2
+    assert ser.nunique() == 2
+    assert ser.nunique(dropna=False) == 3
+
+
+@pytest.mark.parametrize("dtype", ["int64", "Int64", "datetime64[ns]"])
+def test_reductions_not_cached_after_array_exposed(dtype):
+    ser = Series([1, 2, 3], dtype=dtype)
+    view = ser.copy(deep=False)
+    assert ser.min() == ser.iloc[0]
+    assert view.min() == ser.iloc[0]
+    assert ser.is_monotonic_increasing
+
+    # writes through the returned array bypass pandas
+    arr = ser.array
+    arr[0] = arr[2] + (arr[2] - arr[1])
+    assert ser.min() == ser.iloc[1]
+    assert view.min() == ser.iloc[1]
+    assert not ser.is_monotonic_increasing
+    tm.assert_series_equal(ser.sort_values(), ser.iloc[[1, 2, 0]])
@@ -8,6 +8,7 @@ _any_string_method = [
     ("cat", (Series(list("zyx")),), {"sep": ",", "join": "left"}),
     ("center", (10,), {}),
     ("contains", ("a",), {}),
+    ("contains_any", (["a", "b"],), {}),
     ("count", ("a",), {}),
     ("decode", ("UTF-8",), {}),
     ("encode", ("UTF-8",), {}),
@@ -281,6 +281,47 @@ def test_contains_nan(any_string_dtype):
     tm.assert_series_equal(result, expected)
 
 
+@pytest.mark.parametrize("regex", [True, False])
+@pytest.mark.parametrize("case", [True, False])
+def test_contains_any(any_string_dtype, regex, case):
+    values = Series(
+        ["dog", "Door", "a.b", "axb", "cat", "mouse", np.nan], dtype=any_string_dtype
+    )
+    pats = ["do", "door", "a.b", "CAT", "a.b"]
+
+    result = values.str.contains_any(pats, case=case, regex=regex, na=False)
+    expected = values.str.contains(pats[0], case=case, regex=regex, na=False)
+    for pat in pats[1:]:
+        expected |= values.str.contains(pat, case=case, regex=regex, na=False)
+    tm.assert_series_equal(result, expected)
+
+    result = values.str.contains_any(pats, case=case, regex=regex)
+    expected = values.str.contains("dog", case=case, regex=regex)
+    tm.assert_series_equal(result.isna(), expected.isna())
+
+
+@pytest.mark.parametrize(
+    "pats, expected",
+    [
+        ([], [False, False, False]),
+        ([""], [True, True, True]),
+        (["b", "bc", "zz"], [True, False, False]),
+    ],
+)
+def test_contains_any_edge_cases(pats, expected):
+    values = Series(["abc", "", "xyz"])
+    result = values.str.contains_any(pats)
+    tm.assert_series_equal(result, Series(expected))
+
+
+def test_contains_any_raises():
+    values = Series(["abc"])
+    with pytest.raises(TypeError, match="list-like of strings"):
+        values.str.contains_any("abc")
+    with pytest.raises(TypeError, match="list-like of strings"):
+        values.str.contains_any(["abc", 1])
+
+
 # --------------------------------------------------------------------------------------
 # str.startswith
 # --------------------------------------------------------------------------------------
@@ -4,6 +4,7 @@ import pytest
 import pandas.util._test_decorators as td
 
 from pandas import (
+    CategoricalDtype,
     DataFrame,
     Index,
     MultiIndex,
@@ -100,3 +101,13 @@ def test_get_dummies_with_str_dtype(any_string_dtype):
 
     with pytest.raises(ValueError, match=msg):
         s.str.get_dummies("|", dtype="datetime64[ns]")
+
+
+def test_get_dummies_categorical_unused_categories():
+    dtype = CategoricalDtype(["a|b", "b", "z"])
+    ser = Series(["b", "a|b", np.nan, "b"], dtype=dtype)
+    result = ser.str.get_dummies("|")
+    expected = DataFrame(
+        [[0, 0, 1], [0, 1, 1], [1, 0, 0], [0, 0, 1]], columns=["NaN", "a", "b"]
+    )
+    tm.assert_frame_equal(result, expected)
@@ -622,6 +622,17 @@ def test_partition_to_dataframe_from_series(any_string_dtype, method, exp):
     tm.assert_frame_equal(result, expected)
 
 
+@pytest.mark.parametrize("method", ["split", "rsplit", "partition", "rpartition"])
+def test_expand_categorical(method):
+    # expanded rows are computed once per category and taken by code
+    values = ["a b c", np.nan, "d e", "a b c"]
+    ser = Series(values, dtype=pd.CategoricalDtype(["a b c", "d e", "f"]))
+    result = getattr(ser.str, method)(" ", expand=True)
+    expected = getattr(Series(values).str, method)(" ", expand=True)
+    expected.iloc[1] = np.nan
+    tm.assert_frame_equal(result, expected)
+
+
 def test_partition_with_name(any_string_dtype):
     # GH 12617
 
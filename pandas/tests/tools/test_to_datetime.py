@@ -28,6 +28,7 @@ from pandas.errors import (
 )
 import pandas.util._test_decorators as td
 
+from pandas.core.dtypes.cast import construct_1d_object_array_from_listlike
 from pandas.core.dtypes.common import is_datetime64_ns_dtype
 
 import pandas as pd
@@ -3353,6 +3354,43 @@ class TestShouldCache:
         # GH#29403
         assert tools.should_cache(listlike) is True
 
+    def test_should_cache_late_repetition(self):
+        # the repeated values appear after the first elements
+        unique = [f"2020-01-01 00:00:{i % 60:02d}.{i:06d}" for i in range(5000)]
+        repeated = ["2021-01-01", "2021-01-02"] * 5000
+        assert tools.should_cache(np.array(unique + repeated, dtype=object))
+        assert not tools.should_cache(np.array(repeated[:500] + unique, dtype=object))
+
+    def test_should_cache_check_count_spread(self):
+        # elements are checked along the whole sequence
+        listlike = list(range(50)) + [1] * 50
+        assert tools.should_cache(listlike, check_count=10, unique_share=0.7)
+
+    @pytest.mark.parametrize("value", [[2020, 1, 1], {"a": 1}])
+    def test_should_cache_unhashable(self, value):
+        listlike = [value] * (start_caching_at + 10)
+        assert not tools.should_cache(listlike)
+        assert not tools.should_cache(np.array(listlike + [None], dtype=object)[:-1])
+
+        msg = "arg must be a string|is not convertible to datetime"
+        with pytest.raises(TypeError, match=msg):
+            to_datetime(listlike)
+
+    def test_should_cache_samples_list(self, monkeypatch):
+        # long lists are sampled instead of being converted as a whole
+        monkeypatch.setattr(tools, "cache_sample_size", 100)
+        sizes = []
+
+        def construct(values):
+            sizes.append(len(values))
+            return construct_1d_object_array_from_listlike(values)
+
+        monkeypatch.setattr(tools, "construct_1d_object_array_from_listlike", construct)
+        listlike = [f"2020-01-{i % 28 + 1:02d}" for i in range(1000)]
+        assert tools.should_cache(listlike)
+        assert not tools.should_cache([str(i) for i in range(1000)])
+        assert sizes == [100, 100]
+
 
 def test_nullable_integer_to_datetime():
     # Test for #30050
@@ -3483,6 +3521,52 @@ def test_to_datetime_mixed_other():
     tm.assert_index_equal(result, expected)
 
 
+@pytest.mark.parametrize("dayfirst", [True, False])
+@pytest.mark.parametrize("errors", ["raise", "coerce"])
+def test_to_datetime_mixed_by_shape(dayfirst, errors, monkeypatch):
+    # strings sharing a shape are parsed with one guessed format, the result
+    #  matches parsing each string individually
+    values = [
+        "13/01/2000",
+        "01/02/2000",
+        "02/13/2000",
+        "05/06/2000",
+        "07/08/2000",
+        "12 January 2000 10:00",
+        "13 March 2001 11:30",
+        "01 May 2002 23:59",
+        "30 June 2003 00:00",
+        "01/11/2000 10:34 PM",
+        "01/12/2000 10:34 AM",
+        "01/13/2000 01:34 PM",
+        "12/14/2000 03:34 AM",
+        "2000-01-02T10:00:00.5",
+        "2000-01-13T10:00:00.25",
+        "2000-02-03T10:00:00.125",
+        "2000-03-04T10:00:00.750",
+        "2000-12-05",
+        None,
+        np.nan,
+        "NaT",
+    ]
+    result = to_datetime(values, format="mixed", dayfirst=dayfirst, errors=errors)
+    monkeypatch.setattr(tools, "_MIN_SHAPE_COUNT", len(values) + 1)
+    expected = to_datetime(values, format="mixed", dayfirst=dayfirst, errors=errors)
+    tm.assert_index_equal(result, expected)
+
+
+def test_to_datetime_mixed_by_shape_tz():
+    # falls back to parsing each string when the outliers are tz-aware
+    values = ["01/02/2000"] * 4 + ["2000-01-01 10:00:00+01:00"]
+    with pytest.raises(ValueError, match="Mixed timezones detected"):
+        to_datetime(values, format="mixed")
+    result = to_datetime(values, format="mixed", utc=True)
+    expected = DatetimeIndex(
+        ["2000-01-02"] * 4 + ["2000-01-01 09:00:00"], dtype="M8[s, UTC]"
+    )
+    tm.assert_index_equal(result, expected)
+
+
 @pytest.mark.parametrize("exact", [True, False])
 @pytest.mark.parametrize("format", ["ISO8601", "mixed"])
 def test_to_datetime_mixed_or_iso_exact(exact, format):
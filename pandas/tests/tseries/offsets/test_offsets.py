@@ -511,14 +511,8 @@ class TestCommon:
         if not isinstance(
             offset_s,
             (
-                Easter,
-                WeekOfMonth,
-                LastWeekOfMonth,
-                CustomBusinessDay,
                 BusinessHour,
                 CustomBusinessHour,
-                CustomBusinessMonthBegin,
-                CustomBusinessMonthEnd,
                 FY5253,
                 FY5253Quarter,
             ),
@@ -601,6 +595,32 @@ class TestCommon:
 
         tm.assert_index_equal(result, expected)
 
+    @pytest.mark.parametrize(
+        "off",
+        [
+            CustomBusinessDay(holidays=["2016-01-18", "2016-02-15"]),
+            CustomBusinessDay(-3, weekmask="Mon Wed Fri", offset=timedelta(hours=2)),
+            CustomBusinessMonthEnd(2, holidays=["2016-03-31"]),
+            CustomBusinessMonthBegin(-1, weekmask="Tue Thu"),
+            WeekOfMonth(week=2, weekday=4),
+            WeekOfMonth(-2, week=0, weekday=0),
+            LastWeekOfMonth(weekday=6),
+            LastWeekOfMonth(-3, weekday=2),
+            Easter(),
+            Easter(-2),
+        ],
+    )
+    @pytest.mark.parametrize("tz", [None, "US/Eastern"])
+    def test_add_dt64_vectorized(self, off, tz):
+        # these offsets have an array implementation that matches the scalar one
+        dti = date_range("2015-12-20", periods=300, freq="7h", tz=tz, unit="s")
+        dti = dti.insert(5, NaT)
+
+        with tm.assert_produces_warning(None):
+            result = dti + off
+        expected = DatetimeIndex([x + off for x in dti], dtype=dti.dtype)
+        tm.assert_index_equal(result, expected)
+
 
 class TestDateOffset:
     def setup_method(self):
@@ -108,3 +108,35 @@ class TestArrayStrptimeResolutionInference:
         fmt2 = "%b %d, %Y"
         res2, _ = array_strptime(vals2, fmt=fmt2, creso=creso_infer)
         tm.assert_numpy_array_equal(res2, expected2)
+
+
+class TestArrayStrptimeThreaded:
+    @pytest.mark.parametrize(
+        "fmt, values",
+        [
+            ("ISO8601", ["2016-01-02", "2016-01-02T03:04:05", "NaT", ""]),
+            ("ISO8601", ["2016-01-02T03:04:05", "2016-01-02T03:04:05.123456789"]),
+            ("%Y-%m-%d %H:%M:%S", ["2016-01-02 03:04:05", "nan"]),
+            ("%Y-%m-%d", ["2016-01-02", "2016-01-0"]),
+            ("ISO8601", ["2016-01-02T03:04:05+01:00", "2016-01-02"]),
+            ("ISO8601", ["2016-01-02", NaT, np.nan]),
+            ("ISO8601", ["2016-01-02T03:04:05.123456789", "2300-01-01"]),
+        ],
+    )
+    @pytest.mark.parametrize("errors", ["raise", "coerce"])
+    def test_array_strptime_nthreads(self, fmt, values, errors):
+        # values that are not parsed by the threads fall back to the serial path
+        arr = np.array(values * 20_000, dtype=object)
+        try:
+            expected, expected_tz = array_strptime(
+                arr, fmt, errors=errors, creso=creso_infer
+            )
+        except ValueError as err:
+            with pytest.raises(type(err), match=str(err)):
+                array_strptime(arr, fmt, errors=errors, creso=creso_infer, nthreads=4)
+        else:
+            res, res_tz = array_strptime(
+                arr, fmt, errors=errors, creso=creso_infer, nthreads=4
+            )
+            tm.assert_numpy_array_equal(res, expected)
+            assert res_tz == expected_tz
@@ -1,9 +1,14 @@
+from datetime import timedelta
 import zoneinfo
 
 import numpy as np
 import pytest
 
+from pandas._libs.tslibs.dtypes import NpyDatetimeUnit
 from pandas._libs.tslibs.tzconversion import tz_localize_to_utc
+from pandas._libs.tslibs.vectorized import tz_convert_from_utc
+
+import pandas._testing as tm
 
 
 class TestTZLocalizeToUTC:
@@ -24,3 +29,76 @@ class TestTZLocalizeToUTC:
         msg = "There are 2 dst switches when there should only be 1"
         with pytest.raises(ValueError, match=msg):
             tz_localize_to_utc(vals, zoneinfo.ZoneInfo("US/Eastern"), ambiguous="infer")
+
+
+@pytest.fixture(
+    params=["US/Eastern", "Europe/London", "Africa/Ceuta", "America/Inuvik"]
+)
+def zoneinfo_tz(request):
+    return zoneinfo.ZoneInfo(request.param)
+
+
+def _hourly_stamps(start, end):
+    # hours around the transitions, with minutes to hit non-existent times
+    stamps = np.arange(
+        np.datetime64(start, "ns"), np.datetime64(end, "ns"), np.timedelta64(1, "h")
+    )
+    return (stamps + np.timedelta64(37, "m")).view("i8")
+
+
+def _elementwise(func, vals, **kwargs):
+    # arrays of a few values use the tzinfo API of ZoneInfo
+    return np.concatenate([func(vals[i : i + 1], **kwargs) for i in range(len(vals))])
+
+
+class TestZoneInfoTransitions:
+    def test_tz_convert_from_utc(self, zoneinfo_tz):
+        vals = _hourly_stamps("2030-03-01", "2030-04-15")
+        vals[3] = np.iinfo(np.int64).min
+        result = tz_convert_from_utc(vals, zoneinfo_tz)
+        expected = _elementwise(tz_convert_from_utc, vals, tz=zoneinfo_tz)
+        tm.assert_numpy_array_equal(result, expected)
+
+    @pytest.mark.parametrize(
+        "nonexistent",
+        ["NaT", "shift_forward", "shift_backward", timedelta(hours=-1)],
+    )
+    @pytest.mark.parametrize("ambiguous", ["NaT", True, False])
+    def test_tz_localize_to_utc(self, zoneinfo_tz, ambiguous, nonexistent):
+        vals = np.concatenate(
+            [
+                _hourly_stamps("2030-03-20", "2030-04-01"),
+                _hourly_stamps("2030-10-20", "2030-11-06"),
+            ]
+        )
+        kwargs = {"tz": zoneinfo_tz, "ambiguous": ambiguous}
+        result = tz_localize_to_utc(vals, nonexistent=nonexistent, **kwargs)
+        expected = _elementwise(
+            tz_localize_to_utc, vals, nonexistent=nonexistent, **kwargs
+        )
+        tm.assert_numpy_array_equal(result, expected)
+
+    def test_tz_localize_to_utc_ambiguous_infer_years(self):
+        tz = zoneinfo.ZoneInfo("US/Eastern")
+        utc = np.arange(
+            np.datetime64("2010-01-01", "ns"),
+            np.datetime64("2014-01-01", "ns"),
+            np.timedelta64(30, "m"),
+        ).view("i8")
+        local = tz_convert_from_utc(utc, tz)
+        result = tz_localize_to_utc(local, tz, ambiguous="infer")
+        tm.assert_numpy_array_equal(result, utc)
+
+        # the repeated hour is dropped in the third year
+        switch = np.nonzero(local[1:] <= local[:-1])[0][2]
+        local = np.delete(local, [switch + 1, switch + 2])
+        with pytest.raises(ValueError, match="2012-11-04 01:00:00"):
+            tz_localize_to_utc(local, tz, ambiguous="infer")
+
+    def test_tz_convert_from_utc_before_first_transition_non_nano(self):
+        # values before the first transition in a coarser unit than the table
+        tz = zoneinfo.ZoneInfo("US/Eastern")
+        vals = np.array(["0999-12-29", "2016-03-12"] * 100, dtype="M8[s]").view("i8")
+        result = tz_convert_from_utc(vals, tz, reso=NpyDatetimeUnit.NPY_FR_s.value)
+        expected = vals + np.array([-17762, -18000] * 100)
+        tm.assert_numpy_array_equal(result, expected)